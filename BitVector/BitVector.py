@@ -8,40 +8,340 @@ from __future__ import annotations
 __version__ = "0.0.4"
 
 import array
-import binascii
+import bisect
 import copy
+import io
 import itertools
+import mmap
 import operator
+import os
 import secrets
 from typing import Any, BinaryIO, Iterator, Self, Sequence
 
-_hexdict = {
-    "0": "0000",
-    "1": "0001",
-    "2": "0010",
-    "3": "0011",
-    "4": "0100",
-    "5": "0101",
-    "6": "0110",
-    "7": "0111",
-    "8": "1000",
-    "9": "1001",
-    "a": "1010",
-    "b": "1011",
-    "c": "1100",
-    "d": "1101",
-    "e": "1110",
-    "f": "1111",
-}
-
 # The internal storage type for the `array` standard library module.
 # "Q" represents an unsigned long long integer (typically 64 bits),
 # which is used for compact bitwise storage.
 ARRAY_TYPE = "Q"
 
+# Number of bytes processed per pass when copying or converting large buffers.
+_CHUNK_BYTES = 1 << 20
+
 # Lookup table for 8-bit bit-reversal used in word/byte integer conversion.
 _BIT_REV_8 = bytes(sum(((b >> i) & 1) << (7 - i) for i in range(8)) for b in range(256))
 
+# Layout of the rank/select directory: a 16-bit count per block of 512 bits
+# (8 words) relative to its superblock, and a 64-bit cumulative count per
+# superblock of 4096 bits. Together they cost 4.7% of the vector's size.
+_RANK_BLOCK_SHIFT = 9
+_RANK_SUPER_SHIFT = 12
+
+# Number of words examined per step when scanning for the next or previous
+# set or clear bit, so long runs of zero or all-ones words are skipped in bulk.
+_SCAN_WORDS = 64
+
+# Number of candidate start positions matched per step by the substring search,
+# and the longest pattern prefix matched bit-parallel before candidates are
+# verified one at a time.
+_FIND_WINDOW_BITS = 1 << 16
+_FIND_PREFIX_BITS = 64
+
+# Slices with a step of at least this many bits read and write the selected
+# bits one at a time; shorter steps go through a text rendering of the span
+# the slice covers.
+_SPARSE_STEP_BITS = 64
+
+# A PermutationPlan moves the bits that share one displacement with a single
+# mask and shift; past this many distinct displacements per 64 output bits, or
+# past _PLAN_MAX_SHIFTS in all, it gathers the bits through a text lookup
+# instead. Each step costs a pass over the whole vector, so the total is capped.
+_PLAN_SHIFTS_PER_WORD = 16
+_PLAN_MAX_SHIFTS = 16
+
+# Carry-less products read the shorter factor 32 bits per shift once it has
+# this many bits, and split by Karatsuba once it has more than
+# _CLMUL_KARATSUBA_BITS bits. The 32-bit steps are summed _CLMUL_CHUNK_DIGITS
+# hex digits (a multiple of 8) at a time.
+_CLMUL_WIDE_WINDOW_BITS = 1024
+_CLMUL_KARATSUBA_BITS = 16384
+_CLMUL_CHUNK_DIGITS = 256
+
+# Maps the ASCII hex digits produced by format(value, "x") to their values.
+_HEX_DIGIT_VALUES = bytes.maketrans(b"0123456789abcdef", bytes(range(16)))
+
+# GF2n fields up to this degree precompute log, antilog and inverse tables.
+_GF_TABLE_MAX_BITS = 16
+
+# Text form of each storage byte: entry b holds the 8 characters '0'/'1' for
+# bits 0 to 7 of b, least significant bit first, matching the vector order.
+_BYTE_TO_BITS = tuple("".join(str((b >> i) & 1) for i in range(8)) for b in range(256))
+
+# Flag form of each storage byte: entry b holds the 8 bytes 0/1 for bits 0 to
+# 7 of b, so itertools.compress can pick out the positions of the set bits.
+_BYTE_TO_FLAGS = tuple(bytes((b >> i) & 1 for i in range(8)) for b in range(256))
+
+# mmap access mode for each MappedBitVector.open() mode.
+_MMAP_ACCESS = {
+    "r": mmap.ACCESS_READ,
+    "r+": mmap.ACCESS_WRITE,
+    "w+": mmap.ACCESS_WRITE,
+    "c": mmap.ACCESS_COPY,
+}
+
+# Translation table mapping the byte values 0 and 1 to the ASCII digits '0' and '1'.
+_BIT_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _words_from_int(value: int, nbits: int) -> array.array[int]:
+    """Packs an integer whose bit i is vector bit i into storage words.
+
+    Args:
+        value: A non-negative integer holding the bits in little-endian order.
+        nbits: The number of bits the resulting storage must hold.
+
+    Returns:
+        A new array of 64-bit words.
+    """
+    words = array.array(ARRAY_TYPE)
+    words.frombytes(value.to_bytes(((nbits + 63) // 64) * 8, "little"))
+    return words
+
+
+def _words_from_bytes(data: bytes) -> array.array[int]:
+    """Packs MSB-first bytes into storage words, one whole word at a time.
+
+    Args:
+        data: Bytes whose first bit (the MSB of data[0]) becomes bit 0.
+
+    Returns:
+        A new array of 64-bit words holding 8 * len(data) bits.
+    """
+    words = array.array(ARRAY_TYPE)
+    words.frombytes(data.translate(_BIT_REV_8) + bytes(-len(data) % 8))
+    return words
+
+
+def _words_from_bits(bits: str | bytes) -> array.array[int]:
+    """Packs a string of ASCII '0'/'1' characters into storage words.
+
+    Args:
+        bits: The binary digits, leftmost digit first.
+
+    Returns:
+        A new array of 64-bit words holding len(bits) bits.
+
+    Raises:
+        ValueError: If bits contains anything other than '0' and '1'.
+    """
+    return _words_from_int(_int_from_bits(bits), len(bits))
+
+
+def _int_from_bits(bits: str | bytes) -> int:
+    """Converts ASCII '0'/'1' characters to an integer whose bit k is bits[k].
+
+    Args:
+        bits: The binary digits, leftmost digit first.
+
+    Returns:
+        The bits as a non-negative integer, least significant bit first.
+
+    Raises:
+        ValueError: If bits contains anything other than '0' and '1'.
+    """
+    if not bits:
+        return 0
+    zero, one = ("0", "1") if isinstance(bits, str) else (b"0", b"1")
+    if bits.count(zero) + bits.count(one) != len(bits):
+        raise ValueError("incorrect value for a bit")
+    return int(bits[::-1], 2)
+
+
+def _check_bit_order(bit_order: str) -> None:
+    """Validates a bit_order argument.
+
+    Args:
+        bit_order: The bit order name passed by the caller.
+
+    Raises:
+        ValueError: If bit_order is not "msb" or "lsb".
+    """
+    if bit_order not in ("msb", "lsb"):
+        raise ValueError("bit_order must be 'msb' or 'lsb'")
+
+
+def _bit_reverse_into(dst: memoryview, src: memoryview, nbytes: int) -> None:
+    """Copies bytes while reversing the bit order of each, one chunk at a time.
+
+    Args:
+        dst: The writable byte view receiving the reversed bytes.
+        src: The byte view to read from; it may be dst itself.
+        nbytes: The number of leading bytes to convert.
+    """
+    for start in range(0, nbytes, _CHUNK_BYTES):
+        stop = min(start + _CHUNK_BYTES, nbytes)
+        dst[start:stop] = src[start:stop].tobytes().translate(_BIT_REV_8)
+
+
+def _select_in_word(word: int, k: int) -> int:
+    """Finds the position of the set bit of rank k within a 64-bit word.
+
+    Args:
+        word: A word holding more than k set bits.
+        k: The zero-based rank of the wanted set bit.
+
+    Returns:
+        The bit position, counted from the least significant bit.
+    """
+    pos = 0
+    for width in (32, 16, 8, 4, 2, 1):
+        low = word & ((1 << width) - 1)
+        count = low.bit_count()
+        if k >= count:
+            k -= count
+            word >>= width
+            pos += width
+        else:
+            word = low
+    return pos
+
+
+def _slice_case(pos: slice) -> int:
+    """Classifies slice bounds by sign for slice-assignment error messages.
+
+    Args:
+        pos: A slice object.
+
+    Returns:
+        A case number from 1 to 7 identifying which bounds are missing or
+        negative. The full slice [:] counts as case 7, like two explicit
+        bounds.
+    """
+    if pos.start is None and pos.stop is None:
+        return 7
+    if pos.start is None:
+        return 1 if pos.stop >= 0 else 2
+    if pos.stop is None:
+        return 3 if pos.start >= 0 else 4
+    if pos.stop < 0 <= pos.start:
+        return 5
+    if pos.start < 0 <= pos.stop:
+        return 6
+    return 7
+
+
+def _clmul_table(a: int) -> list[int]:
+    """Lists the carry-less multiples of a by every polynomial of degree below 4.
+
+    Args:
+        a: The polynomial, with bit k the coefficient of x^k.
+
+    Returns:
+        The 16-entry list whose entry w is a times w in GF(2).
+    """
+    a2, a4, a8 = a << 1, a << 2, a << 3
+    a3 = a2 ^ a
+    table = [0, a, a2, a3, a4, a4 ^ a, a4 ^ a2, a4 ^ a3]
+    return table + [a8 ^ t for t in table]
+
+
+def _clmul_window(a: int, b: int) -> int:
+    """Multiplies two GF(2) polynomials with tables of the multiples of a.
+
+    A table holds a times every polynomial of degree below 4, so each 4-bit
+    window of b costs one lookup and one XOR. Short factors take a shift per
+    window. Longer ones are read 32 bits at a time through eight tables, for
+    a shifted up by 0, 4, ..., 28 bits, so only one shift is needed per
+    eight windows; they are summed a chunk of b at a time so the partial
+    products being shifted stay close to the length of a.
+
+    Args:
+        a: The first polynomial, with bit k the coefficient of x^k.
+        b: The second polynomial, at most as long as a.
+
+    Returns:
+        The carry-less product of a and b.
+    """
+    r = 0
+    if b.bit_length() < _CLMUL_WIDE_WINDOW_BITS:
+        table = _clmul_table(a)
+        for d in b.to_bytes((b.bit_length() + 7) >> 3, "big"):
+            r = (((r << 4) ^ table[d >> 4]) << 4) ^ table[d & 15]
+        return r
+    t7, t6, t5, t4, t3, t2, t1, t0 = [_clmul_table(a << k) for k in range(28, -1, -4)]
+    width = -(-b.bit_length() // 32) * 8
+    digits = format(b, f"0{width}x").encode("ascii").translate(_HEX_DIGIT_VALUES)
+    for start in range(0, width, _CLMUL_CHUNK_DIGITS):
+        chunk = digits[start : start + _CLMUL_CHUNK_DIGITS]
+        part = 0
+        for n7, n6, n5, n4, n3, n2, n1, n0 in zip(*(chunk[i::8] for i in range(8))):
+            part = (part << 32) ^ t7[n7] ^ t6[n6] ^ t5[n5] ^ t4[n4]
+            part ^= t3[n3] ^ t2[n2] ^ t1[n1] ^ t0[n0]
+        r = (r << (len(chunk) << 2)) ^ part
+    return r
+
+
+def _clmul(a: int, b: int) -> int:
+    """Multiplies two GF(2) polynomials held as integers (carry-less multiply).
+
+    Short factors go through _clmul_window. Longer ones are split in half and
+    combined with Karatsuba's three half-size products, where the middle term
+    needs no subtraction because addition in GF(2) is XOR.
+
+    Args:
+        a: The first polynomial, with bit k the coefficient of x^k.
+        b: The second polynomial.
+
+    Returns:
+        The carry-less product of a and b.
+    """
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    if b.bit_length() <= _CLMUL_KARATSUBA_BITS:
+        return _clmul_window(a, b)
+    h = a.bit_length() >> 1
+    mask = (1 << h) - 1
+    a0, a1, b0, b1 = a & mask, a >> h, b & mask, b >> h
+    z0 = _clmul(a0, b0)
+    z2 = _clmul(a1, b1)
+    z1 = _clmul(a0 ^ a1, b0 ^ b1) ^ z0 ^ z2
+    return (z2 << (2 * h)) ^ (z1 << h) ^ z0
+
+
+def _cldivmod(a: int, b: int) -> tuple[int, int]:
+    """Divides two GF(2) polynomials held as integers.
+
+    Args:
+        a: The dividend, with bit k the coefficient of x^k.
+        b: The nonzero divisor.
+
+    Returns:
+        The quotient and the remainder, whose degree is below that of b.
+    """
+    q = 0
+    nb = b.bit_length()
+    while (shift := a.bit_length() - nb) >= 0:
+        q ^= 1 << shift
+        a ^= b << shift
+    return q, a
+
+
+def _clxgcd(a: int, b: int) -> tuple[int, int]:
+    """Runs the extended Euclidean algorithm on two GF(2) polynomials.
+
+    Args:
+        a: The polynomial to invert, held as an integer.
+        b: The nonzero modulus.
+
+    Returns:
+        The greatest common divisor g of a and b, and a cofactor s with
+        s * a congruent to g modulo b.
+    """
+    g1, g2 = 1, 0
+    while b:
+        q, r = _cldivmod(a, b)
+        a, b = b, r
+        g1, g2 = g2, g1 ^ _clmul(q, g2)
+    return a, g1
+
 
 class BitVector:
     """A memory-efficient packed representation of bit arrays and bit vectors.
@@ -53,7 +353,9 @@ class BitVector:
         vector: Underlying array storing packed integer words.
     """
 
-    __slots__ = ("_size", "vector")
+    __slots__ = ("_exports", "_rank_index", "_size", "vector")
+    _exports: int
+    _rank_index: tuple[array.array[int], array.array[int], int] | None
     _size: int
     vector: array.array[int]
 
@@ -76,7 +378,8 @@ class BitVector:
         Args:
             size: The desired number of bits for a zero-initialized vector (or
                 used in conjunction with intVal).
-            intVal: An integer value to convert into a bit vector.
+            intVal: An integer value to convert into a bit vector. A negative
+                value is stored in two's complement and requires size.
             bitlist: A sequence or list of integers (0s and 1s) representing bits.
             bitstring: A string of binary characters ('0's and '1's).
             hexstring: A string of hexadecimal characters to convert to bits.
@@ -86,6 +389,8 @@ class BitVector:
             ValueError: If no argument is provided, if mutually exclusive
                 arguments are specified together, or if input values are invalid.
         """
+        self._exports = 0
+        self._rank_index = None
         self._size = 0
         if intVal is not None:
             if (
@@ -99,56 +404,31 @@ class BitVector:
                     "value to the 'size' constructor arg"
                 )
             if intVal == 0:
-                bitlist = [0]
+                value, min_size = 0, 1
+            else:
+                value = operator.index(intVal)
+                min_size = value.bit_length()
+            if value < 0:
                 if size is None:
-                    self._size = 1
-                elif size == 0:
                     raise ValueError(
-                        "The value specified for size must be at least "
-                        "as large as for the smallest bit vector possible "
-                        "for intVal"
+                        "A negative intVal needs a size giving the width of "
+                        "its two's-complement form"
                     )
-                else:
-                    if size < len(bitlist):
-                        raise ValueError(
-                            "The value specified for size must be at least "
-                            "as large as for the smallest bit vector "
-                            "possible for intVal"
-                        )
-                    n = size - len(bitlist)
-                    bitlist = [0] * n + bitlist
-                    self._size = len(bitlist)
-            else:
-                hexVal = hex(intVal).lower().rstrip("l")
-                hexVal = hexVal[2:]
-                if len(hexVal) == 1:
-                    hexVal = "0" + hexVal
-                bitlist = [int(b) for h in hexVal for b in _hexdict[h]]
-                i = 0
-                while i < len(bitlist):
-                    if bitlist[i] == 1:
-                        break
-                    i += 1
-                del bitlist[0:i]
-                if size is None:
-                    self._size = len(bitlist)
-                elif size == 0:
-                    if size < len(bitlist):
-                        raise ValueError(
-                            "The value specified for size must be at least "
-                            "as large as for the smallest bit vector possible "
-                            "for intVal"
-                        )
-                else:
-                    if size < len(bitlist):
-                        raise ValueError(
-                            "The value specified for size must be at least "
-                            "as large as for the smallest bit vector possible "
-                            "for intVal"
-                        )
-                    n = size - len(bitlist)
-                    bitlist = [0] * n + bitlist
-                    self._size = len(bitlist)
+                min_size = (~value).bit_length() + 1
+            if size is None:
+                size = min_size
+            elif size < min_size:
+                raise ValueError(
+                    "The value specified for size must be at least "
+                    "as large as for the smallest bit vector possible "
+                    "for intVal"
+                )
+            value &= (1 << size) - 1
+            self.vector = _words_from_bytes(
+                (value << (-size % 8)).to_bytes((size + 7) // 8, "big")
+            )
+            self._size = size
+            return
         elif size is not None and size >= 0:
             if (
                 intVal is not None
@@ -177,8 +457,9 @@ class BitVector:
                     "When a bitstring is specified, you cannot give "
                     "values to any other constructor args"
                 )
-            bitlist = list(map(int, list(bitstring)))
-            self._size = len(bitlist)
+            self.vector = _words_from_bits(bitstring)
+            self._size = len(bitstring)
+            return
         elif bitlist is not None:
             if (
                 size is not None
@@ -191,7 +472,10 @@ class BitVector:
                     "When bits are specified, you cannot give values "
                     "to any other constructor args"
                 )
-            self._size = len(bitlist)
+            bits = bitlist if isinstance(bitlist, bytes) else bytes(iter(bitlist))
+            self.vector = _words_from_bits(bits.translate(_BIT_TO_ASCII))
+            self._size = len(bits)
+            return
         elif hexstring is not None:
             if (
                 size is not None
@@ -204,8 +488,13 @@ class BitVector:
                     "When bits are specified through hexstring, you "
                     "cannot give values to any other constructor args"
                 )
-            bitlist = [int(b) for h in hexstring.lower() for b in _hexdict[h]]
-            self._size = len(bitlist)
+            padded = hexstring + "0" * (len(hexstring) % 2)
+            data = bytes.fromhex(padded)
+            if 2 * len(data) != len(padded):
+                raise ValueError("invalid character in hexstring")
+            self.vector = _words_from_bytes(data)
+            self._size = 4 * len(hexstring)
+            return
         elif rawbytes is not None:
             if (
                 size is not None
@@ -218,15 +507,12 @@ class BitVector:
                     "When bits are specified through rawbytes, you "
                     "cannot give values to any other constructor args"
                 )
-            hex_str = binascii.hexlify(rawbytes).decode("ascii")
-            bitlist = [int(b) for h in hex_str for b in _hexdict[h]]
-            self._size = len(bitlist)
+            data = bytes(rawbytes)
+            self.vector = _words_from_bytes(data)
+            self._size = 8 * len(data)
+            return
         else:
             raise ValueError("wrong arg(s) for constructor")
-        eight_byte_ints_needed = (len(bitlist) + 63) // 64
-        self.vector = array.array(ARRAY_TYPE, [0] * eight_byte_ints_needed)
-        for idx, bit in enumerate(bitlist):
-            self[idx] = bit
 
     @classmethod
     def from_string(cls, textstring: str) -> "BitVector":
@@ -237,13 +523,247 @@ class BitVector:
 
         Returns:
             A new BitVector initialized with the bit representation of the string.
+
+        Raises:
+            UnicodeEncodeError: If textstring holds a character above U+00FF.
+        """
+        return cls(rawbytes=textstring.encode("latin-1"))
+
+    @classmethod
+    def frombuffer(
+        cls,
+        buf: Any,
+        nbits: int | None = None,
+        bit_order: str = "msb",
+        *,
+        share: bool = False,
+    ) -> Self:
+        """Creates a BitVector from any object supporting the buffer protocol.
+
+        Accepts bytes, bytearray, mmap, array, memoryview and similar objects.
+        By default the buffer contents are copied once into new storage. With
+        share=True the buffer itself becomes the storage, so loading takes
+        constant time and bit assignments write through to the buffer.
+        Operations that change the vector's length work on a private copy.
+
+        Args:
+            buf: The buffer-protocol object holding the packed bits.
+            nbits: The number of bits to take from the buffer. Defaults to all
+                bits in the buffer.
+            bit_order: "msb" if bit 0 is the most significant bit of the first
+                byte (the layout of rawbytes and write_to_file), or "lsb" if
+                bit 0 is the least significant bit (the native word layout).
+            share: If True, share the buffer's memory instead of copying it.
+                Requires bit_order="lsb" and a whole number of 64-bit words.
+
+        Returns:
+            A new BitVector instance holding the buffer's bits.
+
+        Raises:
+            ValueError: If bit_order is unknown, if nbits exceeds the buffer,
+                or if the buffer cannot be shared.
+        """
+        _check_bit_order(bit_order)
+        # Validate before holding a view, so a failed call leaves buf free to
+        # be resized or closed.
+        with memoryview(buf) as probe:
+            available = probe.nbytes
+        if nbits is None:
+            nbits = 8 * available
+        elif not 0 <= nbits <= 8 * available:
+            raise ValueError("nbits exceeds the size of the buffer")
+        if share and bit_order != "lsb":
+            raise ValueError("sharing a buffer requires bit_order='lsb'")
+        if share and available % 8:
+            raise ValueError("a shared buffer must hold a whole number of 64-bit words")
+        view = memoryview(buf)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        new_bv = cls(size=0)
+        new_bv._size = nbits
+        if share:
+            # Only the words holding the nbits bits are taken, so the words
+            # of the buffer past them are never read or written.
+            nwords = (nbits + 63) >> 6
+            if (
+                isinstance(buf, array.array)
+                and buf.typecode == ARRAY_TYPE
+                and len(buf) == nwords
+            ):
+                new_bv.vector = buf
+            else:
+                new_bv.vector = view.cast(ARRAY_TYPE)[:nwords]
+            return new_bv
+        nbytes = (nbits + 7) // 8
+        words = array.array(ARRAY_TYPE, [0]) * ((nbits + 63) // 64)
+        with view, memoryview(words) as out, out.cast("B") as dst:
+            if bit_order == "lsb":
+                dst[:nbytes] = view[:nbytes]
+            else:
+                _bit_reverse_into(dst, view, nbytes)
+        if nbits & 63:
+            words[-1] &= (1 << (nbits & 63)) - 1
+        new_bv.vector = words
+        return new_bv
+
+    @classmethod
+    def fromfile(
+        cls,
+        fp: BinaryIO | Any,
+        nbits: int | None = None,
+        offset: int = 0,
+        bit_order: str = "msb",
+    ) -> Self:
+        """Creates a BitVector from bytes read from a binary file.
+
+        The bytes are read with readinto() straight into the new storage and
+        use the layout of write_to_file, so the two methods round-trip.
+
+        Args:
+            fp: An open binary file or stream object supporting readinto().
+            nbits: The number of bits to read. Defaults to all remaining bytes
+                of the file.
+            offset: The number of bytes to skip from the current position
+                before reading.
+            bit_order: The byte layout of the file, as for frombuffer.
+
+        Returns:
+            A new BitVector instance holding the bits read.
+
+        Raises:
+            ValueError: If bit_order is unknown, or if nbits is negative or
+                exceeds the data in the file.
+        """
+        _check_bit_order(bit_order)
+        if offset:
+            fp.seek(offset, io.SEEK_CUR)
+        if nbits is None:
+            if not fp.seekable():
+                return cls.frombuffer(fp.read(), bit_order=bit_order)
+            here = fp.tell()
+            nbits = 8 * (fp.seek(0, io.SEEK_END) - here)
+            fp.seek(here)
+        if nbits < 0:
+            raise ValueError("nbits must be nonnegative")
+        nbytes = (nbits + 7) // 8
+        words = array.array(ARRAY_TYPE, [0]) * ((nbits + 63) // 64)
+        with memoryview(words) as out, out.cast("B") as dst:
+            got = 0
+            while got < nbytes:
+                count = fp.readinto(dst[got:nbytes])
+                if not count:
+                    raise ValueError("nbits exceeds the data in the file")
+                got += count
+            if bit_order == "msb":
+                _bit_reverse_into(dst, dst, nbytes)
+        if nbits & 63:
+            words[-1] &= (1 << (nbits & 63)) - 1
+        new_bv = cls(size=0)
+        new_bv.vector = words
+        new_bv._size = nbits
+        return new_bv
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Exports the packed storage words through the buffer protocol (PEP 688).
+
+        The view has format 'Q' and shares memory with the vector: bit i is
+        bit (i % 64) of word (i // 64). It is writable whenever the storage
+        is; use memoryview(bv).toreadonly() for a read-only view. While any
+        view is held, operations that would resize the vector raise
+        BufferError.
+
+        Args:
+            flags: The buffer request flags (see inspect.BufferFlags).
+
+        Returns:
+            A memoryview over the storage words.
+        """
+        view = memoryview(self.vector)
+        self._exports += 1
+        self._rank_index = None
+        return view
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        """Releases a view previously returned by __buffer__.
+
+        Args:
+            view: The memoryview returned by __buffer__.
+        """
+        self._exports -= 1
+        self._rank_index = None
+        view.release()
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Returns the slot values used by copy.copy() and pickle.
+
+        Views exported by this vector are not exports of its copies, so the
+        state records no exports; it also leaves out the rank/select
+        directory, which is rebuilt on demand. Storage shared through a
+        memoryview is recorded as a private array copy of its words.
+
+        Returns:
+            A (None, slots) state tuple for object.__reduce_ex__.
+        """
+        vector = self.vector
+        if isinstance(vector, memoryview):
+            vector = array.array(ARRAY_TYPE, vector)
+        return None, {
+            "_exports": 0,
+            "_rank_index": None,
+            "_size": self._size,
+            "vector": vector,
+        }
+
+    def _check_resizable(self) -> None:
+        """Raises BufferError if the storage is exported through __buffer__."""
+        if self._exports:
+            raise BufferError("cannot resize a BitVector that is exporting buffers")
+
+    def _set_words(self, words: array.array[int]) -> None:
+        """Replaces the storage words, writing in place where the storage is kept.
+
+        The words are written into the existing storage while buffers are
+        exported, when the storage is a shared buffer or mapping rather than
+        a private array, or when the word counts match.
+
+        Args:
+            words: The new storage words, of the same length when written in
+                place.
         """
-        hex_str = "".join(f"{ord(c):02x}" for c in textstring)
-        return cls(hexstring=hex_str)
+        self._rank_index = None
+        if (
+            self._exports
+            or not isinstance(self.vector, array.array)
+            or len(words) == len(self.vector)
+        ):
+            self._keep_tail(words)
+            self.vector[:] = words
+        else:
+            self.vector = words
+
+    def _keep_tail(self, words: array.array[int]) -> None:
+        """Copies the storage bits past the end of the vector into words.
+
+        Words about to be written over the storage in place keep these bits,
+        which may belong to a shared buffer, in the last word of the vector.
+
+        Args:
+            words: The replacement storage words.
+        """
+        rem = self._size & 63
+        if rem:
+            last = self._size >> 6
+            words[last] = (words[last] & ((1 << rem) - 1)) | (
+                self.vector[last] >> rem << rem
+            )
 
     def __getitem__(self, pos: int | slice) -> Any:
         """Retrieves the bit or slice of bits from the designated position.
 
+        Contiguous slices are extracted a word at a time. Slices with a step
+        (such as bv[::2] or bv[::-1]) follow Python's clamping rules for their
+        bounds.
+
         Args:
             pos: An integer index or slice object specifying the bit position(s)
                 to extract.
@@ -264,54 +784,214 @@ class BitVector:
             if pos < 0:
                 pos = self._size + pos
             return (self.vector[pos // 64] >> (pos & 63)) & 1
-        slicebits = []
-        i, j = pos.start, pos.stop
-        if i is None and j is None:
+        if pos.start is None and pos.stop is None and pos.step in (None, 1):
             return copy.deepcopy(self)
-        if i is None:
-            if j >= 0:
-                if j > len(self):
-                    raise ValueError("illegal slice index values")
-                for x in range(j):
-                    slicebits.append(self[x])
-                return BitVector(bitlist=slicebits)
-
-            if abs(j) > len(self):
-                raise ValueError("illegal slice index values")
-            for x in range(len(self) - abs(j)):
-                slicebits.append(self[x])
-            return BitVector(bitlist=slicebits)
-        if j is None:
-            if i >= 0:
-                if i > len(self):
-                    raise ValueError("illegal slice index values")
-                for x in range(i, len(self)):
-                    slicebits.append(self[x])
-                return BitVector(bitlist=slicebits)
-
-            if abs(i) > len(self):
-                raise ValueError("illegal slice index values")
-            for x in range(len(self) - abs(i), len(self)):
-                slicebits.append(self[x])
-            return BitVector(bitlist=slicebits)
-        if 0 <= j < i:
-            raise ValueError("illegal slice index values")
-        if i < 0 <= j < len(self) + i:
+        if pos.step not in (None, 1):
+            indices = range(*pos.indices(self._size))
+            if not indices:
+                return BitVector(size=0)
+            if abs(indices.step) >= _SPARSE_STEP_BITS:
+                words = self.vector
+                picked = bytes(
+                    0x30 | ((words[i >> 6] >> (i & 63)) & 1) for i in indices
+                )
+                return BitVector._from_int(_int_from_bits(picked), len(indices))
+            lo = min(indices[0], indices[-1])
+            hi = max(indices[0], indices[-1]) + 1
+            # Character c of the rendered span is the bit at position hi - 1 - c,
+            # so one stepped string slice yields the picked bits most significant
+            # (last picked) first.
+            span = format(self._bits_as_int(lo, hi), f"0{hi - lo}b")
+            picked = span[hi - 1 - indices[-1] :: indices.step][: len(indices)]
+            return BitVector._from_int(int(picked, 2), len(indices))
+        start, stop = self._slice_bounds(pos)
+        return BitVector._from_int(self._bits_as_int(start, stop), stop - start)
+
+    def _slice_bounds(self, pos: slice) -> tuple[int, int]:
+        """Normalizes the bounds of a contiguous slice of this vector.
+
+        Negative bounds count from the end of the vector and missing bounds
+        default to the ends of the vector. As before, a slice whose bounds
+        are equal, or both negative with start past stop, selects no bits
+        wherever it lies.
+
+        Args:
+            pos: A slice object whose step is None or 1.
+
+        Returns:
+            The (start, stop) bit positions with 0 <= start <= stop <= size.
+
+        Raises:
+            ValueError: If a bound lies outside the vector or start > stop.
+        """
+        if (
+            pos.start is not None
+            and pos.stop is not None
+            and (pos.start == pos.stop or pos.stop < pos.start < 0)
+        ):
+            return 0, 0
+        start = 0 if pos.start is None else pos.start
+        stop = self._size if pos.stop is None else pos.stop
+        if start < 0:
+            start += self._size
+        if stop < 0:
+            stop += self._size
+        if not 0 <= start <= stop <= self._size:
             raise ValueError("illegal slice index values")
-        if j < 0 <= i:
-            if len(self) + j < i:
-                raise ValueError("illegal slice index values")
+        return start, stop
 
-            for x in range(i, len(self) + j):
-                slicebits.append(self[x])
-            return BitVector(bitlist=slicebits)
-        if self._size == 0:
-            return BitVector(bitstring="")
-        if i == j:
-            return BitVector(bitstring="")
-        for x in range(i, j):
-            slicebits.append(self[x])
-        return BitVector(bitlist=slicebits)
+    def _bits_as_int(self, start: int, stop: int) -> int:
+        """Extracts a run of bits as an integer in a single funnel shift.
+
+        The covering words are read as one little-endian integer and shifted
+        down by the bit offset of start, so the cost is O((stop - start) / 64).
+
+        Args:
+            start: The first bit position of the run.
+            stop: The bit position one past the end of the run.
+
+        Returns:
+            An integer whose bit k is the vector bit at position start + k.
+        """
+        if start >= stop:
+            return 0
+        words = self.vector[start >> 6 : (stop + 63) >> 6]
+        value = int.from_bytes(words, "little") >> (start & 63)
+        return value & ((1 << (stop - start)) - 1)
+
+    @classmethod
+    def _from_int(cls, value: int, nbits: int) -> Self:
+        """Creates a vector from an integer whose bit k is vector bit k.
+
+        Args:
+            value: The non-negative integer holding the bits.
+            nbits: The number of bits in the new vector.
+
+        Returns:
+            A new instance of cls holding the low nbits bits of value.
+        """
+        new_bv = cls(size=0)
+        new_bv.vector = _words_from_int(value, nbits)
+        new_bv._size = nbits
+        return new_bv
+
+    @classmethod
+    def _from_value(cls, value: int, nbits: int) -> Self:
+        """Creates a vector of nbits bits holding value, most significant bit first.
+
+        Unlike BitVector(intVal=value, size=nbits), this accepts a zero value
+        with any size, including 0.
+
+        Args:
+            value: The non-negative integer, less than 2**nbits.
+            nbits: The number of bits in the new vector.
+
+        Returns:
+            A new instance of cls.
+        """
+        if not value:
+            return cls(size=nbits)
+        return cls(intVal=value, size=nbits)
+
+    def _write_bits(self, start: int, stop: int, value: int) -> None:
+        """Overwrites a run of bits with one masked read-modify-write of its words.
+
+        Args:
+            start: The first bit position of the run.
+            stop: The bit position one past the end of the run.
+            value: An integer whose bit k is written to position start + k.
+        """
+        if start >= stop:
+            return
+        self._rank_index = None
+        lo = start >> 6
+        hi = (stop + 63) >> 6
+        offset = start & 63
+        mask = ((1 << (stop - start)) - 1) << offset
+        old = int.from_bytes(self.vector[lo:hi], "little")
+        self.vector[lo:hi] = _words_from_int(
+            (old & ~mask) | (value << offset), (hi - lo) * 64
+        )
+
+    def _set_extended_slice(self, pos: slice, value: int, nbits: int | None) -> None:
+        """Assigns bits to a slice with a step other than 1.
+
+        For short steps the covered span is rendered once as ASCII digits,
+        updated with a single stepped bytearray assignment and written back a
+        word at a time. Steps of _SPARSE_STEP_BITS or more update the selected
+        bits one at a time instead.
+
+        Args:
+            pos: The slice object, with Python's clamping rules for its bounds.
+            value: The bits to assign (bit k goes to the k-th selected
+                position), or the fill bit if nbits is None.
+            nbits: The number of bits in value, or None to fill with value.
+
+        Raises:
+            ValueError: If nbits does not match the number of selected bits.
+        """
+        indices = range(*pos.indices(self._size))
+        if nbits is None:
+            bits = (b"1" if value else b"0") * len(indices)
+        elif nbits != len(indices):
+            raise ValueError("incompatible lengths for extended slice assignment")
+        else:
+            bits = format(value, f"0{nbits}b")[::-1].encode("ascii")
+        if not indices:
+            return
+        if abs(indices.step) >= _SPARSE_STEP_BITS:
+            self._rank_index = None
+            words = self.vector
+            for i, bit in zip(indices, bits):
+                if bit == 0x31:
+                    words[i >> 6] |= 1 << (i & 63)
+                else:
+                    words[i >> 6] &= ~(1 << (i & 63))
+            return
+        lo = min(indices[0], indices[-1])
+        hi = max(indices[0], indices[-1]) + 1
+        span = bytearray(
+            format(self._bits_as_int(lo, hi), f"0{hi - lo}b")[::-1], "ascii"
+        )
+        span[indices[0] - lo :: indices.step] = bits
+        self._write_bits(lo, hi, int(span[::-1], 2))
+
+    def _aligned_operands(self, other: BitVector) -> tuple[int, int, int]:
+        """Reads both operands as integers aligned on their last bits.
+
+        The shorter operand is shifted toward the higher bit positions while
+        it is read, which is the same as padding it with zeros from the left,
+        so no padded copy of either vector is built.
+
+        Args:
+            other: The second BitVector operand.
+
+        Returns:
+            A tuple (left, right, size) where left and right hold the aligned
+            bits of self and other and size is the longer of the two lengths.
+        """
+        size = max(self._size, other._size)
+        left = self._bits_as_int(0, self._size) << (size - self._size)
+        right = other._bits_as_int(0, other._size) << (size - other._size)
+        return left, right, size
+
+    def _assign_int(self, value: int, size: int) -> None:
+        """Stores the result of an in-place operation into self.vector.
+
+        Results of the same length are written over the existing bits; a
+        longer result grows the vector, which is refused while exported.
+
+        Args:
+            value: An integer whose bit k becomes vector bit k.
+            size: The number of bits in the result.
+        """
+        if size == self._size:
+            self._write_bits(0, size, value)
+            return
+        self._check_resizable()
+        self._rank_index = None
+        self.vector = _words_from_int(value, size)
+        self._size = size
 
     def __xor__(self, other: BitVector) -> Self:
         """Performs a bitwise exclusive OR (XOR) with another bit vector.
@@ -326,19 +1006,24 @@ class BitVector:
         Returns:
             A new BitVector instance containing the bitwise XOR result.
         """
-        if self._size < other._size:
-            bv1 = self._resize_pad_from_left(other._size - self._size)
-            bv2 = other
-        elif self._size > other._size:
-            bv1 = self
-            bv2 = other._resize_pad_from_left(self._size - other._size)
-        else:
-            bv1 = self
-            bv2 = other
-        res = self.__class__(size=bv1._size)
-        lpb = map(operator.__xor__, bv1.vector, bv2.vector)
-        res.vector = array.array(ARRAY_TYPE, lpb)
-        return res
+        left, right, size = self._aligned_operands(other)
+        return self._from_int(left ^ right, size)
+
+    def __ixor__(self, other: BitVector) -> Self:
+        """Performs an in-place bitwise XOR with another bit vector.
+
+        The shorter operand is padded with zero bits from the left, so self
+        grows to the length of other when other is longer.
+
+        Args:
+            other: The second BitVector operand.
+
+        Returns:
+            This BitVector instance, holding the bitwise XOR result.
+        """
+        left, right, size = self._aligned_operands(other)
+        self._assign_int(left ^ right, size)
+        return self
 
     def __and__(self, other: BitVector) -> Self:
         """Performs a bitwise AND with another bit vector.
@@ -353,19 +1038,24 @@ class BitVector:
         Returns:
             A new BitVector instance containing the bitwise AND result.
         """
-        if self._size < other._size:
-            bv1 = self._resize_pad_from_left(other._size - self._size)
-            bv2 = other
-        elif self._size > other._size:
-            bv1 = self
-            bv2 = other._resize_pad_from_left(self._size - other._size)
-        else:
-            bv1 = self
-            bv2 = other
-        res = self.__class__(size=bv1._size)
-        lpb = map(operator.__and__, bv1.vector, bv2.vector)
-        res.vector = array.array(ARRAY_TYPE, lpb)
-        return res
+        left, right, size = self._aligned_operands(other)
+        return self._from_int(left & right, size)
+
+    def __iand__(self, other: BitVector) -> Self:
+        """Performs an in-place bitwise AND with another bit vector.
+
+        The shorter operand is padded with zero bits from the left, so self
+        grows to the length of other when other is longer.
+
+        Args:
+            other: The second BitVector operand.
+
+        Returns:
+            This BitVector instance, holding the bitwise AND result.
+        """
+        left, right, size = self._aligned_operands(other)
+        self._assign_int(left & right, size)
+        return self
 
     def __or__(self, other: BitVector) -> Self:
         """Performs a bitwise inclusive OR with another bit vector.
@@ -380,19 +1070,24 @@ class BitVector:
         Returns:
             A new BitVector instance containing the bitwise OR result.
         """
-        if self._size < other._size:
-            bv1 = self._resize_pad_from_left(other._size - self._size)
-            bv2 = other
-        elif self._size > other._size:
-            bv1 = self
-            bv2 = other._resize_pad_from_left(self._size - other._size)
-        else:
-            bv1 = self
-            bv2 = other
-        res = self.__class__(size=bv1._size)
-        lpb = map(operator.__or__, bv1.vector, bv2.vector)
-        res.vector = array.array(ARRAY_TYPE, lpb)
-        return res
+        left, right, size = self._aligned_operands(other)
+        return self._from_int(left | right, size)
+
+    def __ior__(self, other: BitVector) -> Self:
+        """Performs an in-place bitwise OR with another bit vector.
+
+        The shorter operand is padded with zero bits from the left, so self
+        grows to the length of other when other is longer.
+
+        Args:
+            other: The second BitVector operand.
+
+        Returns:
+            This BitVector instance, holding the bitwise OR result.
+        """
+        left, right, size = self._aligned_operands(other)
+        self._assign_int(left | right, size)
+        return self
 
     def __invert__(self) -> Self:
         """Inverts all bits in the bit vector (bitwise NOT).
@@ -421,7 +1116,7 @@ class BitVector:
             A new BitVector instance representing the concatenated bit string.
         """
         new_bv = self.__class__(size=0)
-        if isinstance(self.vector, array.array) and isinstance(
+        if isinstance(self.vector, (array.array, memoryview)) and isinstance(
             new_bv.vector, array.array
         ):
             new_bv.vector.frombytes(self.vector.tobytes())
@@ -446,29 +1141,94 @@ class BitVector:
 
         Raises:
             TypeError: If the operand is not a BitVector instance.
+            BufferError: If the storage is exported through __buffer__.
         """
-        if not isinstance(other, type(self)):
+        if not isinstance(other, BitVector):
             raise TypeError(f"Can only join two BitVector objects, not {type(other)}")
-        # Calculate number of two-byte ints we will need to add and extend the vector.
-        eight_byte_ints_to_add = (self._size + other._size + 63) // 64 - len(
-            self.vector
-        )
-        self.vector.extend([0] * eight_byte_ints_to_add)
-        # Add the bits
-        curr_bit = self._size % 64
-        curr_eight_byte_int = self._size // 64
-        for bit in other:
-            mask = ~(1 << curr_bit) & 0xFFFFFFFFFFFFFFFF
-            self.vector[curr_eight_byte_int] = (
-                self.vector[curr_eight_byte_int] & mask
-            ) | (bit << curr_bit)
-            curr_bit += 1
-            curr_eight_byte_int += curr_bit // 64
-            curr_bit %= 64
-
-        self._size += other._size
+        self._append_bits(other._bits_as_int(0, other._size), other._size)
         return self
 
+    def _append_bits(self, value: int, nbits: int) -> None:
+        """Appends bits given as an integer with one word-aligned block copy.
+
+        The partial last word is merged with the new bits and everything from
+        that word on is rewritten by one slice assignment, so appending costs
+        O(nbits / 64). The storage array over-allocates geometrically as it
+        grows, which keeps repeated small appends amortized O(1) per word.
+
+        Args:
+            value: A non-negative integer whose bit k becomes bit len(self) + k.
+            nbits: The number of bits to append.
+
+        Raises:
+            BufferError: If the storage is exported through __buffer__.
+        """
+        self._check_resizable()
+        self._rank_index = None
+        if not isinstance(self.vector, array.array):
+            self.vector = array.array(ARRAY_TYPE, self.vector)
+        lo = self._size >> 6
+        offset = self._size & 63
+        if offset:
+            value = (value << offset) | (self.vector[lo] & ((1 << offset) - 1))
+        self._size += nbits
+        self.vector[lo:] = _words_from_int(
+            value, ((self._size + 63) >> 6 << 6) - (lo << 6)
+        )
+
+    def append(self, bit: int) -> None:
+        """Appends a single bit to the end of the vector in-place.
+
+        Args:
+            bit: The bit value (0 or 1) to append.
+
+        Raises:
+            ValueError: If bit is not 0 or 1.
+            BufferError: If the storage is exported through __buffer__.
+        """
+        if bit not in (0, 1):
+            raise ValueError("incorrect value for a bit")
+        self._append_bits(int(bit), 1)
+
+    def extend(self, bits: Any) -> None:
+        """Appends a sequence of bits to the end of the vector in-place.
+
+        Args:
+            bits: A BitVector, bytes of 0/1 values, or any iterable of 0s and
+                1s.
+
+        Raises:
+            ValueError: If an element is not 0 or 1.
+            BufferError: If the storage is exported through __buffer__.
+        """
+        if isinstance(bits, BitVector):
+            self += bits
+            return
+        data = bits if isinstance(bits, bytes) else bytes(iter(bits))
+        self._append_bits(_int_from_bits(data.translate(_BIT_TO_ASCII)), len(data))
+
+    def append_int(self, value: int, nbits: int) -> None:
+        """Appends an integer as nbits bits, most significant bit first.
+
+        The bits are laid out as by BitVector(intVal=value, size=nbits); a
+        negative value is appended in two's complement.
+
+        Args:
+            value: The integer to append.
+            nbits: The number of bits to append.
+
+        Raises:
+            ValueError: If nbits is negative or value does not fit in nbits bits.
+            BufferError: If the storage is exported through __buffer__.
+        """
+        needed = (~value).bit_length() + 1 if value < 0 else value.bit_length()
+        if nbits < needed:
+            raise ValueError(f"value does not fit in {nbits} bits")
+        data = ((value & ((1 << nbits) - 1)) << (-nbits % 8)).to_bytes(
+            (nbits + 7) // 8, "big"
+        )
+        self._append_bits(int.from_bytes(data.translate(_BIT_REV_8), "little"), nbits)
+
     def __len__(self) -> int:
         """Returns the number of bits stored in the bit vector.
 
@@ -477,21 +1237,50 @@ class BitVector:
         """
         return self._size
 
-    def write_bits_to_stream_object(self, fp: Any) -> None:
+    def _bit_text_chunks(self, chunk_size: int) -> Iterator[str]:
+        """Renders the bits as '0'/'1' text, one chunk of whole words at a time.
+
+        Each storage byte is looked up in the 256-entry _BYTE_TO_BITS table,
+        so only one chunk of text is held in memory at any time.
+
+        Args:
+            chunk_size: The number of characters per chunk, rounded down to a
+                multiple of 64 (and at least 64).
+
+        Yields:
+            Consecutive pieces of the bit string.
+        """
+        v = self.vector
+        words_per_chunk = max(1, chunk_size >> 6)
+        for lo in range(0, (self._size + 63) >> 6, words_per_chunk):
+            words = v[lo : lo + words_per_chunk]
+            if not isinstance(words, (array.array, memoryview)):
+                words = array.array(ARRAY_TYPE, words)
+            text = "".join(map(_BYTE_TO_BITS.__getitem__, words.tobytes()))
+            yield text[: self._size - (lo << 6)]
+
+    def write_bits_to_stream_object(
+        self, fp: Any, chunk_size: int = _CHUNK_BYTES
+    ) -> None:
         """Writes ASCII '0' and '1' characters representing vector bits to a stream.
 
         Unlike write_to_file, which writes packed binary bytes, this method
         outputs the text characters '0' and '1', making it suitable for text
-        streams like io.StringIO.
+        streams like io.StringIO. The text is written in chunks, so memory use
+        does not grow with the size of the vector.
 
         Args:
             fp: An open text stream or file-like object supporting write().
+            chunk_size: The number of characters passed to each fp.write()
+                call, rounded down to a multiple of 64.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
         """
-        for bit_index in range(self._size):
-            if self[bit_index] == 0:
-                fp.write("0")
-            else:
-                fp.write("1")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        for text in self._bit_text_chunks(chunk_size):
+            fp.write(text)
 
     def divide_into_two(self) -> tuple[Self, Self]:
         """Splits an even-length bit vector into two equal halves.
@@ -508,12 +1297,42 @@ class BitVector:
         half = self._size // 2
         return self[:half], self[half:]
 
-    def permute(self, permute_list: Sequence[int] | Any) -> Self:
+    def _permutation_plan(
+        self, permute_list: Sequence[int] | PermutationPlan | Any
+    ) -> PermutationPlan:
+        """Returns permute_list as a compiled plan checked against this vector.
+
+        Negative indices in a raw list count from the end of the vector.
+
+        Args:
+            permute_list: A PermutationPlan or a sequence of bit indices.
+
+        Returns:
+            The PermutationPlan to apply.
+
+        Raises:
+            ValueError: If an index is out of range for this vector.
+        """
+        if not isinstance(permute_list, PermutationPlan):
+            indices = [operator.index(i) for i in permute_list]
+            if min(indices, default=0) < 0:
+                indices = [i + self._size if i < 0 else i for i in indices]
+                if min(indices) < 0:
+                    raise ValueError("index range error")
+            permute_list = PermutationPlan(indices)
+        if permute_list.max_index > self._size - 1:
+            raise ValueError("Bad permutation index")
+        return permute_list
+
+    def permute(self, permute_list: Sequence[int] | PermutationPlan | Any) -> Self:
         """Permutes the bits of the vector according to a permutation list.
 
+        Bit i of the result is bit permute_list[i] of this vector. A list that
+        is applied many times should be compiled once into a PermutationPlan.
+
         Args:
             permute_list: A sequence of integer indices specifying the new bit
-                ordering.
+                ordering, or a PermutationPlan compiled from one.
 
         Returns:
             A new BitVector instance containing the permuted bits.
@@ -521,20 +1340,16 @@ class BitVector:
         Raises:
             ValueError: If any index in permute_list exceeds vector bounds.
         """
-        if max(permute_list) > self._size - 1:
-            raise ValueError("Bad permutation index")
-        out_vector = self.__class__(size=len(permute_list))
-        for i, idx in enumerate(permute_list):
-            if self[idx]:
-                out_vector[i] = 1
-        return out_vector
+        plan = self._permutation_plan(permute_list)
+        return self._from_int(plan._apply(self, inverse=False), plan.size)
 
-    def unpermute(self, permute_list: Sequence[int] | Any) -> Self:
+    def unpermute(self, permute_list: Sequence[int] | PermutationPlan | Any) -> Self:
         """Restores the original bit ordering of a previously permuted vector.
 
         Args:
             permute_list: The sequence of integer indices that was originally
-                used to permute the bit vector.
+                used to permute the bit vector, or a PermutationPlan compiled
+                from it.
 
         Returns:
             A new BitVector instance with bits restored to their unpermuted order.
@@ -542,29 +1357,30 @@ class BitVector:
         Raises:
             ValueError: If indices are out of bounds or list size does not match.
         """
-        if max(permute_list) > self._size - 1:
-            raise ValueError("Bad permutation index")
-        if self._size != len(permute_list):
+        plan = self._permutation_plan(permute_list)
+        if self._size != plan.size:
             raise ValueError("Bad size for permute list")
-        out_bv = self.__class__(size=self._size)
-        for i, idx in enumerate(permute_list):
-            if self[i]:
-                out_bv[idx] = 1
-        return out_bv
+        return self._from_int(plan._apply(self, inverse=True), self._size)
 
-    def write_to_file(self, file_out: BinaryIO | Any) -> None:
+    def write_to_file(self, file_out: BinaryIO | Any, bit_order: str = "msb") -> None:
         """Writes the packed binary byte representation of the vector to a file.
 
         The vector length must be an integral multiple of 8 bits. When opening
         files for writing on Windows, ensure binary mode ('wb') is used to avoid
-        automatic newline translations.
+        automatic newline translations. The bytes are converted and written
+        in chunks of 1 MiB, so memory use stays bounded.
 
         Args:
             file_out: An open binary file or stream object supporting write().
+            bit_order: "msb" (the default) writes bit 0 as the most significant
+                bit of the first byte. "lsb" writes the native storage bytes,
+                the layout MappedBitVector maps.
 
         Raises:
-            ValueError: If the vector length is not a multiple of 8.
+            ValueError: If the vector length is not a multiple of 8 or if
+                bit_order is unknown.
         """
+        _check_bit_order(bit_order)
         err_str = (
             "Only a bit vector whose length is a multiple of 8 can "
             "be written to a file. Use the padding functions to satisfy "
@@ -572,11 +1388,11 @@ class BitVector:
         )
         if self._size % 8:
             raise ValueError(err_str)
-        for byte in range(int(self._size / 8)):
-            value = 0
-            for bit in range(8):
-                value += self[byte * 8 + (7 - bit)] << bit
-            file_out.write(bytes([value]))
+        nbytes = self._size >> 3
+        for start in range(0, nbytes, _CHUNK_BYTES):
+            file_out.write(
+                self._packed_bytes(start, min(start + _CHUNK_BYTES, nbytes), bit_order)
+            )
 
     def __int__(self) -> int:
         """Calculates and returns the unsigned integer value of the bit vector.
@@ -593,6 +1409,22 @@ class BitVector:
             int_val >>= unused_bits
         return int_val
 
+    def _packed_bytes(self, start: int, stop: int, bit_order: str = "msb") -> bytes:
+        """Returns a range of storage bytes, by default in the rawbytes layout.
+
+        Args:
+            start: The index of the first byte to return.
+            stop: The index one past the last byte, at most the storage size.
+            bit_order: "msb" to put the lowest bit of each byte in its most
+                significant position, or "lsb" for the native storage bytes.
+
+        Returns:
+            Bits 8 * start to 8 * stop - 1 packed into bytes.
+        """
+        with memoryview(self.vector) as words, words.cast("B") as raw:
+            data = raw[start:stop].tobytes()
+        return data.translate(_BIT_REV_8) if bit_order == "msb" else data
+
     def get_bitvector_in_ascii(self) -> str:
         """Converts the bit vector into an ASCII character string.
 
@@ -610,7 +1442,7 @@ class BitVector:
                 "The bitvector for get_bitvector_in_ascii() "
                 "must be an integral multiple of 8 bits"
             )
-        return "".join(chr(int(self[i : i + 8])) for i in range(0, self._size, 8))
+        return self._packed_bytes(0, self._size >> 3).decode("latin-1")
 
     def get_bitvector_in_hex(self) -> str:
         """Converts the bit vector into a hexadecimal representation string.
@@ -629,9 +1461,7 @@ class BitVector:
                 "The bitvector for get_bitvector_in_hex() "
                 "must be an integral multiple of 4 bits"
             )
-        return "".join(
-            hex(int(self[i : i + 4])).replace("0x", "") for i in range(0, self._size, 4)
-        )
+        return self._packed_bytes(0, (self._size + 7) >> 3).hex()[: self._size >> 2]
 
     def __lshift__(self, n: int) -> Self:
         """Performs a circular left rotation by n bit positions.
@@ -656,8 +1486,9 @@ class BitVector:
     def __ilshift__(self, n: int) -> Self:
         """Performs an in-place circular left rotation by n bit positions.
 
-        Rotates the bit vector circularly to the left n times in-place. Negative
-        values for n delegate to an in-place circular right rotation.
+        Rotates the bit vector circularly to the left by n % size positions
+        in-place with a single word-level pass. Negative values for n delegate
+        to an in-place circular right rotation.
 
         Args:
             n: The integer number of positions to circularly rotate left.
@@ -672,8 +1503,7 @@ class BitVector:
             raise ValueError("Circular shift of an empty vector makes no sense")
         if n < 0:
             return self.__irshift__(abs(n))
-        for _ in range(n):
-            self.circular_rotate_left_by_one()
+        self._rotate_left(n % self._size)
         return self
 
     def __rshift__(self, n: int) -> Self:
@@ -699,8 +1529,9 @@ class BitVector:
     def __irshift__(self, n: int) -> Self:
         """Performs an in-place circular right rotation by n bit positions.
 
-        Rotates the bit vector circularly to the right n times in-place. Negative
-        values for n delegate to an in-place circular left rotation.
+        Rotates the bit vector circularly to the right by n % size positions
+        in-place with a single word-level pass. Negative values for n delegate
+        to an in-place circular left rotation.
 
         Args:
             n: The integer number of positions to circularly rotate right.
@@ -715,10 +1546,22 @@ class BitVector:
             raise ValueError("Circular shift of an empty vector makes no sense")
         if n < 0:
             return self.__ilshift__(abs(n))
-        for _ in range(n):
-            self.circular_rotate_right_by_one()
+        self._rotate_left(-n % self._size)
         return self
 
+    def _rotate_left(self, n: int) -> None:
+        """Rotates the vector circularly left in place with one funnel shift.
+
+        Args:
+            n: The rotation distance, with 0 <= n < size.
+        """
+        if n == 0:
+            return
+        size = self._size
+        value = self._bits_as_int(0, size)
+        rotated = (value >> n) | ((value << (size - n)) & ((1 << size) - 1))
+        self._write_bits(0, size, rotated)
+
     def circular_rotate_left_by_one(self) -> None:
         """Performs a one-bit in-place circular left rotation of the vector."""
         size = len(self.vector)
@@ -726,16 +1569,18 @@ class BitVector:
         left_most_bits = list(map(operator.__and__, self.vector, [1] * size))
         left_most_bits.append(left_most_bits[0])
         del left_most_bits[0]
-        self.vector = array.array(
-            ARRAY_TYPE, map(operator.__rshift__, self.vector, [1] * size)
+        self._set_words(
+            array.array(ARRAY_TYPE, map(operator.__rshift__, self.vector, [1] * size))
         )
-        self.vector = array.array(
-            ARRAY_TYPE,
-            map(
-                operator.__or__,
-                self.vector,
-                list(map(operator.__lshift__, left_most_bits, [63] * size)),
-            ),
+        self._set_words(
+            array.array(
+                ARRAY_TYPE,
+                map(
+                    operator.__or__,
+                    self.vector,
+                    list(map(operator.__lshift__, left_most_bits, [63] * size)),
+                ),
+            )
         )
         self[self._size - 1] = bitstring_leftmost_bit
 
@@ -746,26 +1591,32 @@ class BitVector:
         right_most_bits = list(
             map(operator.__and__, self.vector, [0x8000000000000000] * size)
         )
-        self.vector = array.array(
-            ARRAY_TYPE, map(operator.__and__, self.vector, [~0x8000000000000000] * size)
+        self._set_words(
+            array.array(
+                ARRAY_TYPE,
+                map(operator.__and__, self.vector, [~0x8000000000000000] * size),
+            )
         )
         right_most_bits.insert(0, bitstring_rightmost_bit)
         right_most_bits.pop()
-        self.vector = array.array(
-            ARRAY_TYPE, map(operator.__lshift__, self.vector, [1] * size)
+        self._set_words(
+            array.array(ARRAY_TYPE, map(operator.__lshift__, self.vector, [1] * size))
         )
-        self.vector = array.array(
-            ARRAY_TYPE,
-            map(
-                operator.__or__,
-                self.vector,
-                list(map(operator.__rshift__, right_most_bits, [63] * size)),
-            ),
+        self._set_words(
+            array.array(
+                ARRAY_TYPE,
+                map(
+                    operator.__or__,
+                    self.vector,
+                    list(map(operator.__rshift__, right_most_bits, [63] * size)),
+                ),
+            )
         )
         self[0] = bitstring_rightmost_bit
 
     def circular_rot_left(self) -> None:
         """Performs a one-bit in-place circular left rotation without map()."""
+        self._rank_index = None
         max_index = (self._size - 1) // 64
         left_most_bit = self.vector[0] & 1
         self.vector[0] = self.vector[0] >> 1
@@ -777,6 +1628,7 @@ class BitVector:
 
     def circular_rot_right(self) -> None:
         """Performs a one-bit in-place circular right rotation without map()."""
+        self._rank_index = None
         max_index = (self._size - 1) // 64
         right_most_bit = self[self._size - 1]
         self.vector[max_index] &= ~0x8000000000000000
@@ -788,48 +1640,47 @@ class BitVector:
             self.vector[i + 1] |= right_bit >> 63
         self[0] = right_most_bit
 
+    def _shifted_bits(self, n: int) -> int:
+        """Returns the bits logically shifted by n positions as an integer.
+
+        Args:
+            n: The shift distance; positive values move bits towards index 0
+                (a left shift), negative values towards the end.
+
+        Returns:
+            An integer whose bit k is the shifted vector bit k.
+        """
+        value = self._bits_as_int(0, self._size)
+        if n >= 0:
+            return value >> n
+        return (value << -n) & ((1 << self._size) - 1)
+
+    def _shift_in_place(self, n: int) -> Self:
+        """Logically shifts the vector in place with one funnel shift.
+
+        The word and bit parts of the shift are done by a single big-integer
+        shift, and every storage word is rewritten into the existing storage,
+        which also clears any whole words past the end of the vector.
+
+        Args:
+            n: The shift distance, as for _shifted_bits.
+
+        Returns:
+            This BitVector instance (self) after in-place shifting.
+        """
+        self._rank_index = None
+        words = _words_from_int(self._shifted_bits(n), len(self.vector) << 6)
+        self._keep_tail(words)
+        self.vector[:] = words
+        return self
+
     def shift_left_by_one(self) -> None:
         """Performs a one-bit in-place logical left shift (zero-filling right)."""
-        size = len(self.vector)
-        left_most_bits = list(map(operator.__and__, self.vector, [1] * size))
-        left_most_bits.append(left_most_bits[0])
-        del left_most_bits[0]
-        self.vector = array.array(
-            ARRAY_TYPE, map(operator.__rshift__, self.vector, [1] * size)
-        )
-        self.vector = array.array(
-            ARRAY_TYPE,
-            map(
-                operator.__or__,
-                self.vector,
-                list(map(operator.__lshift__, left_most_bits, [63] * size)),
-            ),
-        )
-        self[self._size - 1] = 0
+        self._shift_in_place(1)
 
     def shift_right_by_one(self) -> None:
         """Performs a one-bit in-place logical right shift (zero-filling left)."""
-        size = len(self.vector)
-        right_most_bits = list(
-            map(operator.__and__, self.vector, [0x8000000000000000] * size)
-        )
-        self.vector = array.array(
-            ARRAY_TYPE, map(operator.__and__, self.vector, [~0x8000000000000000] * size)
-        )
-        right_most_bits.insert(0, 0)
-        right_most_bits.pop()
-        self.vector = array.array(
-            ARRAY_TYPE, map(operator.__lshift__, self.vector, [1] * size)
-        )
-        self.vector = array.array(
-            ARRAY_TYPE,
-            map(
-                operator.__or__,
-                self.vector,
-                list(map(operator.__rshift__, right_most_bits, [63] * size)),
-            ),
-        )
-        self[0] = 0
+        self._shift_in_place(-1)
 
     def shift_left(self, n: int) -> Self:
         """Shifts the vector left by n bits in-place, filling right with zeros.
@@ -842,35 +1693,7 @@ class BitVector:
         """
         if n <= 0:
             return self
-
-        word_shift = n // 64
-        bit_shift = n % 64
-
-        vec = self.vector
-        new_vec = array.array(ARRAY_TYPE, [0] * len(vec))
-
-        if bit_shift == 0:
-            for i in range(len(vec) - word_shift):
-                new_vec[i] = vec[i + word_shift]
-        else:
-            for i in range(len(vec) - word_shift):
-                val = vec[i + word_shift] >> bit_shift
-                if i + word_shift + 1 < len(vec):
-                    val |= (vec[i + word_shift + 1] & ((1 << bit_shift) - 1)) << (
-                        64 - bit_shift
-                    )
-                new_vec[i] = val
-
-        clear_from = max(0, self._size - n)
-        clear_word = clear_from // 64
-        clear_bit = clear_from % 64
-        if clear_word < len(new_vec):
-            new_vec[clear_word] &= (1 << clear_bit) - 1
-            for i in range(clear_word + 1, len(new_vec)):
-                new_vec[i] = 0
-
-        self.vector = new_vec
-        return self
+        return self._shift_in_place(n)
 
     def shift_right(self, n: int) -> Self:
         """Shifts the vector right by n bits in-place, filling left with zeros.
@@ -883,52 +1706,46 @@ class BitVector:
         """
         if n <= 0:
             return self
+        return self._shift_in_place(-n)
 
-        word_shift = n // 64
-        bit_shift = n % 64
+    def shifted_left(self, n: int) -> Self:
+        """Returns a copy of the vector shifted left by n bits, filling right with zeros.
 
-        vec = self.vector
-        new_vec = array.array(ARRAY_TYPE, [0] * len(vec))
+        Args:
+            n: The integer number of bit positions to shift left. Values of
+                zero or less return an unshifted copy.
 
-        if bit_shift == 0:
-            for i in range(word_shift, len(vec)):
-                new_vec[i] = vec[i - word_shift]
-        else:
-            for i in range(word_shift, len(vec)):
-                val = (vec[i - word_shift] << bit_shift) & 0xFFFFFFFFFFFFFFFF
-                if i - word_shift - 1 >= 0:
-                    val |= vec[i - word_shift - 1] >> (64 - bit_shift)
-                new_vec[i] = val
-
-        clear_until = min(self._size, n)
-        clear_word = clear_until // 64
-        clear_bit = clear_until % 64
-
-        for i in range(clear_word):
-            new_vec[i] = 0
-        if clear_word < len(new_vec):
-            new_vec[clear_word] &= ~((1 << clear_bit) - 1)
-
-        last_word = self._size // 64
-        last_bit = self._size % 64
-        if last_bit > 0 and last_word < len(new_vec):
-            new_vec[last_word] &= (1 << last_bit) - 1
-            for i in range(last_word + 1, len(new_vec)):
-                new_vec[i] = 0
-
-        self.vector = new_vec
-        return self
+        Returns:
+            A new BitVector instance holding the shifted bits.
+        """
+        return self._from_int(self._shifted_bits(max(n, 0)), self._size)
+
+    def shifted_right(self, n: int) -> Self:
+        """Returns a copy of the vector shifted right by n bits, filling left with zeros.
+
+        Args:
+            n: The integer number of bit positions to shift right. Values of
+                zero or less return an unshifted copy.
+
+        Returns:
+            A new BitVector instance holding the shifted bits.
+        """
+        return self._from_int(self._shifted_bits(-max(n, 0)), self._size)
 
-    def __setitem__(self, pos: int | slice, item: int | BitVector) -> None:
+    def __setitem__(
+        self, pos: int | slice, item: int | bytes | bytearray | BitVector
+    ) -> None:
         """Assigns a bit or slice of bits at the specified position.
 
         Supports both index assignment (setting a single bit to 0 or 1) and
-        slice assignment (replacing a slice of bits with another BitVector).
+        slice assignment. A slice can be replaced by a BitVector or by bytes
+        (MSB first, as for rawbytes) of the same length, or filled with a single
+        bit value (bv[a:b] = 1). Contiguous slices are written a word at a time.
 
         Args:
             pos: An integer index or slice object indicating where to assign.
-            item: An integer (0 or 1) for index assignment, or a BitVector for
-                slice assignment.
+            item: An integer (0 or 1) for index assignment or slice fill, or a
+                BitVector or bytes object for slice assignment.
 
         Raises:
             TypeError: If the assigned item has an incompatible type.
@@ -936,52 +1753,32 @@ class BitVector:
         """
         # The following section is for slice assignment:
         if isinstance(pos, slice):
-            if not isinstance(item, BitVector):
+            nbits: int | None = None
+            if isinstance(item, BitVector):
+                nbits = item._size
+                value = item._bits_as_int(0, nbits)
+            elif isinstance(item, (bytes, bytearray, memoryview)):
+                data = bytes(item)
+                nbits = 8 * len(data)
+                value = int.from_bytes(data.translate(_BIT_REV_8), "little")
+            elif isinstance(item, int) and item in (0, 1):
+                value = item
+            else:
                 raise TypeError(
-                    "For slice assignment, the right hand side must be a BitVector"
+                    "For slice assignment, the right hand side must be a BitVector, "
+                    "bytes or a bit value (0 or 1)"
                 )
-            if pos.start is None and pos.stop is None:
-                return
-            if pos.start is None:
-                if pos.stop >= 0:
-                    if pos.stop != len(item):
-                        raise ValueError("incompatible lengths for slice assignment 1")
-                    for i in range(pos.stop):
-                        self[i] = item[i]
-                else:
-                    if len(self) - abs(pos.stop) != len(item):
-                        raise ValueError("incompatible lengths for slice assignment 2")
-                    for i in range(len(self) + pos.stop):
-                        self[i] = item[i]
-                return
-            if pos.stop is None:
-                if pos.start >= 0:
-                    if (len(self) - pos.start) != len(item):
-                        raise ValueError("incompatible lengths for slice assignment 3")
-                    for i, val in enumerate(item):
-                        self[pos.start + i] = val
-                else:
-                    if abs(pos.start) != len(item):
-                        raise ValueError("incompatible lengths for slice assignment 4")
-                    for i, val in enumerate(item):
-                        self[len(self) + pos.start + i] = val
+            if pos.step not in (None, 1):
+                self._set_extended_slice(pos, value, nbits)
                 return
-            if pos.stop < 0 <= pos.start:
-                if (len(self) + pos.stop - pos.start) != len(item):
-                    raise ValueError("incompatible lengths for slice assignment 5")
-                for i in range(pos.start, len(self) + pos.stop):
-                    self[i] = item[i - pos.start]
-                return
-            if pos.start < 0 <= pos.stop:
-                if (pos.stop - len(self) - pos.start) != len(item):
-                    raise ValueError("incompatible lengths for slice assignment 6")
-                for i in range(len(self) + pos.start, pos.stop):
-                    self[i] = item[i - len(self) - pos.start]
-                return
-            if (pos.stop - pos.start) != len(item):
-                raise ValueError("incompatible lengths for slice assignment 7")
-            for i in range(pos.start, pos.stop):
-                self[i] = item[i - pos.start]
+            start, stop = self._slice_bounds(pos)
+            if nbits is None:
+                value = (1 << (stop - start)) - 1 if value else 0
+            elif nbits != stop - start:
+                raise ValueError(
+                    f"incompatible lengths for slice assignment {_slice_case(pos)}"
+                )
+            self._write_bits(start, stop, value)
             return
         # Index assignment:
         if item not in (0, 1):
@@ -998,6 +1795,7 @@ class BitVector:
         shift = pos & 63
         cv = self.vector[block_index]
         if (cv >> shift) & 1 != item:
+            self._rank_index = None
             self.vector[block_index] = cv ^ (1 << shift)
 
     # Allow int() to work:
@@ -1035,9 +1833,7 @@ class BitVector:
         Returns:
             A string of '0' and '1' characters matching the stored bits.
         """
-        if self._size == 0:
-            return ""
-        return "".join(map(str, self))
+        return "".join(self._bit_text_chunks(self._size))
 
     def __eq__(self, other: object) -> bool:
         """Checks equality between this bit vector and another object.
@@ -1195,52 +1991,51 @@ class BitVector:
             memo = {}
         new_bv = self.__class__(size=0)
         memo[id(self)] = new_bv
-        if isinstance(self.vector, array.array):
+        if isinstance(self.vector, (array.array, memoryview)):
             new_bv.vector = array.array(ARRAY_TYPE, self.vector)
         else:
             new_bv.vector = copy.deepcopy(self.vector, memo)
         new_bv._size = self._size
         return new_bv
 
-    def _resize_pad_from_left(self, n: int) -> Self:
-        """Resizes the bit vector by padding with n zeros from the left.
-
-        Args:
-            n: The integer number of zero bits to prepend to the bit vector.
-
-        Returns:
-            A new BitVector instance containing the left-padded bits.
-        """
-        new_str = "0" * n + str(self)
-        return self.__class__(bitstring=new_str)
-
     def pad_from_left(self, n: int) -> None:
         """Pads the bit vector with n zeros from the left in-place.
 
+        The existing bits move up by n positions in a single word-level shift.
+        Bit 0 always sits at the start of the first storage word, so every
+        call costs time linear in the length of the vector; to build a vector
+        by repeated left padding, collect the pieces and join them once.
+
         Args:
             n: The integer number of zero bits to prepend to the vector.
         """
-        new_str = "0" * n + str(self)
-        bitlist = list(map(int, list(new_str)))
-        self._size = len(bitlist)
-        eight_byte_ints_needed = (len(bitlist) + 63) // 64
-        self.vector = array.array(ARRAY_TYPE, [0] * eight_byte_ints_needed)
-        for idx, bit in enumerate(bitlist):
-            self[idx] = bit
+        self._check_resizable()
+        if n <= 0:
+            return
+        self._rank_index = None
+        size = self._size + n
+        self.vector = _words_from_int(self._bits_as_int(0, self._size) << n, size)
+        self._size = size
 
     def pad_from_right(self, n: int) -> None:
         """Pads the bit vector with n zeros from the right in-place.
 
+        The unused bits of the last word are cleared and zeroed words are
+        appended, so the existing words are not copied.
+
         Args:
             n: The integer number of zero bits to append to the vector.
         """
-        new_str = str(self) + "0" * n
-        bitlist = list(map(int, list(new_str)))
-        self._size = len(bitlist)
-        eight_byte_ints_needed = (len(bitlist) + 63) // 64
-        self.vector = array.array(ARRAY_TYPE, [0] * eight_byte_ints_needed)
-        for idx, bit in enumerate(bitlist):
-            self[idx] = bit
+        self._check_resizable()
+        if n <= 0:
+            return
+        self._rank_index = None
+        if not isinstance(self.vector, array.array):
+            self.vector = array.array(ARRAY_TYPE, self.vector)
+        if self._size & 63:
+            self.vector[self._size >> 6] &= (1 << (self._size & 63)) - 1
+        self._size += n
+        self.vector.frombytes(bytes(8 * (((self._size + 63) >> 6) - len(self.vector))))
 
     def __contains__(self, otherBitVec: BitVector) -> bool:
         """Checks if a sub-vector is contained within this bit vector.
@@ -1262,11 +2057,197 @@ class BitVector:
         if self._size < otherBitVec._size:
             raise ValueError("First arg bitvec too short")
 
-        max_index = self._size - otherBitVec._size + 1
-        for i in range(max_index):
-            if self[i : i + otherBitVec._size] == otherBitVec:
-                return True
-        return False
+        return self.find(otherBitVec) != -1
+
+    def _match_windows(
+        self, pattern: BitVector, start: int, end: int, reverse: bool
+    ) -> Iterator[tuple[int, int]]:
+        """Matches the prefix of a pattern at every start position, window by window.
+
+        This is the shift-and (bitap) algorithm run across a whole window of
+        the vector at once: the text is read as an integer, and for each
+        pattern bit j the text (or its complement) shifted down by j is ANDed
+        into the result. Each step is one big-integer operation, so a window
+        of _FIND_WINDOW_BITS positions costs O(m * window / 64) word
+        operations. Only the first _FIND_PREFIX_BITS pattern bits are matched
+        here; longer patterns are verified per candidate by the caller.
+
+        Args:
+            pattern: The non-empty pattern to look for.
+            start: The first bit position at which a match may begin.
+            end: The bit position one past the last bit a match may cover.
+            reverse: If True, windows are produced from the end backwards.
+
+        Yields:
+            (base, mask) pairs where bit k of mask is set when the pattern
+            prefix occurs at position base + k.
+        """
+        m = pattern._size
+        prefix = min(m, _FIND_PREFIX_BITS)
+        pat = pattern._bits_as_int(0, prefix)
+        last = end - m + 1
+        bases = range(start, last, _FIND_WINDOW_BITS)
+        for base in reversed(bases) if reverse else bases:
+            count = min(_FIND_WINDOW_BITS, last - base)
+            ntext = count + prefix - 1
+            text = self._bits_as_int(base, base + ntext)
+            inverted = text ^ ((1 << ntext) - 1)
+            mask = (1 << count) - 1
+            for j in range(prefix):
+                mask &= (text if (pat >> j) & 1 else inverted) >> j
+                if not mask:
+                    break
+            if mask:
+                yield base, mask
+
+    def _match_positions(
+        self, pattern: BitVector, start: int, end: int, reverse: bool = False
+    ) -> Iterator[int]:
+        """Yields every position where pattern occurs within [start, end).
+
+        Args:
+            pattern: The non-empty pattern to look for.
+            start: The first bit position at which a match may begin.
+            end: The bit position one past the last bit a match may cover.
+            reverse: If True, positions are yielded in decreasing order.
+
+        Yields:
+            The start position of each (possibly overlapping) occurrence.
+        """
+        m = pattern._size
+        pat = pattern._bits_as_int(0, m)
+        for base, mask in self._match_windows(pattern, start, end, reverse):
+            nwords = (mask.bit_length() + 63) >> 6
+            words = array.array(ARRAY_TYPE)
+            words.frombytes(mask.to_bytes(nwords << 3, "little"))
+            order = range(nwords - 1, -1, -1) if reverse else range(nwords)
+            for i in itertools.compress(order, (words[i] for i in order)):
+                word = words[i]
+                offsets = []
+                while word:
+                    low = word & -word
+                    offsets.append(low.bit_length() - 1)
+                    word ^= low
+                for offset in reversed(offsets) if reverse else offsets:
+                    pos = base + (i << 6) + offset
+                    if m <= _FIND_PREFIX_BITS or self._bits_as_int(pos, pos + m) == pat:
+                        yield pos
+
+    def _find_range(
+        self, pattern: BitVector, start: int, end: int | None
+    ) -> tuple[int, int]:
+        """Validates a search pattern and normalizes the search bounds.
+
+        Args:
+            pattern: The pattern to look for.
+            start: The first bit position to search, as in slice notation.
+            end: The bit position one past the end of the search, as in slice
+                notation, or None for the end of the vector.
+
+        Returns:
+            The (start, end) bounds clipped to the vector.
+
+        Raises:
+            TypeError: If pattern is not a BitVector.
+        """
+        if not isinstance(pattern, BitVector):
+            raise TypeError(f"pattern must be a BitVector, not {type(pattern)}")
+        start, end, _ = slice(start, end).indices(self._size)
+        return start, end
+
+    def find(self, pattern: BitVector, start: int = 0, end: int | None = None) -> int:
+        """Finds the first occurrence of a bit pattern, like str.find.
+
+        Patterns of up to 64 bits are matched bit-parallel across 64K
+        positions at a time; longer patterns are filtered on their first 64
+        bits and each candidate is then compared word by word.
+
+        Args:
+            pattern: The BitVector to look for.
+            start: The first bit position to search, as in slice notation.
+            end: The bit position one past the end of the search, as in slice
+                notation, or None for the end of the vector.
+
+        Returns:
+            The lowest position where pattern occurs within [start, end), or -1
+            if it does not occur. An empty pattern is found at start.
+
+        Raises:
+            TypeError: If pattern is not a BitVector.
+        """
+        start, end = self._find_range(pattern, start, end)
+        if not pattern._size:
+            return start
+        return next(self._match_positions(pattern, start, end), -1)
+
+    def rfind(self, pattern: BitVector, start: int = 0, end: int | None = None) -> int:
+        """Finds the last occurrence of a bit pattern, like str.rfind.
+
+        Args:
+            pattern: The BitVector to look for.
+            start: The first bit position to search, as in slice notation.
+            end: The bit position one past the end of the search, as in slice
+                notation, or None for the end of the vector.
+
+        Returns:
+            The highest position where pattern occurs within [start, end), or
+            -1 if it does not occur. An empty pattern is found at end.
+
+        Raises:
+            TypeError: If pattern is not a BitVector.
+        """
+        start, end = self._find_range(pattern, start, end)
+        if not pattern._size:
+            return end
+        return next(self._match_positions(pattern, start, end, reverse=True), -1)
+
+    def find_all(
+        self, pattern: BitVector, start: int = 0, end: int | None = None
+    ) -> list[int]:
+        """Finds every occurrence of a bit pattern, including overlapping ones.
+
+        Args:
+            pattern: The BitVector to look for.
+            start: The first bit position to search, as in slice notation.
+            end: The bit position one past the end of the search, as in slice
+                notation, or None for the end of the vector.
+
+        Returns:
+            The positions where pattern occurs within [start, end), in
+            increasing order.
+
+        Raises:
+            TypeError: If pattern is not a BitVector.
+        """
+        start, end = self._find_range(pattern, start, end)
+        if not pattern._size:
+            return list(range(start, end + 1))
+        return list(self._match_positions(pattern, start, end))
+
+    def count_occurrences(
+        self, pattern: BitVector, start: int = 0, end: int | None = None
+    ) -> int:
+        """Counts the occurrences of a bit pattern, including overlapping ones.
+
+        Args:
+            pattern: The BitVector to look for.
+            start: The first bit position to search, as in slice notation.
+            end: The bit position one past the end of the search, as in slice
+                notation, or None for the end of the vector.
+
+        Returns:
+            The number of positions where pattern occurs within [start, end).
+
+        Raises:
+            TypeError: If pattern is not a BitVector.
+        """
+        start, end = self._find_range(pattern, start, end)
+        if not pattern._size:
+            return end - start + 1
+        if pattern._size > _FIND_PREFIX_BITS:
+            return sum(1 for _ in self._match_positions(pattern, start, end))
+        windows = self._match_windows(pattern, start, end, reverse=False)
+        return sum(mask.bit_count() for _, mask in windows)
 
     def reset(self, val: int) -> Self:
         """Resets all bits in the vector to either 0 or 1 in-place.
@@ -1283,23 +2264,42 @@ class BitVector:
         if val not in (0, 1):
             raise ValueError("Incorrect reset argument")
         if val == 0:
-            self.vector = array.array(ARRAY_TYPE, [0] * len(self.vector))
+            self._set_words(array.array(ARRAY_TYPE, [0] * len(self.vector)))
         else:
             word_size = self.vector.itemsize * 8
             full_word = (1 << word_size) - 1
-            self.vector = array.array(ARRAY_TYPE, [full_word] * len(self.vector))
+            words = array.array(ARRAY_TYPE, [full_word] * len(self.vector))
             rem = self._size % word_size
-            if rem > 0 and len(self.vector) > 0:
-                self.vector[-1] = (1 << rem) - 1
+            if rem > 0 and len(words) > 0:
+                words[-1] = (1 << rem) - 1
+            self._set_words(words)
         return self
 
+    def _int_chunks(self) -> Iterator[int]:
+        """Yields the bits as little-endian integers of up to _CHUNK_BYTES each.
+
+        The unused tail bits of the last word are masked off, so the chunks
+        can be fed straight to int.bit_count() and combined with the chunks
+        of another vector of the same length.
+
+        Yields:
+            Integers whose concatenation, lowest chunk first, holds the bits.
+        """
+        v = self.vector
+        full = self._size >> 6
+        step = _CHUNK_BYTES >> 3
+        for lo in range(0, full, step):
+            yield int.from_bytes(v[lo : min(lo + step, full)], "little")
+        if self._size & 63:
+            yield v[full] & ((1 << (self._size & 63)) - 1)
+
     def count_bits(self) -> int:
         """Counts the total number of set bits (1s) in the bit vector.
 
         Returns:
             The integer count of bits set to 1.
         """
-        return sum(self)
+        return sum(chunk.bit_count() for chunk in self._int_chunks())
 
     def set_value(
         self,
@@ -1319,7 +2319,8 @@ class BitVector:
         Args:
             size: The desired number of bits for a zero-initialized vector (or
                 used in conjunction with intVal).
-            intVal: An integer value to convert into a bit vector.
+            intVal: An integer value to convert into a bit vector. A negative
+                value is stored in two's complement and requires size.
             bitlist: A sequence or list of integers (0s and 1s) representing bits.
             bitstring: A string of binary characters ('0's and '1's).
             hexstring: A string of hexadecimal characters to convert to bits.
@@ -1329,143 +2330,453 @@ class BitVector:
             ValueError: If no argument is provided, if mutually exclusive
                 arguments are specified together, or if input values are invalid.
         """
-        BitVector.__init__(
-            self,
-            size=size,
-            intVal=intVal,
-            bitlist=bitlist,
-            bitstring=bitstring,
-            hexstring=hexstring,
-            rawbytes=rawbytes,
-        )
+        self._check_resizable()
+        BitVector.__init__(
+            self,
+            size=size,
+            intVal=intVal,
+            bitlist=bitlist,
+            bitstring=bitstring,
+            hexstring=hexstring,
+            rawbytes=rawbytes,
+        )
+
+    def count_bits_sparse(self) -> int:
+        """Counts set bits; kept for compatibility with count_bits().
+
+        Both methods share the same population count, which skips zero words
+        as cheaply as any sparse-specific loop could.
+
+        Returns:
+            The integer count of bits set to 1.
+        """
+        return self.count_bits()
+
+    def jaccard_similarity(self, other: BitVector) -> float:
+        """Calculates the Jaccard similarity coefficient between two vectors.
+
+        Args:
+            other: A BitVector of equal length to compare against.
+
+        Returns:
+            A floating-point coefficient between 0.0 and 1.0.
+
+        Raises:
+            ValueError: If vectors are of unequal length or both zero.
+        """
+        if not any(self._int_chunks()) and not any(other._int_chunks()):
+            raise ValueError("Jaccard called on two zero vectors --- NOT ALLOWED")
+        if self._size != other._size:
+            raise ValueError(
+                "bitvectors for comparing with Jaccard must be of equal length"
+            )
+        intersect = union = 0
+        for a, b in zip(self._int_chunks(), other._int_chunks()):
+            intersect += (a & b).bit_count()
+            union += (a | b).bit_count()
+        return intersect / float(union)
+
+    def jaccard_distance(self, other: BitVector) -> float:
+        """Calculates the Jaccard distance coefficient between two vectors.
+
+        Args:
+            other: A BitVector of equal length to compare against.
+
+        Returns:
+            A floating-point distance between 0.0 and 1.0 (1 - similarity).
+
+        Raises:
+            ValueError: If vectors are of unequal length.
+        """
+        if self._size != other._size:
+            raise ValueError("vectors of unequal length")
+        return 1 - self.jaccard_similarity(other)
+
+    def hamming_distance(self, other: BitVector) -> int:
+        """Calculates the Hamming distance between two vectors of equal length.
+
+        Args:
+            other: A BitVector of equal length to compare against.
+
+        Returns:
+            The integer number of bit positions where the two vectors disagree.
+
+        Raises:
+            ValueError: If vectors are of unequal length.
+        """
+        if self._size != other._size:
+            raise ValueError("vectors of unequal length")
+        return sum(
+            (a ^ b).bit_count() for a, b in zip(self._int_chunks(), other._int_chunks())
+        )
+
+    def _scan_forward(self, from_index: int, bit: int) -> int:
+        """Finds the first bit equal to bit at or after from_index.
+
+        The word holding from_index is checked on its own; after that the
+        words are read _SCAN_WORDS at a time as one integer, so runs of words
+        without a match cost one comparison per chunk.
+
+        Args:
+            from_index: The non-negative bit index at which to start searching.
+            bit: 1 to look for a set bit, 0 to look for a clear bit.
+
+        Returns:
+            The index of the first matching bit, or -1 if none is found.
+
+        Raises:
+            ValueError: If from_index is negative.
+        """
+        if from_index < 0:
+            raise ValueError("from_index must be nonnegative")
+        if from_index >= self._size:
+            return -1
+        v = self.vector
+        flip = 0 if bit else 0xFFFFFFFFFFFFFFFF
+        o = from_index >> 6
+        h = (v[o] ^ flip) >> (from_index & 63)
+        if h:
+            pos = from_index + (h & -h).bit_length() - 1
+        else:
+            nwords = (self._size + 63) >> 6
+            pos = self._size
+            for lo in range(o + 1, nwords, _SCAN_WORDS):
+                hi = min(lo + _SCAN_WORDS, nwords)
+                chunk = int.from_bytes(v[lo:hi], "little")
+                if not bit:
+                    chunk ^= (1 << ((hi - lo) << 6)) - 1
+                if chunk:
+                    pos = (lo << 6) + (chunk & -chunk).bit_length() - 1
+                    break
+        return pos if pos < self._size else -1
+
+    def _scan_backward(self, from_index: int, bit: int) -> int:
+        """Finds the last bit equal to bit at or before from_index.
+
+        Args:
+            from_index: The non-negative bit index at which to start searching.
+                Indices past the end of the vector start at its last bit.
+            bit: 1 to look for a set bit, 0 to look for a clear bit.
+
+        Returns:
+            The index of the last matching bit, or -1 if none is found.
+
+        Raises:
+            ValueError: If from_index is negative.
+        """
+        if from_index < 0:
+            raise ValueError("from_index must be nonnegative")
+        from_index = min(from_index, self._size - 1)
+        if from_index < 0:
+            return -1
+        v = self.vector
+        flip = 0 if bit else 0xFFFFFFFFFFFFFFFF
+        o = from_index >> 6
+        h = (v[o] ^ flip) & ((2 << (from_index & 63)) - 1)
+        if h:
+            return (o << 6) + h.bit_length() - 1
+        for hi in range(o, 0, -_SCAN_WORDS):
+            lo = max(hi - _SCAN_WORDS, 0)
+            chunk = int.from_bytes(v[lo:hi], "little")
+            if not bit:
+                chunk ^= (1 << ((hi - lo) << 6)) - 1
+            if chunk:
+                return (lo << 6) + chunk.bit_length() - 1
+        return -1
+
+    def next_set_bit(self, from_index: int = 0) -> int:
+        """Finds the index of the next set bit starting from from_index.
+
+        Args:
+            from_index: The non-negative bit index at which to start searching.
+
+        Returns:
+            The integer index of the next set bit (1), or -1 if none is found.
+
+        Raises:
+            ValueError: If from_index is negative.
+        """
+        return self._scan_forward(from_index, 1)
+
+    def next_clear_bit(self, from_index: int = 0) -> int:
+        """Finds the index of the next clear bit starting from from_index.
+
+        Args:
+            from_index: The non-negative bit index at which to start searching.
+
+        Returns:
+            The integer index of the next clear bit (0), or -1 if none is found.
+
+        Raises:
+            ValueError: If from_index is negative.
+        """
+        return self._scan_forward(from_index, 0)
+
+    def prev_set_bit(self, from_index: int) -> int:
+        """Finds the index of the last set bit at or before from_index.
+
+        Args:
+            from_index: The non-negative bit index at which to start searching
+                backwards.
+
+        Returns:
+            The integer index of the previous set bit (1), or -1 if none is
+            found.
+
+        Raises:
+            ValueError: If from_index is negative.
+        """
+        return self._scan_backward(from_index, 1)
+
+    def prev_clear_bit(self, from_index: int) -> int:
+        """Finds the index of the last clear bit at or before from_index.
+
+        Args:
+            from_index: The non-negative bit index at which to start searching
+                backwards.
+
+        Returns:
+            The integer index of the previous clear bit (0), or -1 if none is
+            found.
+
+        Raises:
+            ValueError: If from_index is negative.
+        """
+        return self._scan_backward(from_index, 0)
+
+    def _iter_bits(self, bit: int) -> Iterator[int]:
+        """Yields the indices of the bits equal to bit in increasing order.
+
+        Chunks where at least one bit in eight matches are expanded to one
+        flag byte per bit and filtered by itertools.compress. Sparser chunks
+        skip their empty words and peel the lowest matching bit off each
+        remaining word, so every step works on a 64-bit integer.
+
+        Args:
+            bit: 1 to yield set bits, 0 to yield clear bits.
+
+        Yields:
+            The index of each matching bit.
+        """
+        v = self.vector
+        size = self._size
+        nwords = (size + 63) >> 6
+        flags = _BYTE_TO_FLAGS.__getitem__
+        for lo in range(0, nwords, _SCAN_WORDS):
+            hi = min(lo + _SCAN_WORDS, nwords)
+            chunk = int.from_bytes(v[lo:hi], "little")
+            if not bit:
+                chunk = ~chunk
+            nbits = min(hi << 6, size) - (lo << 6)
+            chunk &= (1 << nbits) - 1
+            if not chunk:
+                continue
+            data = chunk.to_bytes((hi - lo) << 3, "little")
+            if chunk.bit_count() << 3 >= nbits:
+                yield from itertools.compress(
+                    range(lo << 6, hi << 6), b"".join(map(flags, data))
+                )
+                continue
+            words = array.array(ARRAY_TYPE)
+            words.frombytes(data)
+            for i in itertools.compress(range(hi - lo), words):
+                word = words[i]
+                base = ((lo + i) << 6) - 1
+                while word:
+                    low = word & -word
+                    yield base + low.bit_length()
+                    word ^= low
+
+    def iter_set_bits(self) -> Iterator[int]:
+        """Iterates over the indices of the set bits, skipping zero words in bulk.
+
+        Yields:
+            The index of each bit set to 1, in increasing order.
+        """
+        return self._iter_bits(1)
+
+    def iter_clear_bits(self) -> Iterator[int]:
+        """Iterates over the indices of the clear bits, skipping full words in bulk.
+
+        Yields:
+            The index of each bit set to 0, in increasing order.
+        """
+        return self._iter_bits(0)
+
+    def rank_of_bit_set_at_index(self, position: int) -> int:
+        """Calculates the rank (count of set bits up to position) of a set bit.
+
+        Args:
+            position: The target bit index, which must currently be set to 1.
+
+        Returns:
+            The total number of set bits from index 0 up to position (inclusive).
+
+        Raises:
+            ValueError: If the bit at position is not set to 1.
+        """
+        if self[position] != 1:
+            raise ValueError("the arg bit not set")
+        if position < 0:
+            position += self._size
+        return self.rank1(position + 1)
 
-    def count_bits_sparse(self) -> int:
-        """Counts set bits using Brian Kernighan's algorithm for sparse vectors.
+    def _build_rank_directory(self) -> tuple[array.array[int], array.array[int], int]:
+        """Counts the set bits of every block and superblock in one pass.
 
-        Optimized for large bit vectors where very few bits are set to 1.
+        Returns:
+            A tuple (supers, blocks, total) holding the number of set bits
+            before each superblock, the number before each block relative to
+            its superblock, and the number in the whole vector.
+        """
+        v = self.vector
+        supers = array.array(ARRAY_TYPE)
+        blocks = array.array("H")
+        per_super = 1 << (_RANK_SUPER_SHIFT - _RANK_BLOCK_SHIFT)
+        block_words = 1 << (_RANK_BLOCK_SHIFT - 6)
+        last = (self._size - 1) >> _RANK_BLOCK_SHIFT
+        total = base = 0
+        for block in range(last + 1):
+            if block % per_super == 0:
+                supers.append(total)
+                base = total
+            blocks.append(total - base)
+            lo = block * block_words
+            chunk = int.from_bytes(v[lo : lo + block_words], "little")
+            if block == last:
+                chunk &= (1 << (self._size - (block << _RANK_BLOCK_SHIFT))) - 1
+            total += chunk.bit_count()
+        return supers, blocks, total
+
+    def _rank_directory(self) -> tuple[array.array[int], array.array[int], int]:
+        """Returns the rank/select directory, building it on first use.
+
+        The directory is dropped by every method that changes the bits, and
+        whenever a buffer is exported or released. It is neither cached nor
+        used while buffers are exported or while the storage is a shared
+        buffer or mapping, since writes made through those cannot be seen.
 
         Returns:
-            The integer count of bits set to 1.
+            The tuple built by _build_rank_directory().
         """
-        num = 0
-        for intval in self.vector:
-            if intval == 0:
-                continue
-            c = 0
-            iv = intval
-            while iv > 0:
-                iv = iv & (iv - 1)
-                c = c + 1
-            num = num + c
-        return num
+        if self._exports or not isinstance(self.vector, array.array):
+            return self._build_rank_directory()
+        index = self._rank_index
+        if index is None:
+            index = self._rank_index = self._build_rank_directory()
+        return index
 
-    def jaccard_similarity(self, other: BitVector) -> float:
-        """Calculates the Jaccard similarity coefficient between two vectors.
+    def rank1(self, i: int) -> int:
+        """Counts the set bits before position i.
+
+        The first call builds a directory of block counts (4.7% of the
+        vector's size); after that each query reads at most 8 words.
 
         Args:
-            other: A BitVector of equal length to compare against.
+            i: A bit position from 0 to len(self) inclusive.
 
         Returns:
-            A floating-point coefficient between 0.0 and 1.0.
+            The number of bits set to 1 in positions 0 to i - 1.
 
         Raises:
-            ValueError: If vectors are of unequal length or both zero.
+            ValueError: If i is outside 0 to len(self).
         """
-        if int(self) == 0 and int(other) == 0:
-            raise ValueError("Jaccard called on two zero vectors --- NOT ALLOWED")
-        if self._size != other._size:
-            raise ValueError(
-                "bitvectors for comparing with Jaccard must be of equal length"
-            )
-        intersect = self & other
-        union = self | other
-        return intersect.count_bits_sparse() / float(union.count_bits_sparse())
-
-    def jaccard_distance(self, other: BitVector) -> float:
-        """Calculates the Jaccard distance coefficient between two vectors.
+        if not 0 <= i <= self._size:
+            raise ValueError("index range error")
+        supers, blocks, total = self._rank_directory()
+        if i == self._size:
+            return total
+        block = i >> _RANK_BLOCK_SHIFT
+        lo = block << (_RANK_BLOCK_SHIFT - 6)
+        partial = int.from_bytes(self.vector[lo : (i + 63) >> 6], "little")
+        partial &= (1 << (i - (block << _RANK_BLOCK_SHIFT))) - 1
+        return supers[i >> _RANK_SUPER_SHIFT] + blocks[block] + partial.bit_count()
+
+    def rank0(self, i: int) -> int:
+        """Counts the clear bits before position i.
 
         Args:
-            other: A BitVector of equal length to compare against.
+            i: A bit position from 0 to len(self) inclusive.
 
         Returns:
-            A floating-point distance between 0.0 and 1.0 (1 - similarity).
+            The number of bits set to 0 in positions 0 to i - 1.
 
         Raises:
-            ValueError: If vectors are of unequal length.
+            ValueError: If i is outside 0 to len(self).
         """
-        if self._size != other._size:
-            raise ValueError("vectors of unequal length")
-        return 1 - self.jaccard_similarity(other)
+        return i - self.rank1(i)
 
-    def hamming_distance(self, other: BitVector) -> int:
-        """Calculates the Hamming distance between two vectors of equal length.
+    def _select(self, k: int, bit: int) -> int:
+        """Finds the position of the bit of rank k with the given value.
+
+        A binary search over the superblock counts is followed by a scan of
+        at most 8 block counts and 8 words.
 
         Args:
-            other: A BitVector of equal length to compare against.
+            k: The zero-based rank of the wanted bit.
+            bit: 1 to search among the set bits, 0 among the clear bits.
 
         Returns:
-            The integer number of bit positions where the two vectors disagree.
+            The bit position p such that bit p equals bit and exactly k bits
+            with that value come before it.
 
         Raises:
-            ValueError: If vectors are of unequal length.
+            ValueError: If fewer than k + 1 bits have the given value.
         """
-        if self._size != other._size:
-            raise ValueError("vectors of unequal length")
-        diff = self ^ other
-        return diff.count_bits_sparse()
-
-    def next_set_bit(self, from_index: int = 0) -> int:
-        """Finds the index of the next set bit starting from from_index.
+        supers, blocks, total = self._rank_directory()
+        if not 0 <= k < (total if bit else self._size - total):
+            raise ValueError("rank out of range")
+        per_super = 1 << (_RANK_SUPER_SHIFT - _RANK_BLOCK_SHIFT)
+
+        def before_super(j: int) -> int:
+            return supers[j] if bit else (j << _RANK_SUPER_SHIFT) - supers[j]
+
+        def before_block(b: int) -> int:
+            ones = supers[b // per_super] + blocks[b]
+            return ones if bit else (b << _RANK_BLOCK_SHIFT) - ones
+
+        sup = bisect.bisect_right(range(len(supers)), k, key=before_super) - 1
+        block = sup * per_super
+        end = min(block + per_super, len(blocks))
+        while block + 1 < end and before_block(block + 1) <= k:
+            block += 1
+        k -= before_block(block)
+        w = block << (_RANK_BLOCK_SHIFT - 6)
+        while True:
+            word = self.vector[w] if bit else ~self.vector[w] & 0xFFFFFFFFFFFFFFFF
+            count = word.bit_count()
+            if k < count:
+                return (w << 6) + _select_in_word(word, k)
+            k -= count
+            w += 1
+
+    def select1(self, k: int) -> int:
+        """Finds the position of the set bit of rank k.
 
         Args:
-            from_index: The non-negative bit index at which to start searching.
+            k: The zero-based rank, so select1(0) is the first set bit.
 
         Returns:
-            The integer index of the next set bit (1), or -1 if none is found.
+            The position p of a set bit with rank1(p) == k.
 
         Raises:
-            ValueError: If from_index is negative.
+            ValueError: If the vector has fewer than k + 1 set bits.
         """
-        if from_index < 0:
-            raise ValueError("from_index must be nonnegative")
-        i = from_index
-        v = self.vector
-        vec_len = len(v)
-        o = i >> 6
-        s = i & 0x3F
-        i = o << 6
-        while o < vec_len:
-            h = v[o]
-            if h:
-                i += s
-                m = 1 << s
-                while m != (1 << 0x40):
-                    if h & m:
-                        return i
-                    m <<= 1
-                    i += 1
-            else:
-                i += 0x40
-            s = 0
-            o += 1
-        return -1
+        return self._select(k, 1)
 
-    def rank_of_bit_set_at_index(self, position: int) -> int:
-        """Calculates the rank (count of set bits up to position) of a set bit.
+    def select0(self, k: int) -> int:
+        """Finds the position of the clear bit of rank k.
 
         Args:
-            position: The target bit index, which must currently be set to 1.
+            k: The zero-based rank, so select0(0) is the first clear bit.
 
         Returns:
-            The total number of set bits from index 0 up to position (inclusive).
+            The position p of a clear bit with rank0(p) == k.
 
         Raises:
-            ValueError: If the bit at position is not set to 1.
+            ValueError: If the vector has fewer than k + 1 clear bits.
         """
-        if self[position] != 1:
-            raise ValueError("the arg bit not set")
-        bv = self[0 : position + 1]
-        return bv.count_bits()
+        return self._select(k, 0)
 
     def is_power_of_2(self) -> bool:
         """Checks whether the integer value of the vector is a power of two.
@@ -1488,7 +2799,21 @@ class BitVector:
         Returns:
             True if exactly one bit is set to 1, else False.
         """
-        return self.count_bits_sparse() == 1
+        return self.count_bits() == 1
+
+    def _reversed_bits(self) -> int:
+        """Returns the bits in reverse order as an integer whose bit k is bit size-1-k.
+
+        The bytes are taken in reverse order (big-endian), each is bit-reversed
+        through _BIT_REV_8, and one shift drops the padding of the last byte.
+
+        Returns:
+            The reversed bits as a non-negative integer.
+        """
+        nbytes = (self._size + 7) >> 3
+        data = self._bits_as_int(0, self._size).to_bytes(nbytes, "big")
+        value = int.from_bytes(data.translate(_BIT_REV_8), "little")
+        return value >> (-self._size & 7)
 
     def reverse(self) -> Self:
         """Reverses the order of bits in the vector (left-to-right becomes right-to-left).
@@ -1496,11 +2821,16 @@ class BitVector:
         Returns:
             A new BitVector instance with bits in reversed order.
         """
-        new_bv = self.__class__(size=self._size)
-        for i in range(self._size):
-            if self[self._size - 1 - i]:
-                new_bv[i] = 1
-        return new_bv
+        return self._from_int(self._reversed_bits(), self._size)
+
+    def reverse_inplace(self) -> Self:
+        """Reverses the order of bits in the vector in-place.
+
+        Returns:
+            This BitVector instance (self) after reversing.
+        """
+        self._set_words(_words_from_int(self._reversed_bits(), self._size))
+        return self
 
     def gcd(self, other: BitVector) -> Self:
         """Calculates the greatest common divisor (GCD) using Euclid's algorithm.
@@ -1556,18 +2886,12 @@ class BitVector:
         Returns:
             A new BitVector containing the GF(2) product of the two polynomials.
         """
-        a = copy.deepcopy(self)
-        b_copy = copy.deepcopy(b)
-        result = self.__class__(size=len(a) + len(b_copy))
-        a.pad_from_left(len(result) - len(a))
-        b_copy.pad_from_left(len(result) - len(b_copy))
-        for i, bit in enumerate(b_copy):
-            if bit == 1:
-                power = len(b_copy) - i - 1
-                a_copy = copy.deepcopy(a)
-                a_copy.shift_left(power)
-                result ^= a_copy
-        return result
+        # Reversing both factors reverses their product, so the storage words,
+        # which hold the coefficients lowest position first, are multiplied
+        # as they are. The product of lengths m and n has m + n - 1 bits,
+        # one short of the result, so it moves up by one position.
+        product = _clmul(self._bits_as_int(0, self._size), b._bits_as_int(0, b._size))
+        return self._from_int(product << 1, self._size + b._size)
 
     def gf_divide_by_modulus(self, mod: BitVector, n: int) -> tuple[Self, Self]:
         """Divides this polynomial by a modulus polynomial in GF(2^n).
@@ -1582,33 +2906,28 @@ class BitVector:
         Raises:
             ValueError: If the modulus polynomial is too long for GF(2^n).
         """
-        num = self
         if len(mod) > n + 1:
             raise ValueError("Modulus bit pattern too long")
-        quotient = self.__class__(intVal=0, size=len(num))
-        remainder = copy.deepcopy(num)
-        i = 0
-        while 1:
-            i = i + 1
-            if i == len(num):
-                break
-            mod_highest_power = len(mod) - mod.next_set_bit(0) - 1
-            if remainder.next_set_bit(0) == -1:
-                remainder_highest_power = 0
-            else:
-                remainder_highest_power = len(remainder) - remainder.next_set_bit(0) - 1
-            if (remainder_highest_power < mod_highest_power) or int(remainder) == 0:
+        # The division runs on the integer values. The modulus degree is found
+        # once; a zero modulus keeps the degree len(mod) the bit scan gave it.
+        m = int(mod)
+        mod_degree = m.bit_length() - 1 if m else len(mod)
+        r = int(self)
+        q = 0
+        size = self._size
+        # At most len(self) - 1 leading terms are cancelled, as before.
+        for _ in range(self._size - 1):
+            shift = r.bit_length() - 1 - mod_degree
+            if not r or shift < 0:
                 break
-
-            exponent_shift = remainder_highest_power - mod_highest_power
-            quotient[len(quotient) - exponent_shift - 1] = 1
-            quotient_mod_product = copy.deepcopy(mod)
-            quotient_mod_product.pad_from_left(len(remainder) - len(mod))
-            quotient_mod_product.shift_left(exponent_shift)
-            remainder = remainder ^ quotient_mod_product
-        if len(remainder) > n:
-            remainder = remainder[len(remainder) - n :]
-        return quotient, remainder
+            q |= 1 << shift
+            r ^= m << shift
+            size = max(size, len(mod))
+        quotient = self.__class__(intVal=q, size=self._size)
+        if size > n:
+            r &= (1 << n) - 1
+            size = n
+        return quotient, self._from_value(r, size)
 
     def gf_multiply_modular(self, b: BitVector | Any, mod: BitVector, n: int) -> Self:
         """Performs modular polynomial multiplication in Galois Field GF(2^n).
@@ -1621,11 +2940,7 @@ class BitVector:
         Returns:
             A new BitVector containing the product modulo mod in GF(2^n).
         """
-        a = self
-        a_copy = copy.deepcopy(a)
-        b_copy = copy.deepcopy(b)
-        product = a_copy.gf_multiply(b_copy)
-        _quotient, remainder = product.gf_divide_by_modulus(mod, n)
+        _quotient, remainder = self.gf_multiply(b).gf_divide_by_modulus(mod, n)
         return remainder
 
     def gf_MI(self, mod: BitVector, n: int) -> Self | str:
@@ -1658,6 +2973,65 @@ class BitVector:
         quotient, remainder = z.gf_divide_by_modulus(MOD, n)
         return remainder
 
+    @classmethod
+    def gf_MI_batch(
+        cls,
+        elements: Sequence[BitVector] | None,
+        mod: BitVector,
+        n: int,
+        table: bool = False,
+    ) -> list[Self | str] | array.array[int]:
+        """Calculates multiplicative inverses of many elements of GF(2^n).
+
+        Uses Montgomery's trick: the running products of the elements are
+        inverted once, and the individual inverses are recovered from them,
+        for one inversion and 3(k-1) multiplications over k elements.
+
+        Args:
+            elements: The BitVectors to invert, or None in table mode.
+            mod: The modulus polynomial BitVector.
+            n: The integer degree n of the Galois Field GF(2^n).
+            table: If True, returns the inverses of all 2^n elements of the
+                field instead, as an array indexed by element value, with 0
+                mapped to 0.
+
+        Returns:
+            The inverses as n-bit BitVectors, in the order of elements, or the
+            inverse table. If some element has no inverse, or mod is not of
+            degree n, the list holds what gf_MI() returns for each element.
+
+        Raises:
+            ValueError: In table mode, if elements is not None, n exceeds 16
+                or mod is not an irreducible polynomial of degree n.
+        """
+        if table:
+            if elements is not None:
+                raise ValueError("elements must be None in table mode")
+            if not 0 < n <= _GF_TABLE_MAX_BITS:
+                raise ValueError(
+                    f"table mode needs 0 < n <= {_GF_TABLE_MAX_BITS}, not {n}"
+                )
+            return array.array("H", GF2n(mod, n)._inv)
+        if elements is None:
+            raise ValueError("elements are required unless in table mode")
+        m = int(mod)
+        values = [_cldivmod(int(e), m)[1] for e in elements] if m else []
+        if not values:
+            return [e.gf_MI(mod, n) for e in elements]
+        # prefix[i] is the product of values[0] up to values[i].
+        prefix = [values[0]]
+        for value in itertools.islice(values, 1, None):
+            prefix.append(_cldivmod(_clmul(prefix[-1], value), m)[1])
+        g, inverse = _clxgcd(prefix[-1], m)
+        if g != 1 or len(mod) != n + 1 or m.bit_length() != n + 1:
+            return [e.gf_MI(mod, n) for e in elements]
+        inverses = [0] * len(values)
+        for i in range(len(values) - 1, 0, -1):
+            inverses[i] = _cldivmod(_clmul(inverse, prefix[i - 1]), m)[1]
+            inverse = _cldivmod(_clmul(inverse, values[i]), m)[1]
+        inverses[0] = _cldivmod(inverse, m)[1]
+        return [cls._from_value(value, n) for value in inverses]
+
     def runs(self) -> list[str]:
         """Extracts contiguous runs of identical bits ('0's and '1's).
 
@@ -1754,3 +3128,587 @@ class BitVector:
         """
         intvals_for_circular_shifts = [int(self << i) for i in range(len(self))]
         return self.__class__(intVal=min(intvals_for_circular_shifts), size=len(self))
+
+
+class PermutationPlan:
+    """A permutation list compiled once for repeated permute and unpermute calls.
+
+    Output bit i of the permutation is source bit permute_list[i], so every
+    bit moves by the displacement i - permute_list[i]. Bits that share a
+    displacement are moved together with one mask and one shift of the whole
+    vector held as an integer, which suits shifts, rotations and other lists
+    with only a handful of displacements. Lists with more of them, including
+    the DES initial permutation and P-box as well as random permutations, are
+    applied with an operator.itemgetter over the vector's text instead, which
+    is linear. Either way the list is checked and compiled only once.
+
+    Attributes:
+        size: The number of bits produced by permute(), len(permute_list).
+        max_index: The largest source index, -1 for an empty list.
+    """
+
+    __slots__ = ("_forward", "_indices", "_inverse", "max_index", "size")
+
+    def __init__(self, permute_list: Sequence[int] | Any) -> None:
+        """Compiles a permutation list.
+
+        Args:
+            permute_list: A sequence of non-negative bit indices; output bit i
+                is taken from source bit permute_list[i]. Indices may repeat.
+
+        Raises:
+            ValueError: If an index is negative.
+        """
+        indices = [operator.index(i) for i in permute_list]
+        if min(indices, default=0) < 0:
+            raise ValueError("Bad permutation index")
+        self.size = len(indices)
+        self.max_index = max(indices, default=-1)
+        self._indices = indices
+        self._forward = self._compile(zip(indices, range(self.size)), indices)
+        # The inverse is compiled on the first unpermute() call.
+        self._inverse: Any = None
+
+    def _compile(
+        self, moves: Iterator[tuple[int, int]], gather: list[int] | None
+    ) -> Any:
+        """Chooses the cheaper way to perform a set of bit moves.
+
+        Args:
+            moves: (source, destination) bit position pairs.
+            gather: The source index of each output bit, or None if some output
+                bit has no single source.
+
+        Returns:
+            A list of (shift, mask) steps, one per displacement; or, when there
+            are too many displacements, an itemgetter over the source text if
+            gather is given, else the tuple of source-to-destination indices.
+        """
+        groups: dict[int, list[int]] = {}
+        for src, dst in moves:
+            groups.setdefault(dst - src, []).append(src)
+        limit = max(1, self.size >> 6) * _PLAN_SHIFTS_PER_WORD
+        if len(groups) <= min(limit, _PLAN_MAX_SHIFTS):
+            steps = []
+            for shift, sources in groups.items():
+                mask = bytearray((max(sources) >> 3) + 1)
+                for src in sources:
+                    mask[src >> 3] |= 1 << (src & 7)
+                steps.append((shift, int.from_bytes(mask, "little")))
+            return steps
+        if gather is not None:
+            # The extra -1 keeps itemgetter returning a tuple for one index.
+            return operator.itemgetter(*gather, -1)
+        return tuple(self._indices)
+
+    def _apply(self, bv: BitVector, inverse: bool) -> int:
+        """Moves the bits of bv through the plan or its inverse.
+
+        Args:
+            bv: The vector to read, already checked against the plan.
+            inverse: If True, undo the permutation instead of applying it.
+
+        Returns:
+            The permuted bits as an integer whose bit k is output bit k.
+        """
+        if not inverse:
+            op = self._forward
+        else:
+            if self._inverse is None:
+                moves = zip(range(self.size), self._indices)
+                if len(set(self._indices)) == self.size > self.max_index:
+                    gather = [0] * self.size
+                    for i, idx in enumerate(self._indices):
+                        gather[idx] = i
+                    self._inverse = self._compile(moves, gather)
+                else:
+                    self._inverse = self._compile(moves, None)
+            op = self._inverse
+        if isinstance(op, operator.itemgetter):
+            return _int_from_bits("".join(op(str(bv))[:-1]))
+        if isinstance(op, tuple):
+            text = str(bv)
+            digits = bytearray(b"0") * self.size
+            for i, idx in enumerate(op):
+                if text[i] == "1":
+                    digits[idx] = 0x31
+            return _int_from_bits(bytes(digits))
+        value = bv._bits_as_int(0, bv._size)
+        out = 0
+        for shift, mask in op:
+            if shift >= 0:
+                out |= (value & mask) << shift
+            else:
+                out |= (value & mask) >> -shift
+        return out
+
+
+class GF2n:
+    """The finite field GF(2^n) for a fixed irreducible modulus polynomial.
+
+    Elements are polynomials of degree below n, given either as integers or
+    as BitVectors whose int() value is the polynomial, as for
+    gf_multiply_modular() and gf_MI(). Results have the type of the first
+    argument; BitVector results are n bits long.
+
+    For n up to 16 the constructor finds a generator of the multiplicative
+    group and tabulates its powers (antilog), their logarithms and every
+    inverse, so a product is two lookups and an addition. Larger fields
+    multiply with _clmul and reduce by Barrett's method: with
+    mu = x^(2n) // mod precomputed, the remainder of a product c is
+    c ^ mod * ((c >> n) * mu >> n), two carry-less products and no division.
+
+    Attributes:
+        n: The degree of the field.
+        modulus: The modulus polynomial as an integer.
+    """
+
+    __slots__ = ("_exp", "_inv", "_log", "_mu", "modulus", "n")
+
+    def __init__(self, mod: BitVector | int, n: int) -> None:
+        """Sets up arithmetic modulo an irreducible polynomial of degree n.
+
+        Args:
+            mod: The modulus polynomial, as a BitVector or an integer.
+            n: The degree of the field.
+
+        Raises:
+            ValueError: If n is not positive, or mod is not an irreducible
+                polynomial of degree n.
+        """
+        if n < 1:
+            raise ValueError("n must be positive")
+        modulus = int(mod)
+        if modulus.bit_length() != n + 1:
+            raise ValueError(f"modulus must be a polynomial of degree {n}")
+        self.n = n
+        self.modulus = modulus
+        self._mu = _cldivmod(1 << (2 * n), modulus)[0]
+        if not self._is_irreducible():
+            raise ValueError("modulus is not irreducible")
+        self._exp: list[int] | None = None
+        self._log: list[int] | None = None
+        self._inv: list[int] | None = None
+        if n <= _GF_TABLE_MAX_BITS:
+            self._build_tables()
+
+    def _reduce(self, c: int) -> int:
+        """Reduces a polynomial of degree below 2n modulo the modulus.
+
+        Args:
+            c: The polynomial, such as a product of two elements.
+
+        Returns:
+            The remainder of c divided by the modulus.
+        """
+        n = self.n
+        return c ^ _clmul(_clmul(c >> n, self._mu) >> n, self.modulus)
+
+    def _mul(self, a: int, b: int) -> int:
+        """Multiplies two reduced elements held as integers.
+
+        Args:
+            a: The first element.
+            b: The second element.
+
+        Returns:
+            The product in the field.
+        """
+        if self._exp is not None:
+            if not a or not b:
+                return 0
+            return self._exp[self._log[a] + self._log[b]]
+        return self._reduce(_clmul(a, b))
+
+    def _pow(self, a: int, e: int) -> int:
+        """Raises a reduced element to a non-negative power by repeated squaring.
+
+        Args:
+            a: The element.
+            e: The non-negative exponent.
+
+        Returns:
+            a to the power e in the field.
+        """
+        result = 1
+        while e:
+            if e & 1:
+                result = self._mul(result, a)
+            a = self._mul(a, a)
+            e >>= 1
+        return result
+
+    def _is_irreducible(self) -> bool:
+        """Runs Rabin's irreducibility test on the modulus.
+
+        Returns:
+            True if x^(2^n) = x modulo the modulus and, for every prime p
+            dividing n, x^(2^(n/p)) - x shares no factor with the modulus.
+        """
+        n = self.n
+        cofactors = {n // p for p in _prime_factors(n)}
+        x = _cldivmod(2, self.modulus)[1]
+        power = x
+        for i in range(1, n + 1):
+            power = self._reduce(_clmul(power, power))
+            if i in cofactors:
+                a, b = self.modulus, power ^ x
+                while b:
+                    a, b = b, _cldivmod(a, b)[1]
+                if a != 1:
+                    return False
+        return power == x
+
+    def _build_tables(self) -> None:
+        """Tabulates powers of a generator, their logarithms and all inverses."""
+        order = (1 << self.n) - 1
+        exponents = [order // p for p in _prime_factors(order)]
+        g = 2
+        while any(self._pow(g, e) == 1 for e in exponents):
+            g += 1
+        # Multiplying by g is a few shift-and-reduce steps, one per bit of g.
+        top = 1 << self.n
+        steps = [(g >> j) & 1 for j in range(g.bit_length())]
+        exp = [1] * (2 * order)
+        log = [0] * (order + 1)
+        x = 1
+        for i in range(order):
+            exp[i] = exp[i + order] = x
+            log[x] = i
+            product = 0
+            for bit in steps:
+                if bit:
+                    product ^= x
+                x <<= 1
+                if x & top:
+                    x ^= self.modulus
+            x = product
+        inv = [0] * (order + 1)
+        for x in range(1, order + 1):
+            inv[x] = exp[order - log[x]]
+        self._exp, self._log, self._inv = exp, log, inv
+
+    def _element(self, x: BitVector | int) -> int:
+        """Converts a field element to its integer form.
+
+        Args:
+            x: A BitVector or integer holding a polynomial of degree below n.
+
+        Returns:
+            The element as an integer.
+
+        Raises:
+            ValueError: If x is not an element of the field.
+        """
+        value = int(x) if isinstance(x, BitVector) else operator.index(x)
+        if value < 0 or value.bit_length() > self.n:
+            raise ValueError(f"{value} is not an element of GF(2^{self.n})")
+        return value
+
+    def _result(self, value: int, like: BitVector | int) -> BitVector | int:
+        """Returns a field element in the same form as a given argument.
+
+        Args:
+            value: The element as an integer.
+            like: An argument; a BitVector yields an n-bit BitVector.
+
+        Returns:
+            The element as an n-bit instance of like's class, or as an integer.
+        """
+        if not isinstance(like, BitVector):
+            return value
+        return like._from_value(value, self.n)
+
+    def _inverse(self, a: int) -> int:
+        """Inverts a nonzero reduced element.
+
+        Without tables this is the extended Euclidean algorithm on the
+        polynomials, cancelling the leading term of the longer remainder at
+        each step while tracking the cofactor of a.
+
+        Args:
+            a: The element.
+
+        Returns:
+            The multiplicative inverse of a.
+
+        Raises:
+            ZeroDivisionError: If a is zero.
+        """
+        if not a:
+            raise ZeroDivisionError(f"0 has no inverse in GF(2^{self.n})")
+        if self._inv is not None:
+            return self._inv[a]
+        u, v = a, self.modulus
+        g1, g2 = 1, 0
+        while u != 1:
+            j = u.bit_length() - v.bit_length()
+            if j < 0:
+                u, v, g1, g2, j = v, u, g2, g1, -j
+            u ^= v << j
+            g1 ^= g2 << j
+        return g1
+
+    def mul(self, a: BitVector | int, b: BitVector | int) -> BitVector | int:
+        """Multiplies two field elements.
+
+        Args:
+            a: The first element.
+            b: The second element.
+
+        Returns:
+            The product, in the form of a.
+
+        Raises:
+            ValueError: If a or b is not an element of the field.
+        """
+        return self._result(self._mul(self._element(a), self._element(b)), a)
+
+    def inv(self, a: BitVector | int) -> BitVector | int:
+        """Returns the multiplicative inverse of a field element.
+
+        Args:
+            a: The nonzero element.
+
+        Returns:
+            The inverse, in the form of a.
+
+        Raises:
+            ValueError: If a is not an element of the field.
+            ZeroDivisionError: If a is zero.
+        """
+        return self._result(self._inverse(self._element(a)), a)
+
+    def pow(self, a: BitVector | int, e: int) -> BitVector | int:
+        """Raises a field element to an integer power.
+
+        Args:
+            a: The element.
+            e: The exponent; a negative exponent raises the inverse of a.
+
+        Returns:
+            a to the power e, in the form of a.
+
+        Raises:
+            ValueError: If a is not an element of the field.
+            ZeroDivisionError: If a is zero and e is negative.
+        """
+        value = self._element(a)
+        if e < 0:
+            value, e = self._inverse(value), -e
+        if self._exp is not None and value:
+            order = len(self._log) - 1
+            return self._result(self._exp[self._log[value] * e % order], a)
+        return self._result(self._pow(value, e), a)
+
+    def mul_many(
+        self,
+        xs: Sequence[BitVector | int],
+        ys: Sequence[BitVector | int] | BitVector | int,
+    ) -> list[BitVector | int]:
+        """Multiplies field elements pairwise, or all by one element.
+
+        Args:
+            xs: The first factors.
+            ys: The second factors, as many as xs, or a single element that
+                multiplies every element of xs.
+
+        Returns:
+            The products, each in the form of its element of xs.
+
+        Raises:
+            ValueError: If an argument is not an element of the field, or xs
+                and ys differ in length.
+        """
+        if isinstance(ys, (BitVector, int)):
+            y = self._element(ys)
+            return [self._result(self._mul(self._element(x), y), x) for x in xs]
+        return [
+            self._result(self._mul(self._element(x), self._element(y)), x)
+            for x, y in zip(xs, ys, strict=True)
+        ]
+
+    def inv_many(self, xs: Sequence[BitVector | int]) -> list[BitVector | int]:
+        """Inverts a sequence of field elements.
+
+        Without tables this uses Montgomery's trick, as gf_MI_batch() does, so
+        only the product of all the elements is inverted.
+
+        Args:
+            xs: The nonzero elements.
+
+        Returns:
+            The inverses, each in the form of its element of xs.
+
+        Raises:
+            ValueError: If an argument is not an element of the field.
+            ZeroDivisionError: If an element is zero.
+        """
+        values = [self._element(x) for x in xs]
+        if self._inv is not None or not values:
+            return [self._result(self._inverse(a), x) for a, x in zip(values, xs)]
+        prefix = [values[0]]
+        for value in itertools.islice(values, 1, None):
+            prefix.append(self._mul(prefix[-1], value))
+        inverse = self._inverse(prefix[-1])
+        inverses = [0] * len(values)
+        for i in range(len(values) - 1, 0, -1):
+            inverses[i] = self._mul(inverse, prefix[i - 1])
+            inverse = self._mul(inverse, values[i])
+        inverses[0] = inverse
+        return [self._result(a, x) for a, x in zip(inverses, xs)]
+
+
+def _prime_factors(n: int) -> list[int]:
+    """Returns the distinct prime factors of a positive integer by trial division.
+
+    Args:
+        n: The integer to factor.
+
+    Returns:
+        The distinct primes dividing n, in increasing order.
+    """
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+class MappedBitVector(BitVector):
+    """A BitVector whose storage words live in a memory-mapped file.
+
+    The file holds the native storage bytes, the layout written by
+    write_to_file(fp, bit_order="lsb"). The operating system pages the words
+    in and out as they are touched, so vectors larger than RAM can be used.
+    Processes that open the same file with mode "r" share one read-only copy
+    of its pages.
+
+    Bit access, in-place boolean operators, shifts and rotations, reset(),
+    reverse_inplace(), count_bits() and the bit scans work on the mapping in
+    place. Operations that return a new vector, or that change the
+    length, work on private in-memory storage and leave the file unchanged;
+    the file stays mapped until close().
+    """
+
+    __slots__ = ("_mmap",)
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initializes an unmapped vector; see BitVector.__init__.
+
+        Args:
+            **kwargs: The keyword arguments accepted by BitVector.__init__.
+        """
+        super().__init__(**kwargs)
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    def open(
+        cls, path: str | os.PathLike[str], nbits: int | None = None, mode: str = "r"
+    ) -> Self:
+        """Maps a file of storage words as a bit vector.
+
+        Args:
+            path: The path of the file to map.
+            nbits: The number of bits in the vector. Defaults to all bits in
+                the file; required with mode "w+".
+            mode: "r" for read-only access, "r+" to write changes to the
+                file, "w+" to create or overwrite the file with nbits zero
+                bits, or "c" for copy-on-write changes that never reach the
+                file.
+
+        Returns:
+            A new MappedBitVector over the file's contents.
+
+        Raises:
+            ValueError: If mode is unknown, if nbits is missing or below 1 for
+                mode "w+" or exceeds the file, or if the file is empty or its
+                size is not a whole number of 64-bit words.
+        """
+        if mode not in _MMAP_ACCESS:
+            raise ValueError("mode must be one of 'r', 'r+', 'w+' or 'c'")
+        if mode == "w+" and nbits is None:
+            raise ValueError("nbits is required to create a file")
+        if mode == "w+" and nbits < 1:
+            # An empty file cannot be mapped.
+            raise ValueError("nbits must be at least 1 to create a file")
+        with open(path, {"r": "rb", "c": "rb"}.get(mode, mode + "b")) as fp:
+            if mode == "w+":
+                fp.truncate(((nbits + 63) // 64) * 8)
+            mapping = mmap.mmap(fp.fileno(), 0, access=_MMAP_ACCESS[mode])
+        try:
+            bv = cls.frombuffer(mapping, nbits, "lsb", share=True)
+        except ValueError:
+            mapping.close()
+            raise
+        bv._mmap = mapping
+        return bv
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Returns the slot values used by copy.copy() and pickle.
+
+        Copies hold their words in memory and do not share the mapping.
+
+        Returns:
+            A (None, slots) state tuple for object.__reduce_ex__.
+        """
+        state = super().__getstate__()
+        state[1]["_mmap"] = None
+        return state
+
+    def flush(self) -> None:
+        """Writes changed pages of the mapping back to the file."""
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """Flushes and unmaps the file, leaving an empty in-memory vector.
+
+        The mapping is closed even if a length change has already moved the
+        storage into memory.
+
+        Raises:
+            BufferError: If views of the storage are still exported.
+        """
+        mapping = self._mmap
+        if mapping is None:
+            return
+        if self._exports:
+            raise BufferError("cannot close a BitVector that is exporting buffers")
+        mapping.flush()
+        vector = self.vector
+        if isinstance(vector, memoryview):
+            vector.release()
+        try:
+            mapping.close()
+        except BufferError:
+            if isinstance(vector, memoryview):
+                words = memoryview(mapping).cast(ARRAY_TYPE)
+                self.vector = words[: (self._size + 63) // 64]
+            raise
+        self._mmap = None
+        self._rank_index = None
+        self.vector = array.array(ARRAY_TYPE)
+        self._size = 0
+
+    def __enter__(self) -> Self:
+        """Returns self so the mapping can be used in a with statement.
+
+        Returns:
+            This MappedBitVector instance.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the mapping when leaving a with statement.
+
+        Args:
+            *exc_info: The exception details, if the block raised.
+        """
+        self.close()
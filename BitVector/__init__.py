@@ -4,7 +4,20 @@ This package provides a memory-efficient packed representation of bit arrays
 and bit vectors using standard library array.
 """
 
-from BitVector.BitVector import BitVector, __version__
+from BitVector.BitVector import (
+    BitVector,
+    GF2n,
+    MappedBitVector,
+    PermutationPlan,
+    __version__,
+)
 from BitVector.protocol import BitVectorProtocol
 
-__all__ = ["__version__", "BitVector", "BitVectorProtocol"]
+__all__ = [
+    "__version__",
+    "BitVector",
+    "BitVectorProtocol",
+    "GF2n",
+    "MappedBitVector",
+    "PermutationPlan",
+]
@@ -19,11 +19,21 @@ class BitVectorProtocol(Protocol):
     def __xor__(self, other: Self) -> Self: ...
     def __and__(self, other: Self) -> Self: ...
     def __or__(self, other: Self) -> Self: ...
+    def __ixor__(self, other: Self) -> Self: ...
+    def __iand__(self, other: Self) -> Self: ...
+    def __ior__(self, other: Self) -> Self: ...
     def __invert__(self) -> Self: ...
     def __add__(self, other: Self) -> Self: ...
     def __iadd__(self, other: Self) -> Self: ...
+    def append(self, bit: int) -> None: ...
+    def extend(self, bits: Any) -> None: ...
+    def append_int(self, value: int, nbits: int) -> None: ...
     def __lshift__(self, n: int) -> Self: ...
     def __rshift__(self, n: int) -> Self: ...
+    def shift_left(self, n: int) -> Self: ...
+    def shift_right(self, n: int) -> Self: ...
+    def shifted_left(self, n: int) -> Self: ...
+    def shifted_right(self, n: int) -> Self: ...
     def __getitem__(self, pos: int | slice | Any) -> Any: ...
     def __setitem__(self, pos: int | slice | Any, item: int | Self | Any) -> Any: ...
     def __len__(self) -> int: ...
@@ -38,8 +48,28 @@ class BitVectorProtocol(Protocol):
     def __gt__(self, other: object) -> bool: ...
     def __ge__(self, other: object) -> bool: ...
     def __contains__(self, otherBitVec: Self) -> bool: ...
+    def find(self, pattern: Self, start: int = 0, end: int | None = None) -> int: ...
+    def rfind(self, pattern: Self, start: int = 0, end: int | None = None) -> int: ...
+    def find_all(
+        self, pattern: Self, start: int = 0, end: int | None = None
+    ) -> list[int]: ...
+    def count_occurrences(
+        self, pattern: Self, start: int = 0, end: int | None = None
+    ) -> int: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
     def count_bits(self) -> int: ...
     def count_bits_sparse(self) -> int: ...
     def next_set_bit(self, from_index: int = 0) -> int: ...
+    def next_clear_bit(self, from_index: int = 0) -> int: ...
+    def prev_set_bit(self, from_index: int) -> int: ...
+    def prev_clear_bit(self, from_index: int) -> int: ...
+    def iter_set_bits(self) -> Iterator[int]: ...
+    def iter_clear_bits(self) -> Iterator[int]: ...
+    def rank1(self, i: int) -> int: ...
+    def rank0(self, i: int) -> int: ...
+    def select1(self, k: int) -> int: ...
+    def select0(self, k: int) -> int: ...
+    def reverse(self) -> Self: ...
+    def reverse_inplace(self) -> Self: ...
     def is_power_of_2(self) -> bool: ...
     def is_power_of_2_sparse(self) -> bool: ...
@@ -660,12 +660,11 @@ print("bit_array * multi_inv: " + str(products))
 
 #    print("\nMultiplicative inverses in GF(2^8) with "  + \
 #                      "modulus polynomial x^8 + x^4 + x^3 + x + 1:")
-#    print("\n(This may take a few seconds)\n")
 #    mod = BitVector( bitstring = '100011011' )
 #    n = 8
 #    bitarrays = [BitVector(intVal=x, size=n) for x in range(1,2**8)]
-#    mi_list = [x.gf_MI(mod,n) for x in bitarrays]
-#    mi_str_list = [str(x.gf_MI(mod,n)) for x in bitarrays]
+#    mi_list = BitVector.gf_MI_batch(bitarrays, mod, n)
+#    mi_str_list = [str(x) for x in mi_list]
 #    print("\nMultiplicative Inverses:\n\n" + str(mi_str_list))
 #    products = [ str(bitarrays[i].gf_multiply_modular(mi_list[i], mod, n)) \
 #                        for i in range(len(bitarrays)) ]
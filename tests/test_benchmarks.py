@@ -7,7 +7,9 @@ Note:
 """
 
 import copy
+import io
 import operator
+import random
 
 import pytest
 
@@ -65,6 +67,74 @@ def test_bench_init_rawbytes(benchmark):
     benchmark(BitVector.BitVector, rawbytes=data)
 
 
+# Input sizes (in bytes of constructor input) for the throughput benchmarks.
+# Inputs of 64 MB and vectors of 100 Mbit are marked "large", which the
+# default run deselects; run them with -m large.
+_THROUGHPUT_SIZES = [
+    pytest.param(1 << 10, id="1KB"),
+    pytest.param(1 << 20, id="1MB"),
+    pytest.param(64 << 20, id="64MB", marks=pytest.mark.large),
+]
+
+_CONSTRUCTOR_INPUTS = {
+    "bitstring": lambda nbytes: "01" * (nbytes // 2),
+    "bitlist": lambda nbytes: b"\x01\x00" * (nbytes // 2),
+    "hexstring": lambda nbytes: "a5" * (nbytes // 2),
+    "rawbytes": lambda nbytes: b"\xa5" * nbytes,
+}
+
+
+def _record_throughput(benchmark, nbytes):
+    """Stores the mean throughput of a finished benchmark in MB/s."""
+    if benchmark.stats is not None:
+        benchmark.extra_info["MB/s"] = nbytes / benchmark.stats.stats.mean / 1e6
+
+
+@pytest.mark.parametrize("nbytes", _THROUGHPUT_SIZES)
+@pytest.mark.parametrize("kind", list(_CONSTRUCTOR_INPUTS))
+def test_bench_init_throughput(benchmark, kind, nbytes):
+    data = _CONSTRUCTOR_INPUTS[kind](nbytes)
+    benchmark(BitVector.BitVector, **{kind: data})
+    _record_throughput(benchmark, nbytes)
+
+
+@pytest.mark.parametrize("nbytes", _THROUGHPUT_SIZES)
+@pytest.mark.parametrize("bit_order", ["msb", "lsb"])
+def test_bench_frombuffer(benchmark, bit_order, nbytes):
+    data = bytearray(b"\xa5" * nbytes)
+    benchmark(BitVector.BitVector.frombuffer, data, bit_order=bit_order)
+    _record_throughput(benchmark, nbytes)
+
+
+@pytest.mark.parametrize("nbytes", _THROUGHPUT_SIZES)
+def test_bench_frombuffer_share(benchmark, nbytes):
+    data = bytearray(nbytes)
+    benchmark(BitVector.BitVector.frombuffer, data, bit_order="lsb", share=True)
+
+
+@pytest.mark.parametrize("nbytes", _THROUGHPUT_SIZES)
+def test_bench_write_to_memory_stream(benchmark, nbytes):
+    bv = BitVector.BitVector(rawbytes=b"\xa5" * nbytes)
+
+    def target():
+        bv.write_to_file(io.BytesIO())
+
+    benchmark(target)
+    _record_throughput(benchmark, nbytes)
+
+
+@pytest.mark.parametrize("nbytes", _THROUGHPUT_SIZES)
+def test_bench_fromfile_memory_stream(benchmark, nbytes):
+    stream = io.BytesIO(b"\xa5" * nbytes)
+
+    def target():
+        stream.seek(0)
+        return BitVector.BitVector.fromfile(stream)
+
+    benchmark(target)
+    _record_throughput(benchmark, nbytes)
+
+
 # --- Bitwise Operation Benchmarks ---
 
 
@@ -80,6 +150,22 @@ def test_bench_bitwise_xor(benchmark, sample_bv1, sample_bv2):
     benchmark(operator.xor, sample_bv1, sample_bv2)
 
 
+@pytest.mark.parametrize("op", [operator.and_, operator.or_, operator.xor])
+def test_bench_bitwise_mask_1mbit(benchmark, op):
+    bitmap = BitVector.BitVector(rawbytes=b"\xa5" * (1 << 17))
+    mask = BitVector.BitVector(intVal=0xF0F0F0F0F0F0F0F0, size=64)
+    benchmark(op, bitmap, mask)
+    _record_throughput(benchmark, 1 << 17)
+
+
+@pytest.mark.parametrize("op", [operator.iand, operator.ior, operator.ixor])
+def test_bench_bitwise_inplace_1mbit(benchmark, op):
+    bitmap = BitVector.BitVector(rawbytes=b"\xa5" * (1 << 17))
+    mask = BitVector.BitVector(intVal=0xF0F0F0F0F0F0F0F0, size=64)
+    benchmark(op, bitmap, mask)
+    _record_throughput(benchmark, 1 << 17)
+
+
 def test_bench_invert(benchmark, sample_bv1):
     benchmark(operator.invert, sample_bv1)
 
@@ -104,6 +190,31 @@ def test_bench_iadd(benchmark, sample_bv1, sample_bv2):
     benchmark.pedantic(target, setup=setup, rounds=100)
 
 
+def test_bench_append_small_chunks(benchmark):
+    chunk = BitVector.BitVector(bitstring="1011001")
+
+    def target():
+        bv = BitVector.BitVector(size=0)
+        for _ in range(10_000):
+            bv += chunk
+
+    benchmark(target)
+
+
+@pytest.mark.parametrize("method", ["append", "append_int"])
+def test_bench_append_bits(benchmark, method):
+    def target():
+        bv = BitVector.BitVector(size=0)
+        if method == "append":
+            for i in range(10_000):
+                bv.append(i & 1)
+        else:
+            for i in range(10_000):
+                bv.append_int(i, 16)
+
+    benchmark(target)
+
+
 # --- Shifting and Permutation Benchmarks ---
 
 
@@ -115,18 +226,33 @@ def test_bench_shift_right(benchmark, sample_bv1):
     benchmark(operator.rshift, sample_bv1, 10)
 
 
-def test_bench_ilshift(benchmark, sample_bv1):
+# (vector size in bits, rotation count) for the in-place rotation benchmarks.
+_ROTATIONS = [
+    pytest.param(1000, 10, id="1k-by-10"),
+    pytest.param(1000, 999, id="1k-by-999"),
+    pytest.param(1 << 20, 500_000, id="1M-by-500k"),
+    pytest.param(1 << 20, 10**12 + 7, id="1M-by-1e12"),
+]
+
+
+@pytest.mark.parametrize(("nbits", "n"), _ROTATIONS)
+def test_bench_ilshift(benchmark, nbits, n):
+    source = BitVector.BitVector(rawbytes=b"\x5a" * (nbits // 8))
+
     def _run():
-        bv = sample_bv1[:]
-        bv <<= 10
+        bv = source[:]
+        bv <<= n
 
     benchmark(_run)
 
 
-def test_bench_irshift(benchmark, sample_bv1):
+@pytest.mark.parametrize(("nbits", "n"), _ROTATIONS)
+def test_bench_irshift(benchmark, nbits, n):
+    source = BitVector.BitVector(rawbytes=b"\x5a" * (nbits // 8))
+
     def _run():
-        bv = sample_bv1[:]
-        bv >>= 10
+        bv = source[:]
+        bv >>= n
 
     benchmark(_run)
 
@@ -136,6 +262,29 @@ def test_bench_permute(benchmark, sample_bv1):
     benchmark(sample_bv1.permute, perm)
 
 
+_DES_IP = [57, 49, 41, 33, 25, 17, 9, 1, 59, 51, 43, 35, 27, 19, 11, 3]
+_DES_IP += [61, 53, 45, 37, 29, 21, 13, 5, 63, 55, 47, 39, 31, 23, 15, 7]
+_DES_IP += [56, 48, 40, 32, 24, 16, 8, 0, 58, 50, 42, 34, 26, 18, 10, 2]
+_DES_IP += [60, 52, 44, 36, 28, 20, 12, 4, 62, 54, 46, 38, 30, 22, 14, 6]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_bench_permute_des_ip(benchmark, compiled):
+    bv = BitVector.BitVector(intVal=0x0123456789ABCDEF, size=64)
+    perm = BitVector.PermutationPlan(_DES_IP) if compiled else _DES_IP
+    benchmark(bv.permute, perm)
+
+
+@pytest.mark.parametrize("nbits", [1 << 10, 1 << 20])
+def test_bench_permute_plan_random(benchmark, nbits):
+    perm = list(range(nbits))
+    random.Random(3).shuffle(perm)
+    plan = BitVector.PermutationPlan(perm)
+    bv = BitVector.BitVector(rawbytes=random.Random(4).randbytes(nbits // 8))
+    benchmark(bv.permute, plan)
+    _record_throughput(benchmark, nbits // 8)
+
+
 # --- Slicing, Indexing, and Conversion Benchmarks ---
 
 
@@ -143,6 +292,21 @@ def test_bench_slice(benchmark, sample_bv1):
     benchmark(operator.getitem, sample_bv1, slice(100, 900))
 
 
+@pytest.mark.parametrize(
+    "sl",
+    [
+        pytest.param(slice(3, (1 << 20) + 3), id="contiguous"),
+        pytest.param(slice(3, (1 << 21) + 3, 2), id="step2"),
+        pytest.param(slice(3, None, 1000), id="step1000"),
+        pytest.param(slice((1 << 20) + 2, 2, -1), id="reversed"),
+    ],
+)
+def test_bench_slice_1mbit(benchmark, sl):
+    bv = BitVector.BitVector(rawbytes=b"\xa5\x3c" * ((1 << 17) + 4))
+    benchmark(operator.getitem, bv, sl)
+    _record_throughput(benchmark, 1 << 17)
+
+
 def test_bench_getitem(benchmark, sample_bv1):
     benchmark(operator.getitem, sample_bv1, 500)
 
@@ -151,6 +315,35 @@ def test_bench_count_bits(benchmark, sample_bv1):
     benchmark(sample_bv1.count_bits)
 
 
+@pytest.mark.large
+def test_bench_count_bits_100mbit(benchmark):
+    bv = BitVector.BitVector(rawbytes=b"\x5a\x01" * (100_000_000 // 16))
+    benchmark(bv.count_bits)
+    _record_throughput(benchmark, 100_000_000 // 8)
+
+
+@pytest.mark.large
+def test_bench_hamming_distance_100mbit(benchmark):
+    bv1 = BitVector.BitVector(rawbytes=b"\x5a\x01" * (100_000_000 // 16))
+    bv2 = ~bv1
+    benchmark(bv1.hamming_distance, bv2)
+    _record_throughput(benchmark, 100_000_000 // 8)
+
+
+@pytest.mark.parametrize("nbits", [4096, 1 << 20])
+def test_bench_init_intval(benchmark, nbits):
+    value = (1 << nbits) // 3
+    benchmark(lambda: BitVector.BitVector(intVal=value, size=nbits))
+    _record_throughput(benchmark, nbits // 8)
+
+
+@pytest.mark.parametrize("nbits", [4096, 1 << 20])
+def test_bench_int_round_trip(benchmark, nbits):
+    bv = BitVector.BitVector(intVal=(1 << nbits) // 3, size=nbits)
+    benchmark(int, bv)
+    _record_throughput(benchmark, nbits // 8)
+
+
 def test_bench_int(benchmark, sample_bv1):
     benchmark(int, sample_bv1)
 
@@ -186,10 +379,63 @@ def test_bench_is_power_of_2_sparse(benchmark, sample_bv1):
     benchmark(sample_bv1.is_power_of_2_sparse)
 
 
+def test_bench_rank_of_bit_set_at_index_10mbit(benchmark):
+    bv = BitVector.BitVector(rawbytes=b"\x5a\x01" * (10_000_000 // 16))
+    benchmark(bv.rank_of_bit_set_at_index, 9_999_009)
+
+
+@pytest.mark.parametrize("method", ["rank1", "rank0", "select1", "select0"])
+def test_bench_rank_select_10mbit(benchmark, method):
+    bv = BitVector.BitVector(rawbytes=b"\x5a\x01" * (10_000_000 // 16))
+    query = getattr(bv, method)
+    query(0)
+    benchmark(query, 1_234_567)
+
+
 def test_bench_next_set_bit(benchmark, sample_bv1):
     benchmark(sample_bv1.next_set_bit, 10)
 
 
+@pytest.fixture(scope="module")
+def sparse_bv_100mbit():
+    data = bytearray(100_000_000 // 8)
+    for i in range(0, 100_000_000, 997):
+        data[i >> 3] |= 0x80 >> (i & 7)
+    return BitVector.BitVector(rawbytes=bytes(data))
+
+
+@pytest.mark.large
+def test_bench_next_set_bit_100mbit(benchmark, sparse_bv_100mbit):
+    benchmark(sparse_bv_100mbit.next_set_bit, 50_000_001)
+
+
+@pytest.mark.large
+def test_bench_prev_set_bit_100mbit(benchmark, sparse_bv_100mbit):
+    benchmark(sparse_bv_100mbit.prev_set_bit, 50_000_001)
+
+
+@pytest.mark.large
+def test_bench_iter_set_bits_100mbit(benchmark, sparse_bv_100mbit):
+    benchmark(lambda: sum(1 for _ in sparse_bv_100mbit.iter_set_bits()))
+    _record_throughput(benchmark, 100_000_000 // 8)
+
+
+@pytest.mark.large
+def test_bench_iter_clear_bits_100mbit(benchmark, sparse_bv_100mbit):
+    dense = ~sparse_bv_100mbit
+    benchmark(lambda: sum(1 for _ in dense.iter_clear_bits()))
+    _record_throughput(benchmark, 100_000_000 // 8)
+
+
+@pytest.mark.parametrize("method", ["iter_set_bits", "iter_clear_bits"])
+def test_bench_iter_bits_dense_1mbit(benchmark, method):
+    bv = BitVector.BitVector(rawbytes=b"\xff\xfe" * (1_000_000 // 16))
+    if method == "iter_clear_bits":
+        bv = ~bv
+    benchmark(lambda: sum(1 for _ in getattr(bv, method)()))
+    _record_throughput(benchmark, 1_000_000 // 8)
+
+
 def test_bench_rank_of_bit_set_at_index(benchmark, sample_bv1):
     # Index 101 is 1 in "01" * 500
     benchmark(sample_bv1.rank_of_bit_set_at_index, 101)
@@ -264,10 +510,33 @@ def test_bench_setitem_slice(benchmark, sample_bv1, sample_bv_small):
     benchmark.pedantic(target, setup=setup, rounds=100)
 
 
+@pytest.mark.parametrize("item", ["bitvector", "fill"])
+def test_bench_setitem_slice_1mbit(benchmark, item):
+    bv = BitVector.BitVector(size=(1 << 20) + 128)
+    rhs = (
+        BitVector.BitVector(rawbytes=b"\xa5" * (1 << 17)) if item == "bitvector" else 1
+    )
+    benchmark(operator.setitem, bv, slice(3, (1 << 20) + 3), rhs)
+    _record_throughput(benchmark, 1 << 17)
+
+
 def test_bench_contains(benchmark, sample_bv1, sample_bv_small):
     benchmark(operator.contains, sample_bv1, sample_bv_small)
 
 
+@pytest.fixture(scope="module")
+def random_bv_10mbit():
+    return BitVector.BitVector(rawbytes=random.Random(7).randbytes(10_000_000 // 8))
+
+
+@pytest.mark.parametrize("nbits", [16, 64, 1024])
+@pytest.mark.parametrize("method", ["find", "count_occurrences"])
+def test_bench_find_10mbit(benchmark, random_bv_10mbit, method, nbits):
+    pattern = random_bv_10mbit[9_000_000 : 9_000_000 + nbits]
+    benchmark(getattr(random_bv_10mbit, method), pattern)
+    _record_throughput(benchmark, 10_000_000 // 8)
+
+
 def test_bench_iter(benchmark, sample_bv1):
     benchmark(lambda: list(iter(sample_bv1)))
 
@@ -288,10 +557,41 @@ def test_bench_str(benchmark, sample_bv1):
     benchmark(str, sample_bv1)
 
 
+def test_bench_str_10mbit(benchmark):
+    bv = BitVector.BitVector(rawbytes=b"\x5a\x01" * (10_000_000 // 16))
+    benchmark(str, bv)
+    _record_throughput(benchmark, 10_000_000 // 8)
+
+
+def test_bench_write_bits_to_stream_object_10mbit(benchmark):
+    bv = BitVector.BitVector(rawbytes=b"\x5a\x01" * (10_000_000 // 16))
+
+    def target():
+        bv.write_bits_to_stream_object(io.StringIO())
+
+    benchmark(target)
+    _record_throughput(benchmark, 10_000_000 // 8)
+
+
 def test_bench_get_bitvector_in_ascii(benchmark, sample_bv1):
     benchmark(sample_bv1.get_bitvector_in_ascii)
 
 
+@pytest.mark.parametrize("nbytes", _THROUGHPUT_SIZES)
+@pytest.mark.parametrize("method", ["get_bitvector_in_ascii", "get_bitvector_in_hex"])
+def test_bench_text_output_throughput(benchmark, method, nbytes):
+    bv = BitVector.BitVector(rawbytes=b"\xa5" * nbytes)
+    benchmark(getattr(bv, method))
+    _record_throughput(benchmark, nbytes)
+
+
+@pytest.mark.parametrize("nbytes", _THROUGHPUT_SIZES)
+def test_bench_from_string_throughput(benchmark, nbytes):
+    text = "\xa5" * nbytes
+    benchmark(BitVector.BitVector.from_string, text)
+    _record_throughput(benchmark, nbytes)
+
+
 def test_bench_deepcopy(benchmark, sample_bv1):
     benchmark(copy.deepcopy, sample_bv1)
 
@@ -319,6 +619,16 @@ def test_bench_shift_right_method(benchmark, sample_bv1):
     benchmark.pedantic(target, setup=setup, rounds=100)
 
 
+@pytest.mark.parametrize("nbits", [64, 1 << 12, 1 << 20], ids=["64", "4K", "1M"])
+@pytest.mark.parametrize(
+    "method", ["shift_left", "shift_right", "shifted_left", "shifted_right"]
+)
+def test_bench_logical_shift(benchmark, method, nbits):
+    bv = BitVector.BitVector(rawbytes=random.Random(5).randbytes(nbits // 8))
+    benchmark(getattr(bv, method), 3)
+    _record_throughput(benchmark, nbits // 8)
+
+
 def test_bench_shift_left_by_one(benchmark, sample_bv1):
     def setup():
         return (copy.deepcopy(sample_bv1),), {}
@@ -382,6 +692,30 @@ def test_bench_circular_rotate_right_by_one(benchmark, sample_bv1):
 # --- Group 7: In-Place Modification & Padding Methods ---
 
 
+@pytest.mark.parametrize("method", ["pad_from_left", "pad_from_right"])
+def test_bench_pad_1mbit(benchmark, method):
+    def setup():
+        return (BitVector.BitVector(rawbytes=b"\xa5" * (1 << 17)),), {}
+
+    def target(bv):
+        getattr(bv, method)(100)
+
+    benchmark.pedantic(target, setup=setup, rounds=50)
+    _record_throughput(benchmark, 1 << 17)
+
+
+def test_bench_pad_from_left_repeated(benchmark):
+    def setup():
+        return (BitVector.BitVector(rawbytes=b"\xa5" * (1 << 10)),), {}
+
+    def target(bv):
+        for _ in range(4000):
+            bv.pad_from_left(1)
+        bv.count_bits()
+
+    benchmark.pedantic(target, setup=setup, rounds=20)
+
+
 def test_bench_pad_from_left(benchmark, sample_bv1):
     def setup():
         return (copy.deepcopy(sample_bv1),), {}
@@ -422,6 +756,13 @@ def test_bench_reverse(benchmark, sample_bv1):
     benchmark.pedantic(target, setup=setup, rounds=100)
 
 
+@pytest.mark.parametrize("method", ["reverse", "reverse_inplace"])
+def test_bench_reverse_10mbit(benchmark, random_bv_10mbit, method):
+    bv = copy.deepcopy(random_bv_10mbit)
+    benchmark(getattr(bv, method))
+    _record_throughput(benchmark, 10_000_000 // 8)
+
+
 def test_bench_set_value(benchmark, sample_bv1):
     def setup():
         return (copy.deepcopy(sample_bv1),), {}
@@ -444,11 +785,63 @@ def test_bench_gf_multiply(benchmark, gf_a, gf_b):
     benchmark(gf_a.gf_multiply, gf_b)
 
 
+@pytest.mark.parametrize("nbits", [64, 233, 4096, 65536])
+def test_bench_gf_multiply_large(benchmark, nbits):
+    rng = random.Random(6)
+    a = BitVector.BitVector(
+        intVal=rng.getrandbits(nbits) | 1 << (nbits - 1), size=nbits
+    )
+    b = BitVector.BitVector(
+        intVal=rng.getrandbits(nbits) | 1 << (nbits - 1), size=nbits
+    )
+    benchmark(a.gf_multiply, b)
+
+
+@pytest.mark.parametrize(
+    ("n", "mod"),
+    [
+        pytest.param(8, 0b100011011, id="gf8"),
+        pytest.param(16, 0x1100B, id="gf16"),
+        pytest.param(233, (1 << 233) | (1 << 74) | 1, id="gf233"),
+    ],
+)
+@pytest.mark.parametrize("method", ["mul", "inv"])
+def test_bench_gf2n(benchmark, method, n, mod):
+    field = BitVector.GF2n(mod, n)
+    x = random.Random(8).getrandbits(n) | 1
+    if method == "mul":
+        benchmark(field.mul, x, x ^ 2)
+    else:
+        benchmark(field.inv, x)
+
+
+def test_bench_gf2n_mul_many(benchmark):
+    field = BitVector.GF2n(0b100011011, 8)
+    xs = list(range(256)) * 16
+    benchmark(field.mul_many, xs, 0x57)
+
+
 def test_bench_gf_divide_by_modulus(benchmark, gf_mod):
     a = BitVector.BitVector(bitstring="11100010110001")
     benchmark(a.gf_divide_by_modulus, gf_mod, 8)
 
 
+@pytest.mark.parametrize(
+    ("n", "mod"),
+    [
+        pytest.param(8, 0b100011011, id="gf8"),
+        pytest.param(64, (1 << 64) | 0x1B, id="gf64"),
+        pytest.param(571, (1 << 571) | (1 << 10) | (1 << 5) | (1 << 2) | 1, id="b571"),
+        pytest.param(4096, (1 << 4096) | (1 << 11) | (1 << 2) | 1, id="gf4096"),
+    ],
+)
+def test_bench_gf_divide_by_modulus_large(benchmark, n, mod):
+    a = BitVector.BitVector(
+        intVal=random.Random(9).getrandbits(2 * n) | 1 << (2 * n - 1), size=2 * n
+    )
+    benchmark(a.gf_divide_by_modulus, BitVector.BitVector(intVal=mod), n)
+
+
 def test_bench_gf_multiply_modular(benchmark, gf_a, gf_b, gf_mod):
     benchmark(gf_a.gf_multiply_modular, gf_b, gf_mod, 8)
 
@@ -458,6 +851,15 @@ def test_bench_gf_mi(benchmark, gf_mod):
     benchmark(a.gf_MI, gf_mod, 8)
 
 
+def test_bench_gf_mi_batch(benchmark, gf_mod):
+    elements = [BitVector.BitVector(intVal=x, size=8) for x in range(1, 256)]
+    benchmark(BitVector.BitVector.gf_MI_batch, elements, gf_mod, 8)
+
+
+def test_bench_gf_mi_batch_table(benchmark, gf_mod):
+    benchmark(BitVector.BitVector.gf_MI_batch, None, gf_mod, 8, table=True)
+
+
 def test_bench_multiplicative_inverse(benchmark):
     bv_mod = BitVector.BitVector(intVal=32)
     bv_has_mi = BitVector.BitVector(intVal=17)
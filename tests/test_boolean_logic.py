@@ -101,3 +101,102 @@ def test_unary_not_operator(
     bv: BitVector.BitVector = request.getfixturevalue(bv_name)
     result = ~bv
     assert result == BitVector.BitVector(bitstring=expected)
+
+
+@pytest.mark.parametrize("left_len", [0, 1, 63, 64, 65, 200])
+@pytest.mark.parametrize("right_len", [0, 5, 64, 130])
+@pytest.mark.parametrize("op", ["&", "|", "^"])
+def test_binary_logic_unequal_lengths(
+    left_len: int, right_len: int, op: BinaryOp
+) -> None:
+    """Tests left-alignment of unequal operands across word boundaries.
+
+    Args:
+        left_len: The number of bits in the left-hand operand.
+        right_len: The number of bits in the right-hand operand.
+        op: The binary logic operator string ('&', '|', '^').
+    """
+    left_bits = "".join("1" if (i * 3) % 7 < 4 else "0" for i in range(left_len))
+    right_bits = "".join("1" if (i * 5) % 9 < 4 else "0" for i in range(right_len))
+    size = max(left_len, right_len)
+    padded_left = left_bits.rjust(size, "0")
+    padded_right = right_bits.rjust(size, "0")
+    bit_op = BINARY_OP_MAP[op]
+    expected = "".join(
+        str(bit_op(int(a), int(b))) for a, b in zip(padded_left, padded_right)
+    )
+    left = BitVector.BitVector(bitstring=left_bits)
+    right = BitVector.BitVector(bitstring=right_bits)
+    assert str(bit_op(left, right)) == expected
+    assert str(left) == left_bits
+
+
+@pytest.mark.parametrize(
+    ("op", "expected"),
+    [
+        (operator.iand, "00000000000000000000000"),
+        (operator.ior, "00000000111111110110011"),
+        (operator.ixor, "00000000111111110110011"),
+    ],
+)
+def test_inplace_logic_operators_grow(
+    bv1: BitVector.BitVector,
+    bv3: BitVector.BitVector,
+    op: Callable[[Any, Any], Any],
+    expected: str,
+) -> None:
+    """Tests in-place operators that grow self to the longer operand.
+
+    Args:
+        bv1: The 8-bit left-hand operand, updated in place.
+        bv3: The 23-bit right-hand operand.
+        op: The in-place operator function.
+        expected: The expected bitstring representation of the result.
+    """
+    target = bv1
+    result = op(target, bv3)
+    assert result is target
+    assert str(target) == expected
+    assert str(bv3) == "00000000111111110000000"
+
+
+@pytest.mark.parametrize(
+    ("op", "expected"),
+    [
+        (operator.iand, "00000000000000000110011"),
+        (operator.ior, "00000000111111111111111"),
+        (operator.ixor, "00000000111111111001100"),
+    ],
+)
+def test_inplace_logic_operators_keep_storage(
+    bv1: BitVector.BitVector,
+    op: Callable[[Any, Any], Any],
+    expected: str,
+) -> None:
+    """Tests in-place operators write into the existing storage words.
+
+    Args:
+        bv1: The 8-bit right-hand operand.
+        op: The in-place operator function.
+        expected: The expected bitstring representation of the result.
+    """
+    target = BitVector.BitVector(bitstring="00000000111111111111111")
+    words = target.vector
+    with memoryview(target):
+        op(target, bv1)
+    assert target.vector is words
+    assert str(target) == expected
+
+
+def test_inplace_logic_operators_refuse_growth_while_exported(
+    bv1: BitVector.BitVector, bv3: BitVector.BitVector
+) -> None:
+    """Verifies an exported vector cannot be grown by an in-place operator.
+
+    Args:
+        bv1: The 8-bit left-hand operand.
+        bv3: The longer 23-bit operand.
+    """
+    with memoryview(bv1), pytest.raises(BufferError):
+        bv1 |= bv3
+    assert str(bv1) == "00110011"
@@ -1,6 +1,9 @@
 """Tests for BitVector dunder methods (__xor__, __and__, __add__, etc.)."""
 
 import copy
+import hashlib
+import pickle
+import zlib
 from typing import Any, Literal, cast
 
 import pytest
@@ -96,6 +99,83 @@ def test_iadd() -> None:
         bv1 += "010"  # type: ignore[arg-type]  # ty: ignore[unsupported-operator]
 
 
+@pytest.mark.parametrize("left", [0, 1, 63, 64, 65, 127, 200])
+@pytest.mark.parametrize("right", [0, 1, 63, 64, 65, 130])
+def test_iadd_word_boundaries(left: int, right: int) -> None:
+    """Tests __iadd__ and __add__ across 64-bit word boundaries with dirty tails.
+
+    Args:
+        left: The length of the vector being extended.
+        right: The length of the appended vector.
+    """
+    left_bits = "".join("1" if (i * 7) % 5 < 2 else "0" for i in range(left))
+    right_bits = "".join("1" if (i * 3) % 4 == 0 else "0" for i in range(right))
+    bv1 = ~BitVector.BitVector(bitstring=left_bits.translate({48: 49, 49: 48}))
+    bv2 = BitVector.BitVector(bitstring=right_bits)
+    assert str(bv1 + bv2) == left_bits + right_bits
+    bv1 += bv2
+    assert str(bv1) == left_bits + right_bits
+    assert len(bv1.vector) == (left + right + 63) // 64
+    bv2 += bv2
+    assert str(bv2) == right_bits * 2
+
+
+def test_append_and_extend() -> None:
+    """Tests append, extend and append_int against the equivalent bitstring."""
+    bv = BitVector.BitVector(size=0)
+    expected = ""
+    for i in range(150):
+        bv.append(i % 3 == 0)
+        expected += "1" if i % 3 == 0 else "0"
+    bv.extend([1, 1, 0])
+    bv.extend(b"\x00\x01")
+    bv.extend(iter([0, 1]))
+    bv.extend(BitVector.BitVector(bitstring="0111"))
+    bv.extend([])
+    expected += "110" + "01" + "01" + "0111"
+    bv.append_int(0b1011, 4)
+    bv.append_int(5, 70)
+    bv.append_int(-3, 5)
+    bv.append_int(0, 0)
+    expected += "1011" + "0" * 67 + "101" + "11101"
+    assert str(bv) == expected
+    assert bv.rank1(len(bv)) == expected.count("1")
+    assert len(bv.vector) == (len(expected) + 63) // 64
+
+
+@pytest.mark.parametrize(
+    ("op", "err_match"),
+    [
+        (lambda bv: bv.append(2), "incorrect value for a bit"),
+        (lambda bv: bv.extend([0, 2]), "incorrect value for a bit"),
+        (lambda bv: bv.append_int(8, 3), "value does not fit in 3 bits"),
+        (lambda bv: bv.append_int(-5, 3), "value does not fit in 3 bits"),
+        (lambda bv: bv.append_int(0, -1), "value does not fit in -1 bits"),
+    ],
+)
+def test_append_raises_error(op: Any, err_match: str) -> None:
+    """Verifies invalid append arguments raise and leave the vector unchanged.
+
+    Args:
+        op: A callable performing the invalid append.
+        err_match: The expected error message substring.
+    """
+    bv = BitVector.BitVector(bitstring="101")
+    with pytest.raises(ValueError, match=err_match):
+        op(bv)
+    assert str(bv) == "101"
+
+
+def test_append_shared_buffer() -> None:
+    """Tests that appending to a vector sharing a buffer detaches the storage."""
+    data = bytearray(8)
+    bv = BitVector.BitVector.frombuffer(data, 64, bit_order="lsb", share=True)
+    bv.append(1)
+    assert len(bv) == 65
+    assert bv[64] == 1
+    assert data == bytearray(8)
+
+
 @pytest.mark.parametrize(
     ("bitstring", "expected"),
     [
@@ -229,6 +309,25 @@ def test_irshift() -> None:
     assert bv is ref
 
 
+@pytest.mark.parametrize("size", [1, 63, 64, 65, 200])
+@pytest.mark.parametrize("n", [0, 1, 63, 64, 65, 199, 1000, 10**15 + 3])
+def test_circular_shift_large_counts(size: int, n: int) -> None:
+    """Tests word-level rotation against string rotation for large counts.
+
+    Args:
+        size: The number of bits in the vector.
+        n: The rotation count, possibly many times the vector size.
+    """
+    bits = "".join("1" if (i * 7) % 5 < 2 else "0" for i in range(size))
+    k = n % size
+    bv = BitVector.BitVector(bitstring=bits)
+    bv <<= n
+    assert str(bv) == bits[k:] + bits[:k]
+    bv >>= n
+    assert str(bv) == bits
+    assert str(bv >> n) == bits[size - k :] + bits[: size - k]
+
+
 @pytest.mark.parametrize(
     ("initial", "sl", "err_size", "err_match", "valid_str", "expected"),
     [
@@ -336,10 +435,21 @@ def test_setitem_slice_type_error() -> None:
 
 
 def test_setitem_full_slice() -> None:
-    """Tests __setitem__ when replacing the entire slice ([:])."""
-    bv = BitVector.BitVector(bitstring="1010")
-    bv[:] = BitVector.BitVector(bitstring="0101")
-    assert str(bv) == "1010"
+    """Tests replacing the entire slice ([:]) from each kind of right-hand side."""
+    bv = BitVector.BitVector(bitstring="10100101")
+    bv[:] = BitVector.BitVector(bitstring="01011100")
+    assert str(bv) == "01011100"
+    bv[:] = b"\x0f"
+    assert str(bv) == "00001111"
+    bv[:] = 1
+    assert str(bv) == "11111111"
+    bv[:] = bv
+    assert str(bv) == "11111111"
+    with pytest.raises(ValueError, match="incompatible lengths for slice assignment 7"):
+        bv[:] = BitVector.BitVector(bitstring="0101")
+    with pytest.raises(ValueError, match="incompatible lengths for slice assignment 7"):
+        bv[:] = b"\x00\x00"
+    assert str(bv) == "11111111"
 
 
 @pytest.mark.parametrize(
@@ -460,6 +570,7 @@ def test_reversed_block_boundaries(size: int) -> None:
         ("1010", "1011", False),
         ("1010", "1010", True),
         ("", "", True),
+        ("01" * 32, "10" * 32, False),
     ],
 )
 def test_eq(left_str: str, right_str: str, expected: bool) -> None:
@@ -590,3 +701,226 @@ def test_contains_invalid_args_raises_error(
     pattern = BitVector.BitVector(bitstring=pattern_str)
     with pytest.raises(ValueError, match=err_match):
         _ = pattern in target
+
+
+def test_buffer_export() -> None:
+    """Tests zero-copy buffer export (__buffer__) of the packed words."""
+    bv = BitVector.BitVector(bitstring="1" * 64 + "01")
+    with memoryview(bv) as view:
+        assert view.format == "Q"
+        assert view.nbytes == 16
+        assert view[0] == 0xFFFFFFFFFFFFFFFF
+        assert view[1] == 0b10
+        assert hashlib.sha256(bv).digest() == hashlib.sha256(view).digest()
+        assert zlib.compress(bv) == zlib.compress(view.tobytes())
+        view[1] = 1
+        assert bv[64] == 1
+        with view.toreadonly() as readonly, pytest.raises(TypeError):
+            readonly[0] = 0
+    bv += BitVector.BitVector(bitstring="1")
+    assert len(bv) == 67
+
+
+@pytest.mark.parametrize(
+    "resize",
+    [
+        lambda bv: bv.__iadd__(BitVector.BitVector(bitstring="1")),
+        lambda bv: bv.pad_from_left(1),
+        lambda bv: bv.append(1),
+        lambda bv: bv.extend([0, 1]),
+        lambda bv: bv.append_int(3, 2),
+        lambda bv: bv.pad_from_right(64),
+        lambda bv: bv.set_value(size=8),
+    ],
+)
+def test_buffer_export_blocks_resize(resize: Any) -> None:
+    """Verifies resizing a vector with an exported buffer raises BufferError.
+
+    Args:
+        resize: A callable performing a resizing operation on the vector.
+    """
+    bv = BitVector.BitVector(bitstring="10110")
+    with memoryview(bv):
+        with pytest.raises(BufferError, match="exporting buffers"):
+            resize(bv)
+        assert str(bv) == "10110"
+    resize(bv)
+
+
+def test_copies_made_while_exported_are_resizable() -> None:
+    """Verifies copy.copy and pickle copies do not inherit buffer exports."""
+    bv = BitVector.BitVector(bitstring="10110")
+    with memoryview(bv):
+        shallow = copy.copy(bv)
+        restored = pickle.loads(pickle.dumps(bv))
+        restored.pad_from_left(2)
+        assert str(restored) == "0010110"
+    shallow.pad_from_right(2)
+    assert str(shallow) == "1011000"
+    assert str(bv) == "10110"
+
+
+def test_pickle_shared_storage() -> None:
+    """Verifies pickling a vector over a shared buffer stores its words."""
+    buf = bytearray(
+        BitVector.BitVector(bitstring="10110" * 30)._packed_bytes(0, 24, "lsb")
+    )
+    bv = BitVector.BitVector.frombuffer(buf, 150, "lsb", share=True)
+    restored = pickle.loads(pickle.dumps(bv))
+    assert restored == bv
+    restored[0] = 0
+    assert bv[0] == 1
+
+
+def test_buffer_export_in_place_updates() -> None:
+    """Tests that same-size mutations update an exported view in place."""
+    bv = BitVector.BitVector(bitstring="1011" * 20)
+    with memoryview(bv) as view:
+        bv.reset(0)
+        assert view[0] == 0
+        bv.reset(1)
+        assert view[1] == (1 << 16) - 1
+        bv.shift_right(4)
+        bv.circular_rotate_left_by_one()
+        assert list(view) == list(bv.vector)
+
+
+@pytest.mark.parametrize(
+    ("sl", "fill"),
+    [
+        (slice(2, 70), 1),
+        (slice(0, 130), 1),
+        (slice(63, 65), 1),
+        (slice(-10, None), 0),
+        (slice(5, 5), 1),
+        (slice(None, None), 1),
+    ],
+)
+def test_setitem_slice_fill(sl: slice, fill: int) -> None:
+    """Tests bulk filling of a slice with a single bit value.
+
+    Args:
+        sl: The slice object defining the target range.
+        fill: The bit value (0 or 1) to fill with.
+    """
+    bits = list("10" * 65)
+    bv = BitVector.BitVector(bitstring="".join(bits))
+    bv[sl] = fill
+    bits[sl] = str(fill) * len(bits[sl])
+    assert str(bv) == "".join(bits)
+
+
+@pytest.mark.parametrize("start", [0, 3, 63, 64, 100])
+@pytest.mark.parametrize("length", [1, 8, 61, 64, 65, 200])
+def test_setitem_slice_word_boundaries(start: int, length: int) -> None:
+    """Tests slice assignment from BitVector and bytes across word boundaries.
+
+    Args:
+        start: The first bit position of the slice.
+        length: The number of bits to assign.
+    """
+    bits = "".join("1" if (i * 3) % 7 < 3 else "0" for i in range(400))
+    patch = "".join("1" if (i * 5) % 9 < 4 else "0" for i in range(length))
+    bv = BitVector.BitVector(bitstring=bits)
+    bv[start : start + length] = BitVector.BitVector(bitstring=patch)
+    expected = bits[:start] + patch + bits[start + length :]
+    assert str(bv) == expected
+
+    if length % 8 == 0:
+        raw = int(patch, 2).to_bytes(length // 8, "big")
+        bv = BitVector.BitVector(bitstring=bits)
+        bv[start : start + length] = bytearray(raw)
+        assert str(bv) == expected
+
+
+def test_setitem_slice_from_self() -> None:
+    """Tests assigning an overlapping slice of a vector to itself."""
+    bv = BitVector.BitVector(bitstring="1101001110")
+    bv[2:10] = bv[0:8]
+    assert str(bv) == "1111010011"
+
+
+@pytest.mark.parametrize(
+    ("sl", "item"),
+    [
+        (slice(None, None, 2), "0110100"),
+        (slice(None, None, -1), "0011100111011"),
+        (slice(1, None, 3), "1111"),
+        (slice(-2, 3, -4), "00"),
+        (slice(4, 4, 2), ""),
+        (slice(None, None, 3), 1),
+        (slice(None, None, -2), 0),
+    ],
+)
+def test_setitem_extended_slice(sl: slice, item: str | int) -> None:
+    """Tests slice assignment with a step against Python list semantics.
+
+    Args:
+        sl: The stepped slice object defining the target positions.
+        item: A bitstring to assign, or a bit value to fill with.
+    """
+    bits = list("1011001110100")
+    bv = BitVector.BitVector(bitstring="".join(bits))
+    if isinstance(item, int):
+        bv[sl] = item
+        bits[sl] = str(item) * len(bits[sl])
+    else:
+        bv[sl] = (
+            BitVector.BitVector(bitstring=item) if item else BitVector.BitVector(size=0)
+        )
+        bits[sl] = item
+    assert str(bv) == "".join(bits)
+
+
+@pytest.mark.parametrize(
+    "sl", [slice(5, None, 64), slice(None, None, -90), slice(600, 2, -257)]
+)
+@pytest.mark.parametrize("item", [0, 1, "pattern"])
+def test_setitem_sparse_extended_slice(sl: slice, item: str | int) -> None:
+    """Tests slice assignment with steps long enough to set bits one at a time.
+
+    Args:
+        sl: The stepped slice object defining the target positions.
+        item: A bit value to fill with, or "pattern" to assign a bitstring.
+    """
+    bits = ["1" if (i * i) % 7 < 3 else "0" for i in range(700)]
+    bv = BitVector.BitVector(bitstring="".join(bits))
+    if isinstance(item, int):
+        bv[sl] = item
+        bits[sl] = str(item) * len(bits[sl])
+    else:
+        pattern = "".join(reversed(bits[sl]))
+        bv[sl] = BitVector.BitVector(bitstring=pattern)
+        bits[sl] = pattern
+    assert str(bv) == "".join(bits)
+
+
+@pytest.mark.parametrize(
+    ("sl", "item", "err_match"),
+    [
+        (slice(None, None, 2), "101", "incompatible lengths for extended slice"),
+        (slice(0, 8), b"\x00\x00", "incompatible lengths for slice assignment 7"),
+        (slice(0, 12), "1" * 12, "illegal slice index values"),
+    ],
+)
+def test_setitem_slice_raises_error(sl: slice, item: Any, err_match: str) -> None:
+    """Verifies invalid slice assignments raise ValueError.
+
+    Args:
+        sl: The slice object defining the target range.
+        item: A bitstring or bytes object to assign.
+        err_match: The expected error message substring.
+    """
+    bv = BitVector.BitVector(bitstring="10110011")
+    if isinstance(item, str):
+        item = BitVector.BitVector(bitstring=item)
+    with pytest.raises(ValueError, match=err_match):
+        bv[sl] = item
+    assert str(bv) == "10110011"
+
+
+def test_setitem_slice_fill_invalid_value() -> None:
+    """Verifies filling a slice with a non-bit integer raises TypeError."""
+    bv = BitVector.BitVector(bitstring="000")
+    with pytest.raises(TypeError, match="right hand side must be a BitVector"):
+        bv[0:2] = 2
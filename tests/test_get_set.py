@@ -128,6 +128,9 @@ def test_getitem_int(index: int, expected: int) -> None:
         ("10110", slice(2, 2), ""),
         ("10110", slice(1, 4), "011"),
         ("10110", slice(-4, -1), "011"),
+        ("10110", slice(-1, -3), ""),
+        ("10110", slice(6, 6), ""),
+        ("10110", slice(-9, -9), ""),
     ],
 )
 def test_getitem_slice(initial: str, sl: slice, expected: str) -> None:
@@ -169,6 +172,48 @@ def test_getitem_slice_raises_error(sl: slice) -> None:
         _ = bv[sl]
 
 
+@pytest.mark.parametrize(
+    "sl",
+    [
+        slice(None, None, 2),
+        slice(None, None, -1),
+        slice(1, None, 3),
+        slice(-2, 3, -2),
+        slice(150, 3, -7),
+        slice(5, 5, 2),
+        slice(None, None, 1),
+        slice(3, None, 64),
+        slice(None, None, -70),
+        slice(199, 0, -100),
+    ],
+)
+def test_getitem_step_slice(sl: slice) -> None:
+    """Tests extended (stepped) slices against Python string slicing.
+
+    Args:
+        sl: The stepped slice object to extract.
+    """
+    bits = "".join("1" if (i * i) % 7 < 3 else "0" for i in range(200))
+    bv = BitVector.BitVector(bitstring=bits)
+    assert str(bv[sl]) == bits[sl]
+
+
+@pytest.mark.parametrize("start", [0, 1, 63, 64, 65, 500])
+@pytest.mark.parametrize("length", [0, 1, 63, 64, 65, 129, 700])
+def test_getitem_slice_word_boundaries(start: int, length: int) -> None:
+    """Tests contiguous slice extraction across 64-bit word boundaries.
+
+    Args:
+        start: The first bit position of the slice.
+        length: The number of bits in the slice.
+    """
+    bits = "".join("1" if (i * 5) % 11 < 4 else "0" for i in range(1300))
+    bv = BitVector.BitVector(bitstring=bits)
+    sliced = bv[start : start + length]
+    assert len(sliced) == length
+    assert str(sliced) == bits[start : start + length]
+
+
 def test_bitvector_iterator() -> None:
     """Tests sequential iteration over bits in a BitVector."""
     bv = BitVector.BitVector(bitstring="101")
@@ -0,0 +1,158 @@
+"""Tests GF2n, the GF(2^n) field object with precomputed tables."""
+
+import sys
+from typing import Any
+
+import pytest
+
+import BitVector
+
+_AES_MOD = BitVector.BitVector(bitstring="100011011")
+
+# x^233 + x^74 + 1, the NIST B-233 field polynomial.
+_B233 = (1 << 233) | (1 << 74) | 1
+
+
+@pytest.fixture(params=[True, False], ids=["tables", "barrett"])
+def aes_field(request: pytest.FixtureRequest, monkeypatch: Any) -> BitVector.GF2n:
+    """Returns the AES field GF(2^8), with and without lookup tables."""
+    if not request.param:
+        monkeypatch.setattr(sys.modules["BitVector.BitVector"], "_GF_TABLE_MAX_BITS", 0)
+    return BitVector.GF2n(_AES_MOD, 8)
+
+
+def _bv8(value: int) -> BitVector.BitVector:
+    """Returns value as an 8-bit BitVector."""
+    return BitVector.BitVector(intVal=value, size=8)
+
+
+def test_mul_matches_gf_multiply_modular(aes_field: BitVector.GF2n) -> None:
+    """Tests field products against gf_multiply_modular.
+
+    Args:
+        aes_field: The AES field under test.
+    """
+    for a in range(0, 256, 5):
+        for b in range(0, 256, 3):
+            expected = int(_bv8(a).gf_multiply_modular(_bv8(b), _AES_MOD, 8))
+            assert aes_field.mul(a, b) == expected
+    product = aes_field.mul(_bv8(0x53), 0xCA)
+    assert isinstance(product, BitVector.BitVector)
+    assert str(product) == "00000001"
+    assert str(aes_field.mul(_bv8(0), 7)) == "00000000"
+
+
+def test_inv_matches_gf_mi(aes_field: BitVector.GF2n) -> None:
+    """Tests field inverses against gf_MI for every nonzero element.
+
+    Args:
+        aes_field: The AES field under test.
+    """
+    for a in range(1, 256):
+        assert aes_field.inv(a) == int(_bv8(a).gf_MI(_AES_MOD, 8))
+        assert aes_field.mul(a, aes_field.inv(a)) == 1
+    assert str(aes_field.inv(_bv8(0x53))) == "11001010"
+    with pytest.raises(ZeroDivisionError, match="0 has no inverse"):
+        aes_field.inv(0)
+
+
+def test_pow(aes_field: BitVector.GF2n) -> None:
+    """Tests powers, including zero and negative exponents and a zero base.
+
+    Args:
+        aes_field: The AES field under test.
+    """
+    for a in range(1, 256, 7):
+        expected = 1
+        for e in range(12):
+            assert aes_field.pow(a, e) == expected
+            expected = aes_field.mul(expected, a)
+        assert aes_field.pow(a, 255) == 1
+        assert aes_field.pow(a, -1) == aes_field.inv(a)
+        assert aes_field.pow(a, -3) == aes_field.inv(aes_field.pow(a, 3))
+    assert aes_field.pow(0, 0) == 1
+    assert aes_field.pow(0, 5) == 0
+    assert str(aes_field.pow(_bv8(2), 8)) == "00011011"
+    with pytest.raises(ZeroDivisionError, match="0 has no inverse"):
+        aes_field.pow(0, -1)
+
+
+def test_many(aes_field: BitVector.GF2n) -> None:
+    """Tests the pairwise, broadcast and inverse batch operations.
+
+    Args:
+        aes_field: The AES field under test.
+    """
+    xs: list[BitVector.BitVector | int] = [3, _bv8(7), 0x53]
+    assert aes_field.mul_many(xs, [5, 6, 0xCA]) == [
+        aes_field.mul(3, 5),
+        aes_field.mul(_bv8(7), 6),
+        1,
+    ]
+    assert aes_field.mul_many(xs, _bv8(2)) == [aes_field.mul(x, 2) for x in xs]
+    assert aes_field.inv_many(xs) == [aes_field.inv(x) for x in xs]
+    assert aes_field.inv_many([]) == []
+    with pytest.raises(ValueError, match="zip"):
+        aes_field.mul_many(xs, [1, 2])
+    with pytest.raises(ZeroDivisionError, match="0 has no inverse"):
+        aes_field.inv_many([3, 0, 5])
+
+
+def test_large_field() -> None:
+    """Tests Barrett multiplication and inversion in GF(2^233)."""
+    field = BitVector.GF2n(_B233, 233)
+    mod = BitVector.BitVector(intVal=_B233)
+    x = (1 << 232) | 0x1234567890ABCDEF
+    y = (1 << 200) | 0xFEDCBA987654321
+    product = field.mul(BitVector.BitVector(intVal=x, size=233), y)
+    assert isinstance(product, BitVector.BitVector)
+    assert len(product) == 233
+    expected = BitVector.BitVector(intVal=x).gf_multiply_modular(
+        BitVector.BitVector(intVal=y), mod, 233
+    )
+    assert int(product) == int(expected)
+    assert field.mul(field.inv(x), x) == 1
+    assert field.inv_many([x, y, 1]) == [field.inv(x), field.inv(y), 1]
+    assert field.pow(x, (1 << 233) - 1) == 1
+
+
+def test_smallest_field() -> None:
+    """Tests GF(2), the field with one nonzero element."""
+    field = BitVector.GF2n(0b11, 1)
+    assert field.mul(1, 1) == 1
+    assert field.inv(1) == 1
+    assert field.pow(1, -4) == 1
+
+
+@pytest.mark.parametrize(
+    ("mod", "n", "err_match"),
+    [
+        (_AES_MOD, 0, "n must be positive"),
+        (_AES_MOD, 9, "modulus must be a polynomial of degree 9"),
+        (0b100010001, 8, "modulus is not irreducible"),
+        (0b101, 2, "modulus is not irreducible"),
+        ((1 << 20) | 1, 20, "modulus is not irreducible"),
+    ],
+)
+def test_constructor_raises_error(mod: Any, n: int, err_match: str) -> None:
+    """Verifies invalid fields are rejected.
+
+    Args:
+        mod: The modulus polynomial.
+        n: The field degree.
+        err_match: The expected error message substring.
+    """
+    with pytest.raises(ValueError, match=err_match):
+        BitVector.GF2n(mod, n)
+
+
+@pytest.mark.parametrize("value", [256, -1, BitVector.BitVector(bitstring="1" * 9)])
+def test_element_out_of_range(aes_field: BitVector.GF2n, value: Any) -> None:
+    """Verifies values outside the field are rejected.
+
+    Args:
+        aes_field: The AES field under test.
+        value: A value that is not a field element.
+    """
+    with pytest.raises(ValueError, match="is not an element of GF"):
+        aes_field.mul(value, 1)
@@ -1,6 +1,9 @@
 """Tests BitVector constructors and initialization error validation."""
 
+import array
+import copy
 import re
+import sys
 from typing import Any
 
 import pytest
@@ -69,6 +72,14 @@ def test_invalid_keyword_error() -> None:
             "When bits are specified through rawbytes",
         ),
         ({}, r"wrong arg\(s\) for constructor"),
+        ({"bitstring": "10201"}, "incorrect value for a bit"),
+        ({"bitstring": "1_0"}, "incorrect value for a bit"),
+        ({"bitlist": [1, 0, 2]}, "incorrect value for a bit"),
+        ({"hexstring": "0f  a0"}, "invalid character in hexstring"),
+        ({"hexstring": "xy"}, "non-hexadecimal number"),
+        ({"intVal": -1}, "A negative intVal needs a size"),
+        ({"intVal": -5, "size": 3}, "The value specified for size must be at least"),
+        ({"intVal": -1, "size": 0}, "The value specified for size must be at least"),
     ],
 )
 def test_constructor_conflicting_args_raises_error(
@@ -92,6 +103,10 @@ def test_constructor_conflicting_args_raises_error(
         ({"intVal": 5}, "101", 3),
         ({"intVal": 32}, "100000", 6),
         ({"intVal": 5, "size": 10}, "0000000101", 10),
+        ({"intVal": -1, "size": 1}, "1", 1),
+        ({"intVal": -5, "size": 4}, "1011", 4),
+        ({"intVal": -5, "size": 10}, "1111111011", 10),
+        ({"intVal": -128, "size": 8}, "10000000", 8),
         ({"size": 10}, "0000000000", 10),
         ({"size": 0}, "", 0),
         ({"bitstring": "00110011"}, "00110011", 8),
@@ -102,6 +117,10 @@ def test_constructor_conflicting_args_raises_error(
         ({"hexstring": ""}, "", 0),
         ({"rawbytes": b"\x00\xff"}, "0000000011111111", 16),
         ({"rawbytes": b""}, "", 0),
+        ({"rawbytes": bytearray(b"\x80\x01")}, "1000000000000001", 16),
+        ({"hexstring": "a"}, "1010", 4),
+        ({"bitlist": b"\x01\x00\x01"}, "101", 3),
+        ({"bitlist": (True, False)}, "10", 2),
     ],
 )
 def test_constructor_valid_kwargs(
@@ -119,6 +138,43 @@ def test_constructor_valid_kwargs(
     assert bv._size == expected_size
 
 
+@pytest.mark.parametrize("nbits", [1, 63, 64, 65, 127, 128, 1000])
+def test_constructor_bulk_packing_matches_bits(nbits: int) -> None:
+    """Tests that every input form packs the same bits across word boundaries.
+
+    Args:
+        nbits: The number of bits in the generated pattern.
+    """
+    bits = "".join("1" if (i * 7) % 5 < 2 else "0" for i in range(nbits))
+    expected = BitVector.BitVector(size=nbits)
+    for i, bit in enumerate(bits):
+        expected[i] = int(bit)
+    assert BitVector.BitVector(bitstring=bits) == expected
+    assert BitVector.BitVector(bitlist=[int(b) for b in bits]) == expected
+    padded = bits + "0" * (-nbits % 8)
+    raw = int(padded, 2).to_bytes(len(padded) // 8, "big")
+    assert str(BitVector.BitVector(rawbytes=raw)) == padded
+    assert str(BitVector.BitVector(hexstring=raw.hex())) == padded
+
+
+@pytest.mark.parametrize("nbits", [1, 8, 63, 64, 65, 4096, 100_003])
+def test_intVal_round_trip(nbits: int) -> None:
+    """Tests intVal construction and int() across byte and word boundaries.
+
+    Args:
+        nbits: The bit length of the tested integer.
+    """
+    value = int("10" * (nbits // 2) + "1" * (nbits % 2), 2) | (1 << (nbits - 1))
+    bv = BitVector.BitVector(intVal=value)
+    assert len(bv) == nbits
+    assert int(bv) == value
+    assert str(bv) == format(value, "b")
+    padded = BitVector.BitVector(intVal=value, size=nbits + 13)
+    assert str(padded) == format(value, f"0{nbits + 13}b")
+    negative = BitVector.BitVector(intVal=-value, size=nbits + 1)
+    assert int(negative) == (1 << (nbits + 1)) - value
+
+
 def test_from_string() -> None:
     """Tests initializing BitVector from a string via the from_string method."""
     bv = BitVector.BitVector.from_string("A")
@@ -155,3 +211,107 @@ def test_version() -> None:
     )
     assert isinstance(BitVector.__version__, str)
     assert re.fullmatch(semver_pattern, BitVector.__version__) is not None
+
+
+@pytest.mark.parametrize(
+    ("buf", "kwargs", "expected"),
+    [
+        (b"\x80\x01", {}, "1000000000000001"),
+        (bytearray(b"\x80\x01"), {"nbits": 12}, "100000000000"),
+        (b"\x80\x01", {"bit_order": "lsb"}, "0000000110000000"),
+        (memoryview(b"\xf0"), {"nbits": 0}, ""),
+        (array.array("H", [0x00FF]), {}, "1111111100000000"),
+    ],
+)
+def test_frombuffer(buf: Any, kwargs: dict[str, Any], expected: str) -> None:
+    """Tests copying buffer-protocol objects into a BitVector.
+
+    Args:
+        buf: The source buffer.
+        kwargs: Extra keyword arguments for frombuffer.
+        expected: Expected bitstring representation.
+    """
+    bv = BitVector.BitVector.frombuffer(buf, **kwargs)
+    assert str(bv) == expected
+    assert bv == BitVector.BitVector(bitstring=expected)
+
+
+def test_frombuffer_chunked_matches_rawbytes(monkeypatch: Any) -> None:
+    """Tests the chunked MSB conversion against the rawbytes constructor."""
+    monkeypatch.setattr(sys.modules["BitVector.BitVector"], "_CHUNK_BYTES", 7)
+    data = bytes(range(256))
+    bv = BitVector.BitVector.frombuffer(data, nbits=8 * len(data) - 3)
+    expected = BitVector.BitVector(rawbytes=data)[: 8 * len(data) - 3]
+    assert bv == expected
+
+
+def test_frombuffer_share_writes_through() -> None:
+    """Tests that a shared buffer is used as storage without copying."""
+    backing = bytearray(16)
+    bv = BitVector.BitVector.frombuffer(backing, bit_order="lsb", share=True)
+    assert len(bv) == 128
+    bv[9] = 1
+    assert backing[1] == 0x02
+    backing[15] = 0x80
+    assert bv[127] == 1
+    assert str(copy.deepcopy(bv)) == str(bv)
+    assert str(bv + BitVector.BitVector(bitstring="1"))[-1] == "1"
+    bv += BitVector.BitVector(bitstring="1")
+    assert len(bv) == 129
+    assert backing[15] == 0x80
+
+
+def test_frombuffer_share_adopts_array() -> None:
+    """Tests that a word array of the storage type is adopted as-is."""
+    words = array.array("Q", [5])
+    bv = BitVector.BitVector.frombuffer(words, nbits=3, bit_order="lsb", share=True)
+    assert bv.vector is words
+    assert str(bv) == "101"
+
+
+def test_frombuffer_share_short_nbits() -> None:
+    """Tests a shared vector shorter than its buffer leaves the rest untouched."""
+    backing = bytearray(b"\xff" * 24)
+    bv = BitVector.BitVector.frombuffer(backing, 100, bit_order="lsb", share=True)
+    assert len(bv.vector) == 2
+    assert bv == BitVector.BitVector(bitstring="1" * 100)
+    bv ^= BitVector.BitVector(bitstring="01" * 50)
+    assert str(bv) == "10" * 50
+    bv &= BitVector.BitVector(bitstring="0011" * 25)
+    assert str(bv) == "0010" * 25
+    bv |= BitVector.BitVector(bitstring="1" + "0" * 99)
+    assert str(bv) == "1010" + "0010" * 24
+    bv.shift_left(3)
+    assert str(bv) == "0" + "0010" * 24 + "000"
+    bv.shift_right(1)
+    assert str(bv) == "00" + "0010" * 24 + "00"
+    assert backing[12] >> 4 == 0xF
+    assert backing[13:] == b"\xff" * 11
+    bv.reset(1)
+    assert bv.count_bits() == 100
+    bv.pad_from_right(3)
+    assert str(bv) == "1" * 100 + "000"
+
+
+@pytest.mark.parametrize(
+    ("buf", "kwargs", "err_match"),
+    [
+        (b"\x00", {"bit_order": "big"}, "bit_order must be"),
+        (b"\x00", {"nbits": 9}, "nbits exceeds"),
+        (b"\x00", {"nbits": -1}, "nbits exceeds"),
+        (bytearray(8), {"share": True}, "requires bit_order='lsb'"),
+        (bytearray(9), {"share": True, "bit_order": "lsb"}, "whole number"),
+    ],
+)
+def test_frombuffer_raises_error(
+    buf: Any, kwargs: dict[str, Any], err_match: str
+) -> None:
+    """Verifies invalid frombuffer arguments raise ValueError.
+
+    Args:
+        buf: The source buffer.
+        kwargs: Invalid keyword arguments for frombuffer.
+        err_match: The expected error message substring.
+    """
+    with pytest.raises(ValueError, match=err_match):
+        BitVector.BitVector.frombuffer(buf, **kwargs)
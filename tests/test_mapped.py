@@ -0,0 +1,231 @@
+"""Tests MappedBitVector, a BitVector backed by a memory-mapped file."""
+
+import copy
+import io
+import pathlib
+import pickle
+from typing import Any, Callable
+
+import pytest
+
+import BitVector
+
+_BITS = "".join("1" if (i * 5) % 7 < 3 else "0" for i in range(256))
+
+
+@pytest.fixture
+def bits_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Returns a file holding _BITS in the native storage layout."""
+    path = tmp_path / "bits.bin"
+    with path.open("wb") as file_out:
+        BitVector.BitVector(bitstring=_BITS).write_to_file(file_out, bit_order="lsb")
+    return path
+
+
+def test_open_read_only(bits_file: pathlib.Path) -> None:
+    """Tests reading a mapped file and running queries on it in place."""
+    with BitVector.MappedBitVector.open(bits_file) as bv:
+        assert str(bv) == _BITS
+        assert bv[5] == int(_BITS[5])
+        assert bv.count_bits() == _BITS.count("1")
+        assert bv.next_set_bit(70) == _BITS.index("1", 70)
+        assert (
+            list(bv.iter_set_bits())[:3]
+            == [i for i, b in enumerate(_BITS) if b == "1"][:3]
+        )
+        assert str(bv & BitVector.BitVector(bitstring="1" * 256)) == _BITS
+        with pytest.raises(TypeError, match="read-only"):
+            bv[0] = 1 - bv[0]
+    assert len(bv) == 0
+
+
+def test_open_partial_length(bits_file: pathlib.Path) -> None:
+    """Tests mapping fewer bits than the file holds."""
+    with BitVector.MappedBitVector.open(bits_file, nbits=100) as bv:
+        assert str(bv) == _BITS[:100]
+        assert bv.count_bits() == _BITS[:100].count("1")
+
+
+def test_open_read_write(bits_file: pathlib.Path) -> None:
+    """Tests that mode "r+" writes bit changes back to the file."""
+    with BitVector.MappedBitVector.open(bits_file, mode="r+") as bv:
+        bv[0] = 1 - bv[0]
+        bv[64:128] = 0
+        bv ^= BitVector.BitVector(bitstring="1" * 256)
+        bv.flush()
+    expected = BitVector.BitVector(bitstring=_BITS)
+    expected[0] = 1 - expected[0]
+    expected[64:128] = 0
+    expected = ~expected
+    with bits_file.open("rb") as file_in:
+        assert BitVector.BitVector.fromfile(file_in, bit_order="lsb") == expected
+
+
+def test_open_copy_on_write(bits_file: pathlib.Path) -> None:
+    """Tests that mode "c" changes the mapping but never the file."""
+    before = bits_file.read_bytes()
+    with BitVector.MappedBitVector.open(bits_file, mode="c") as bv:
+        bv[3] = 1 - bv[3]
+        assert bv[3] != int(_BITS[3])
+    assert bits_file.read_bytes() == before
+
+
+def test_open_create(tmp_path: pathlib.Path) -> None:
+    """Tests creating a zero-filled file of whole words with mode "w+"."""
+    path = tmp_path / "new.bin"
+    with BitVector.MappedBitVector.open(path, nbits=70, mode="w+") as bv:
+        assert str(bv) == "0" * 70
+        bv[69] = 1
+    assert path.read_bytes() == bytes(8) + b"\x20" + bytes(7)
+    with BitVector.MappedBitVector.open(path, nbits=70) as bv:
+        assert bv.next_set_bit() == 69
+
+
+@pytest.mark.parametrize("nbits", [256, 100])
+@pytest.mark.parametrize(
+    ("method", "args"),
+    [
+        ("reset", (0,)),
+        ("reset", (1,)),
+        ("reverse_inplace", ()),
+        ("circular_rotate_left_by_one", ()),
+        ("circular_rotate_right_by_one", ()),
+        ("shift_left", (3,)),
+        ("shift_right", (3,)),
+    ],
+)
+def test_in_place_methods_write_through(
+    bits_file: pathlib.Path, nbits: int, method: str, args: tuple[int, ...]
+) -> None:
+    """Tests that in-place methods change the file and leave bits past nbits.
+
+    Args:
+        bits_file: The file holding _BITS.
+        nbits: The number of bits to map.
+        method: The name of the in-place method.
+        args: The arguments for the method.
+    """
+    expected = BitVector.BitVector(bitstring=_BITS[:nbits])
+    getattr(expected, method)(*args)
+    bv = BitVector.MappedBitVector.open(bits_file, nbits=nbits, mode="r+")
+    getattr(bv, method)(*args)
+    assert bv == expected
+    bv.close()
+    assert len(bv) == 0
+    with bits_file.open("rb") as file_in:
+        on_file = BitVector.BitVector.fromfile(file_in, bit_order="lsb")
+    assert str(on_file) == str(expected) + _BITS[nbits:]
+
+
+def test_new_vectors_are_in_memory(bits_file: pathlib.Path) -> None:
+    """Tests that results and resized vectors no longer use the mapping."""
+    with BitVector.MappedBitVector.open(bits_file, mode="r+") as bv:
+        inverted = ~bv
+        assert isinstance(inverted, BitVector.MappedBitVector)
+        inverted.flush()
+        inverted.close()
+        assert str(inverted) == _BITS.translate(str.maketrans("01", "10"))
+        bv += BitVector.BitVector(bitstring="1")
+        assert len(bv) == 257
+    assert bits_file.read_bytes() == BitVector.BitVector(bitstring=_BITS)._packed_bytes(
+        0, 32, "lsb"
+    )
+
+
+@pytest.mark.parametrize(
+    "resize",
+    [
+        lambda bv: bv.append(1),
+        lambda bv: bv.pad_from_left(3),
+        lambda bv: bv.pad_from_right(3),
+    ],
+)
+def test_close_after_resize(
+    bits_file: pathlib.Path, resize: Callable[[Any], None]
+) -> None:
+    """Tests that close() unmaps the file after a length change.
+
+    Args:
+        bits_file: The file holding _BITS.
+        resize: A function that changes the vector's length.
+    """
+    with BitVector.MappedBitVector.open(bits_file, mode="r+") as bv:
+        mapping = bv._mmap
+        resize(bv)
+        assert mapping is not None
+        with memoryview(mapping):
+            with pytest.raises(BufferError):
+                bv.close()
+        assert not mapping.closed
+        assert len(bv) > len(_BITS)
+    assert mapping.closed
+    assert len(bv) == 0
+    bv.flush()
+
+
+def test_copies_of_mapped_vectors(bits_file: pathlib.Path) -> None:
+    """Tests that copies and pickles of a mapping hold their words in memory."""
+    with BitVector.MappedBitVector.open(bits_file, nbits=100) as bv:
+        copies = [copy.copy(bv), copy.deepcopy(bv), pickle.loads(pickle.dumps(bv))]
+    for dup in copies:
+        assert isinstance(dup, BitVector.MappedBitVector)
+        assert str(dup) == _BITS[:100]
+        dup.close()
+        assert str(dup) == _BITS[:100]
+
+
+def test_close_with_exported_view(bits_file: pathlib.Path) -> None:
+    """Verifies the mapping stays open while a view of it is exported."""
+    bv = BitVector.MappedBitVector.open(bits_file)
+    with memoryview(bv) as view:
+        with pytest.raises(BufferError, match="exporting buffers"):
+            bv.close()
+        assert view[0] == bv.vector[0]
+    with bv.vector[:1]:
+        with pytest.raises(BufferError):
+            bv.close()
+        assert str(bv) == _BITS
+    bv.close()
+    bv.close()
+
+
+@pytest.mark.parametrize(
+    ("size", "kwargs", "err_match"),
+    [
+        (16, {"mode": "a"}, "mode must be one of"),
+        (16, {"mode": "w+"}, "nbits is required"),
+        (16, {"mode": "w+", "nbits": 0}, "at least 1"),
+        (0, {}, "empty file"),
+        (9, {}, "whole number of 64-bit words"),
+        (16, {"nbits": 129}, "nbits exceeds"),
+    ],
+)
+def test_open_raises_error(
+    tmp_path: pathlib.Path, size: int, kwargs: dict[str, object], err_match: str
+) -> None:
+    """Verifies invalid files and arguments raise ValueError.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+        size: The size in bytes of the file to map.
+        kwargs: Keyword arguments for MappedBitVector.open.
+        err_match: The expected error message substring.
+    """
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"\x01" * size)
+    with pytest.raises(ValueError, match=err_match):
+        BitVector.MappedBitVector.open(path, **kwargs)  # type: ignore[arg-type]
+
+
+def test_file_bit_order_round_trip() -> None:
+    """Tests write_to_file and fromfile in the native ("lsb") layout."""
+    bv = BitVector.BitVector(bitstring=_BITS[:200])
+    out_stream = io.BytesIO()
+    bv.write_to_file(out_stream, bit_order="lsb")
+    assert out_stream.getvalue() == bv._packed_bytes(0, 25, "lsb")
+    out_stream.seek(0)
+    assert BitVector.BitVector.fromfile(out_stream, bit_order="lsb") == bv
+    with pytest.raises(ValueError, match="bit_order must be"):
+        bv.write_to_file(io.BytesIO(), bit_order="big")
+    with pytest.raises(ValueError, match="bit_order must be"):
+        BitVector.BitVector.fromfile(io.BytesIO(), bit_order="big")
@@ -1,6 +1,9 @@
 """Tests BitVector operations (math, shifts, distance, GF arithmetic)."""
 
+import array
 import copy
+import sys
+from typing import Any
 
 import pytest
 
@@ -232,6 +235,33 @@ def test_shift_right_comprehensive(
     assert str(bv) == expected_bitstring
 
 
+@pytest.mark.parametrize("nbits", [1, 63, 64, 65, 200])
+@pytest.mark.parametrize("n", [-1, 0, 1, 5, 63, 64, 65, 199, 250])
+def test_shifts_match_str(nbits: int, n: int) -> None:
+    """Tests the in-place and copying shifts against string shifts with dirty tails.
+
+    Args:
+        nbits: The number of bits in the vector.
+        n: The shift distance.
+    """
+    bits = "".join("1" if (i * 3) % 7 < 4 else "0" for i in range(nbits))
+    k = min(max(n, 0), nbits)
+    left = bits[k:] + "0" * k
+    right = "0" * k + bits[: nbits - k]
+    bv = ~BitVector.BitVector(bitstring=bits.translate(str.maketrans("01", "10")))
+    assert str(bv.shifted_left(n)) == left
+    assert str(bv.shifted_right(n)) == right
+    assert str(bv) == bits
+    with memoryview(bv) as view:
+        assert bv.shift_left(n) is bv
+        assert str(bv) == left
+        assert list(view) == list(bv.vector)
+    bv = ~BitVector.BitVector(bitstring=bits.translate(str.maketrans("01", "10")))
+    assert bv.shift_right(n) is bv
+    assert str(bv) == right
+    assert bv.count_bits() == right.count("1")
+
+
 def test_shift_right_extended_vector() -> None:
     """Verifies shift_right clears trailing excess words when vector storage is over-allocated."""
     bv = BitVector.BitVector(bitstring="1" * 65)
@@ -271,6 +301,54 @@ def test_padding(
     assert bv._size == expected_size
 
 
+@pytest.mark.parametrize("nbits", [0, 1, 63, 64, 65, 130])
+@pytest.mark.parametrize("pad_count", [1, 63, 64, 65, 200])
+def test_padding_word_boundaries(nbits: int, pad_count: int) -> None:
+    """Tests padding across word boundaries with dirty bits past the end.
+
+    Args:
+        nbits: The number of bits before padding.
+        pad_count: Number of zero bits to prepend or append.
+    """
+    bits = "".join("1" if (i * 3) % 4 else "0" for i in range(nbits))
+    inverted = bits.translate(str.maketrans("01", "10"))
+    left = ~BitVector.BitVector(bitstring=bits)
+    left.pad_from_left(pad_count)
+    assert str(left) == "0" * pad_count + inverted
+    right = ~BitVector.BitVector(bitstring=bits)
+    right.pad_from_right(pad_count)
+    assert str(right) == inverted + "0" * pad_count
+    assert len(right.vector) == (nbits + pad_count + 63) // 64
+
+
+def test_pad_from_left_repeated() -> None:
+    """Tests repeated left padding mixed with copies and right padding."""
+    bv = BitVector.BitVector(bitstring="1011")
+    for _ in range(70):
+        bv.pad_from_left(1)
+    bv.pad_from_left(3)
+    assert len(bv) == 77
+    shallow = copy.copy(bv)
+    bv.pad_from_left(1)
+    assert str(bv) == "0" * 74 + "1011"
+    assert str(shallow) == "0" * 73 + "1011"
+    bv.pad_from_left(2)
+    bv.pad_from_right(1)
+    assert str(bv) == "0" * 76 + "10110"
+    bv.pad_from_left(5)
+    assert str(copy.deepcopy(bv)) == "0" * 81 + "10110"
+
+
+def test_padding_shared_storage_detaches() -> None:
+    """Tests that padding a vector sharing a buffer leaves the buffer alone."""
+    backing = bytearray(b"\xff" * 8)
+    bv = BitVector.BitVector.frombuffer(backing, bit_order="lsb", share=True)
+    bv.pad_from_right(3)
+    bv[0] = 0
+    assert str(bv) == "0" + "1" * 63 + "000"
+    assert backing == bytearray(b"\xff" * 8)
+
+
 def test_reset_raises_error() -> None:
     """Verifies calling reset with an invalid bit value raises ValueError."""
     bv = BitVector.BitVector(bitstring="101")
@@ -357,6 +435,26 @@ def test_count_bits_sparse(bitstring: str, expected_count: int) -> None:
     assert bv.count_bits_sparse() == expected_count
 
 
+@pytest.mark.parametrize("nbits", [1, 63, 64, 65, 200, 1000])
+def test_count_bits_masks_tail(nbits: int, monkeypatch: Any) -> None:
+    """Tests counting over small chunks with dirty bits past the end.
+
+    Args:
+        nbits: The number of bits in the vector.
+        monkeypatch: The pytest fixture used to shrink the chunk size.
+    """
+    monkeypatch.setattr(sys.modules["BitVector.BitVector"], "_CHUNK_BYTES", 16)
+    bits = "".join("1" if (i * 7) % 3 == 0 else "0" for i in range(nbits))
+    bv = ~BitVector.BitVector(bitstring=bits)
+    other = ~BitVector.BitVector(size=nbits)
+    expected = bits.count("0")
+    assert bv.count_bits() == expected
+    assert bv.count_bits_sparse() == expected
+    assert bv.hamming_distance(other) == nbits - expected
+    assert abs(bv.jaccard_similarity(other) - expected / nbits) < 1e-9
+    assert bv.is_power_of_2_sparse() == (expected == 1)
+
+
 def test_set_value() -> None:
     """Tests mutating an existing BitVector via set_value."""
     bv = BitVector.BitVector(intVal=7, size=16)
@@ -465,6 +563,115 @@ def test_next_set_bit(bitstring: str, start_idx: int, expected_idx: int) -> None
     assert bv.next_set_bit(start_idx) == expected_idx
 
 
+@pytest.mark.parametrize("nbits", [0, 1, 63, 64, 65, 300])
+@pytest.mark.parametrize("density", [0, 1, 3, 7])
+def test_bit_scans_match_direct_scan(
+    nbits: int, density: int, monkeypatch: Any
+) -> None:
+    """Tests next/prev set/clear bit and the iterators against the bit string.
+
+    Args:
+        nbits: The number of bits in the vector.
+        density: Out of 7, how many residues of i * i mark a clear bit.
+        monkeypatch: The pytest fixture used to shrink the scan chunk size.
+    """
+    monkeypatch.setattr(sys.modules["BitVector.BitVector"], "_SCAN_WORDS", 2)
+    bits = "".join("0" if (i * i) % 7 < density else "1" for i in range(nbits))
+    bv = ~BitVector.BitVector(bitstring=bits)
+    inverted = bits.translate(str.maketrans("01", "10"))
+    for i in range(nbits + 2):
+        assert bv.next_set_bit(i) == inverted.find("1", i)
+        assert bv.next_clear_bit(i) == inverted.find("0", i)
+        assert bv.prev_set_bit(i) == inverted.rfind("1", 0, i + 1)
+        assert bv.prev_clear_bit(i) == inverted.rfind("0", 0, i + 1)
+    assert list(bv.iter_set_bits()) == [i for i, b in enumerate(inverted) if b == "1"]
+    assert list(bv.iter_clear_bits()) == [i for i, b in enumerate(inverted) if b == "0"]
+
+
+@pytest.mark.parametrize("positions", [[], [0, 5, 130, 299], list(range(0, 300, 3))])
+def test_iter_bits_sparse_and_dense(positions: list[int], monkeypatch: Any) -> None:
+    """Tests the bit iterators on sparse chunks with empty words and dense chunks.
+
+    Args:
+        positions: The indices of the set bits in a 300-bit vector.
+        monkeypatch: The pytest fixture used to shrink the scan chunk size.
+    """
+    monkeypatch.setattr(sys.modules["BitVector.BitVector"], "_SCAN_WORDS", 2)
+    bv = BitVector.BitVector(size=300)
+    for i in positions:
+        bv[i] = 1
+    assert list(bv.iter_set_bits()) == positions
+    assert list((~bv).iter_clear_bits()) == positions
+    assert list(bv.iter_clear_bits()) == sorted(set(range(300)) - set(positions))
+
+
+@pytest.mark.parametrize(
+    "method_name", ["next_clear_bit", "prev_set_bit", "prev_clear_bit"]
+)
+def test_bit_scans_raise_error(method_name: str) -> None:
+    """Verifies the scan methods reject a negative start index.
+
+    Args:
+        method_name: The scan method name.
+    """
+    bv = BitVector.BitVector(bitstring="0110")
+    with pytest.raises(ValueError, match="from_index must be nonnegative"):
+        getattr(bv, method_name)(-1)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["", "1", "0", "101", "0110", "1" * 12, "10" * 9, "0" * 40, "1001" * 5 + "0"],
+)
+@pytest.mark.parametrize("bounds", [(0, None), (7, None), (3, 250), (-90, -2)])
+def test_find_matches_str_search(
+    pattern: str, bounds: tuple[int, int | None], monkeypatch: Any
+) -> None:
+    """Tests find, rfind, find_all and count_occurrences against str searches.
+
+    Args:
+        pattern: The bit pattern to look for.
+        bounds: The start and end arguments of the search.
+        monkeypatch: The pytest fixture used to shrink the window and prefix.
+    """
+    module = sys.modules["BitVector.BitVector"]
+    monkeypatch.setattr(module, "_FIND_WINDOW_BITS", 50)
+    monkeypatch.setattr(module, "_FIND_PREFIX_BITS", 8)
+    bits = "".join(
+        "1" if (i * i) % 13 < 6 or 100 < i < 130 else "0" for i in range(300)
+    )
+    bits += "1001" * 5 + "1" + "1001" * 5 + "0"
+    bv = ~BitVector.BitVector(bitstring=bits.translate(str.maketrans("01", "10")))
+    pat = (
+        BitVector.BitVector(bitstring=pattern)
+        if pattern
+        else BitVector.BitVector(size=0)
+    )
+    start, end, _ = slice(*bounds).indices(len(bits))
+    expected = [
+        i for i in range(start, end - len(pattern) + 1) if bits.startswith(pattern, i)
+    ]
+    assert bv.find_all(pat, *bounds) == expected
+    assert bv.count_occurrences(pat, *bounds) == len(expected)
+    assert bv.find(pat, *bounds) == (expected[0] if expected else -1)
+    assert bv.rfind(pat, *bounds) == (expected[-1] if expected else -1)
+    assert (pat in bv) == (pattern in bits)
+
+
+@pytest.mark.parametrize(
+    "method_name", ["find", "rfind", "find_all", "count_occurrences"]
+)
+def test_find_raises_error(method_name: str) -> None:
+    """Verifies the search methods reject a pattern that is not a BitVector.
+
+    Args:
+        method_name: The search method name.
+    """
+    bv = BitVector.BitVector(bitstring="0110")
+    with pytest.raises(TypeError, match="pattern must be a BitVector"):
+        getattr(bv, method_name)("01")
+
+
 def test_rank_of_bit_set_at_index_raises_error() -> None:
     """Verifies rank query on an unset bit raises ValueError."""
     bv = BitVector.BitVector(bitstring="01010101011100")
@@ -476,6 +683,112 @@ def test_rank_of_bit_set_at_index() -> None:
     """Tests calculating the rank (number of preceding 1 bits) of a set bit."""
     bv = BitVector.BitVector(bitstring="01010101011100")
     assert bv.rank_of_bit_set_at_index(10) == 6
+    assert bv.rank_of_bit_set_at_index(-4) == 6
+
+
+@pytest.mark.parametrize("nbits", [0, 1, 511, 512, 513, 4096, 5000])
+def test_rank_select(nbits: int) -> None:
+    """Tests rank and select queries against a direct scan of the bits.
+
+    Args:
+        nbits: The number of bits in the vector.
+    """
+    bits = "".join("1" if (i * i) % 13 < 5 else "0" for i in range(nbits))
+    bv = ~BitVector.BitVector(bitstring=bits)
+    inverted = bits.translate(str.maketrans("01", "10"))
+    ones = [i for i, b in enumerate(inverted) if b == "1"]
+    zeros = [i for i, b in enumerate(inverted) if b == "0"]
+    assert [bv.rank1(i) for i in range(nbits + 1)] == [
+        inverted[:i].count("1") for i in range(nbits + 1)
+    ]
+    assert bv.rank0(nbits) == len(zeros)
+    assert [bv.select1(k) for k in range(len(ones))] == ones
+    assert [bv.select0(k) for k in range(len(zeros))] == zeros
+
+
+@pytest.mark.parametrize(
+    ("method_name", "arg"),
+    [
+        ("rank1", -1),
+        ("rank0", 11),
+        ("select1", 4),
+        ("select1", -1),
+        ("select0", 6),
+    ],
+)
+def test_rank_select_raises_error(method_name: str, arg: int) -> None:
+    """Verifies out-of-range rank and select queries raise ValueError.
+
+    Args:
+        method_name: The query method name.
+        arg: The out-of-range position or rank.
+    """
+    bv = BitVector.BitVector(bitstring="1001001001")
+    with pytest.raises(ValueError, match="out of range|index range error"):
+        getattr(bv, method_name)(arg)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda bv: bv.__setitem__(3, 1),
+        lambda bv: bv.__setitem__(slice(0, 64), 1),
+        lambda bv: bv.__ixor__(BitVector.BitVector(bitstring="1" * 100)),
+        lambda bv: bv.__iadd__(BitVector.BitVector(bitstring="111")),
+        lambda bv: bv.__ilshift__(7),
+        lambda bv: bv.circular_rot_left(),
+        lambda bv: bv.circular_rot_right(),
+        lambda bv: bv.circular_rotate_right_by_one(),
+        lambda bv: bv.shift_right(5),
+        lambda bv: bv.pad_from_left(70),
+        lambda bv: bv.pad_from_right(70),
+        lambda bv: bv.reset(1),
+        lambda bv: bv.set_value(bitstring="0110"),
+    ],
+)
+def test_rank_index_invalidated(mutate: Any) -> None:
+    """Tests that every mutating method drops a previously built rank index.
+
+    Args:
+        mutate: A callable that changes the vector in place.
+    """
+    bv = BitVector.BitVector(bitstring="0000100100" * 10)
+    assert bv.rank1(len(bv)) == 20
+    mutate(bv)
+    expected = str(bv).count("1")
+    assert bv.rank1(len(bv)) == expected
+    assert bv.select1(expected - 1) == str(bv).rindex("1")
+
+
+def test_rank_index_not_cached_while_exported() -> None:
+    """Tests that writes through an exported view are seen by rank queries."""
+    bv = BitVector.BitVector(size=128)
+    with memoryview(bv) as view:
+        assert bv.rank1(128) == 0
+        view[1] = 1
+        assert bv.rank1(128) == 1
+        assert bv.select1(0) == 64
+
+
+def test_rank_index_dropped_by_export() -> None:
+    """Tests that a directory built before an export is not used after writes."""
+    bv = BitVector.BitVector(size=128)
+    assert bv.rank1(128) == 0
+    with memoryview(bv) as view:
+        view[0] = 0xFF
+        assert bv.rank1(128) == 8
+    assert bv.rank1(128) == bv.count_bits() == 8
+    assert bv.select1(0) == 0
+
+
+def test_rank_index_not_cached_for_shared_buffer() -> None:
+    """Tests that rank queries see direct writes to a shared buffer."""
+    backing = bytearray(16)
+    bv = BitVector.BitVector.frombuffer(backing, bit_order="lsb", share=True)
+    assert bv.rank1(128) == 0
+    backing[8] = 0x03
+    assert bv.rank1(128) == 2
+    assert bv.select1(1) == 65
 
 
 @pytest.mark.parametrize(
@@ -521,6 +834,33 @@ def test_reverse(bitstring: str, expected: str) -> None:
         else BitVector.BitVector(size=0)
     )
     assert str(bv.reverse()) == expected
+    assert str(bv.reverse_inplace()) == expected
+    assert str(bv) == expected
+
+
+@pytest.mark.parametrize("nbits", [1, 7, 8, 9, 63, 64, 65, 200])
+def test_reverse_word_boundaries(nbits: int) -> None:
+    """Tests reversal across byte and word boundaries with dirty tail bits.
+
+    Args:
+        nbits: The number of bits in the vector.
+    """
+    bits = "".join("1" if (i * i) % 5 < 2 else "0" for i in range(nbits))
+    bv = ~BitVector.BitVector(bitstring=bits.translate(str.maketrans("01", "10")))
+    assert str(bv.reverse()) == bits[::-1]
+    with memoryview(bv) as view:
+        assert bv.reverse_inplace() is bv
+        assert str(bv) == bits[::-1]
+        assert view[0] == bv.vector[0]
+
+
+def test_reverse_inplace_over_allocated() -> None:
+    """Verifies reverse_inplace replaces storage with excess words by exact words."""
+    bv = BitVector.BitVector(bitstring="110")
+    bv.vector.append(999)
+    bv.reverse_inplace()
+    assert str(bv) == "011"
+    assert list(bv.vector) == [6]
 
 
 def test_gcd() -> None:
@@ -556,6 +896,43 @@ def test_gf_multiply() -> None:
     assert int(c_zero) == 0
 
 
+@pytest.mark.parametrize(
+    ("len_a", "len_b"), [(1, 1), (0, 3), (7, 40), (64, 64), (300, 129)]
+)
+@pytest.mark.parametrize("window_bits", [8, 1 << 20])
+@pytest.mark.parametrize("karatsuba_bits", [16, 1 << 20])
+def test_gf_multiply_matches_shift_xor(
+    len_a: int, len_b: int, window_bits: int, karatsuba_bits: int, monkeypatch: Any
+) -> None:
+    """Tests the windowed and Karatsuba carry-less products against shift-and-XOR.
+
+    Args:
+        len_a: The number of bits in the first operand.
+        len_b: The number of bits in the second operand.
+        window_bits: The threshold for 32-bit steps, forcing each path.
+        karatsuba_bits: The threshold for Karatsuba splitting.
+        monkeypatch: The pytest fixture used to shrink the thresholds.
+    """
+    module = sys.modules["BitVector.BitVector"]
+    monkeypatch.setattr(module, "_CLMUL_WIDE_WINDOW_BITS", window_bits)
+    monkeypatch.setattr(module, "_CLMUL_KARATSUBA_BITS", karatsuba_bits)
+    monkeypatch.setattr(module, "_CLMUL_CHUNK_DIGITS", 8)
+    a_bits = "".join("1" if (i * i) % 7 < 3 else "0" for i in range(len_a))
+    b_bits = "".join("1" if (i * 5) % 9 < 4 else "0" for i in range(len_b))
+    a = BitVector.BitVector(bitstring=a_bits) if len_a else BitVector.BitVector(size=0)
+    b = BitVector.BitVector(bitstring=b_bits) if len_b else BitVector.BitVector(size=0)
+    x, y, expected = int(a), int(b), 0
+    while y:
+        if y & 1:
+            expected ^= x
+        x <<= 1
+        y >>= 1
+    product = a.gf_multiply(b)
+    assert len(product) == len_a + len_b
+    assert int(product) == expected
+    assert int(b.gf_multiply(a)) == expected
+
+
 def test_gf_divide_by_modulus() -> None:
     """Tests polynomial division by modulus over GF(2^n) and error checking."""
     mod = BitVector.BitVector(bitstring="100011011")  # AES modulus
@@ -580,6 +957,51 @@ def test_gf_divide_by_modulus() -> None:
     assert int(r_zero) == 0
 
 
+@pytest.mark.parametrize(
+    ("num", "mod", "n", "expected_q", "expected_r"),
+    [
+        ("1011011", "1011", 3, "0001000", "011"),
+        ("0000101", "011", 2, "0000011", "00"),
+        ("1101", "0111", 3, "0010", "011"),
+        ("101", "00", 2, "001", "01"),
+        ("1", "1101", 3, "0", "1"),
+        ("10", "1", 0, "10", ""),
+    ],
+)
+def test_gf_divide_by_modulus_edge_cases(
+    num: str, mod: str, n: int, expected_q: str, expected_r: str
+) -> None:
+    """Tests division with leading-zero, zero and degree-0 moduli.
+
+    Args:
+        num: The dividend bit string.
+        mod: The modulus bit string.
+        n: The field degree.
+        expected_q: The expected quotient bit string.
+        expected_r: The expected remainder bit string.
+    """
+    quotient, remainder = BitVector.BitVector(bitstring=num).gf_divide_by_modulus(
+        BitVector.BitVector(bitstring=mod), n
+    )
+    assert str(quotient) == expected_q
+    assert str(remainder) == expected_r
+
+
+def test_gf_divide_by_modulus_large() -> None:
+    """Tests division by the NIST B-571 polynomial against multiplication."""
+    mod = BitVector.BitVector(intVal=(1 << 571) | (1 << 10) | (1 << 5) | (1 << 2) | 1)
+    q = (1 << 570) | 0x0123456789ABCDEF
+    r = (1 << 569) | 0xFEDCBA9876543210
+    num = mod.gf_multiply(BitVector.BitVector(intVal=q)) ^ BitVector.BitVector(
+        intVal=r, size=len(mod) + 571
+    )
+    quotient, remainder = num.gf_divide_by_modulus(mod, 571)
+    assert int(quotient) == q
+    assert len(quotient) == len(num)
+    assert int(remainder) == r
+    assert len(remainder) == 571
+
+
 def test_gf_multiply_modular() -> None:
     """Tests modular polynomial multiplication over GF(2^8)."""
     mod = BitVector.BitVector(bitstring="100011011")  # AES modulus
@@ -605,6 +1027,56 @@ def test_gf_mi() -> None:
     assert res_no_mi == "NO MI. However, the GCD of 0010 and 1010 is 010"
 
 
+@pytest.mark.parametrize(
+    ("mod", "n", "values"),
+    [
+        ("100011011", 8, range(1, 256)),
+        ("1011", 3, [5, 1, 7, 13]),
+        ("1010", 3, [3, 2, 5]),
+        ("100011011", 8, [7, 0, 9]),
+        ("011", 2, [1, 3]),
+        ("100011011", 8, []),
+    ],
+)
+def test_gf_mi_batch(mod: str, n: int, values: Any) -> None:
+    """Tests batch inversion against gf_MI, including elements without inverses.
+
+    Args:
+        mod: The modulus bit string.
+        n: The field degree.
+        values: The element values.
+    """
+    modulus = BitVector.BitVector(bitstring=mod)
+    elements = [BitVector.BitVector(intVal=v, size=n + 1) for v in values]
+    inverses = BitVector.BitVector.gf_MI_batch(elements, modulus, n)
+    assert isinstance(inverses, list)
+    assert [str(x) for x in inverses] == [str(e.gf_MI(modulus, n)) for e in elements]
+
+
+def test_gf_mi_batch_table() -> None:
+    """Tests the inverse table of GF(2^8) and table mode errors."""
+    mod = BitVector.BitVector(bitstring="100011011")
+    table = BitVector.BitVector.gf_MI_batch(None, mod, 8, table=True)
+    assert isinstance(table, array.array)
+    assert len(table) == 256
+    assert table[0] == 0
+    assert table[0x53] == 0xCA
+    for a in range(1, 256):
+        assert table[a] == int(BitVector.BitVector(intVal=a, size=8).gf_MI(mod, 8))
+    with pytest.raises(ValueError, match="elements must be None"):
+        BitVector.BitVector.gf_MI_batch([mod], mod, 8, table=True)
+    with pytest.raises(ValueError, match="table mode needs"):
+        BitVector.BitVector.gf_MI_batch(
+            None, BitVector.BitVector(intVal=3), 17, table=True
+        )
+    with pytest.raises(ValueError, match="not irreducible"):
+        BitVector.BitVector.gf_MI_batch(
+            None, BitVector.BitVector(bitstring="100010001"), 8, table=True
+        )
+    with pytest.raises(ValueError, match="elements are required"):
+        BitVector.BitVector.gf_MI_batch(None, mod, 8)
+
+
 @pytest.mark.parametrize(
     ("bitstring", "bitlist", "expected"),
     [
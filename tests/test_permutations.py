@@ -1,5 +1,6 @@
 """Tests for bit permutation and unpermutation operations on BitVector."""
 
+import sys
 from typing import Literal
 
 import pytest
@@ -82,3 +83,66 @@ def test_unpermute_bad_size_raises_error(bv1: BitVector.BitVector) -> None:
     """
     with pytest.raises(ValueError, match="Bad size for permute list"):
         _ = bv1.unpermute([0, 1, 2])
+
+
+_DES_EXPANSION = [31, 0, 1, 2, 3, 4, 3, 4, 5, 6, 7, 8, 7, 8, 9, 10, 11, 12, 11, 12]
+_DES_EXPANSION += [13, 14, 15, 16, 15, 16, 17, 18, 19, 20, 19, 20, 21, 22, 23, 24]
+_DES_EXPANSION += [23, 24, 25, 26, 27, 28, 27, 28, 29, 30, 31, 0]
+
+
+@pytest.mark.parametrize("shifts_per_word", [0, 16, 1 << 20])
+@pytest.mark.parametrize(
+    "perm_list",
+    [
+        [],
+        [5],
+        list(range(32)),
+        [(i * 7) % 32 for i in range(32)],
+        [(i * 37) % 200 for i in range(200)],
+        [192 - (i & ~7) + (i & 7) for i in range(200)],
+        _DES_EXPANSION,
+        [0, 0, 3, 3] * 8,
+    ],
+)
+def test_permutation_plan(
+    perm_list: list[int], shifts_per_word: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tests compiled plans against direct per-bit permute and unpermute.
+
+    Args:
+        perm_list: The permutation list to compile.
+        shifts_per_word: The displacement limits, forcing each strategy.
+        monkeypatch: The pytest fixture used to set the displacement limits.
+    """
+    module = sys.modules["BitVector.BitVector"]
+    monkeypatch.setattr(module, "_PLAN_SHIFTS_PER_WORD", shifts_per_word)
+    monkeypatch.setattr(module, "_PLAN_MAX_SHIFTS", shifts_per_word)
+    bits = [1 if (i * i) % 11 < 5 else 0 for i in range(200)]
+    bv = ~BitVector.BitVector(bitlist=[1 - b for b in bits])
+    plan = BitVector.PermutationPlan(perm_list)
+    assert plan.size == len(perm_list)
+    assert plan.max_index == max(perm_list, default=-1)
+    expected = [bits[i] for i in perm_list]
+    assert [*bv.permute(plan)] == expected
+    assert bv.permute(plan) == bv.permute(perm_list)
+
+    if plan.max_index < len(perm_list):
+        source = BitVector.BitVector(bitlist=bits[: len(perm_list)])
+        restored = [0] * len(perm_list)
+        for i, idx in enumerate(perm_list):
+            restored[idx] |= source[i]
+        for _ in range(2):
+            assert [*source.unpermute(plan)] == restored
+
+
+def test_permute_negative_indices() -> None:
+    """Tests that raw lists accept negative indices counting from the end."""
+    bv = BitVector.BitVector(bitstring="1100")
+    assert str(bv.permute([-1, -4, 1])) == "011"
+    assert str(bv.unpermute([-1, 0, 1, 2])) == "1001"
+    with pytest.raises(ValueError, match="index range error"):
+        bv.permute([0, -5])
+    with pytest.raises(ValueError, match="Bad permutation index"):
+        BitVector.PermutationPlan([0, -1])
+    with pytest.raises(ValueError, match="Bad permutation index"):
+        bv.permute(BitVector.PermutationPlan([4]))
@@ -1,6 +1,9 @@
 """Tests file and stream I/O methods (read_bits, write_to_file, close)."""
 
 import io
+import pathlib
+import sys
+from typing import Any
 
 import pytest
 
@@ -15,6 +18,63 @@ def test_write_bits_to_stream_object() -> None:
     assert fp.getvalue() == "101100101"
 
 
+class _RecordingStream(io.StringIO):
+    """Text stream that records the length of every write() call."""
+
+    def __init__(self) -> None:
+        """Initializes an empty stream with no recorded writes."""
+        super().__init__()
+        self.writes: list[int] = []
+
+    def write(self, s: str) -> int:
+        """Records the write length before writing.
+
+        Args:
+            s: The text to write.
+
+        Returns:
+            The number of characters written.
+        """
+        self.writes.append(len(s))
+        return super().write(s)
+
+
+@pytest.mark.parametrize(
+    ("nbits", "chunk_size", "expected_writes"),
+    [
+        (0, 64, []),
+        (1000, 64, [64] * 15 + [40]),
+        (1000, 200, [192] * 5 + [40]),
+        (1000, 1, [64] * 15 + [40]),
+        (1000, 1 << 20, [1000]),
+    ],
+)
+def test_write_bits_to_stream_object_chunked(
+    nbits: int, chunk_size: int, expected_writes: list[int]
+) -> None:
+    """Tests that bits are written in chunks of whole 64-bit words.
+
+    Args:
+        nbits: The number of bits in the vector.
+        chunk_size: The requested number of characters per write.
+        expected_writes: The expected length of each write call.
+    """
+    bits = "".join("1" if (i * 3) % 5 < 2 else "0" for i in range(nbits))
+    bv = ~BitVector.BitVector(bitstring=bits)
+    fp = _RecordingStream()
+    bv.write_bits_to_stream_object(fp, chunk_size=chunk_size)
+    assert fp.writes == expected_writes
+    assert fp.getvalue() == bits.translate(str.maketrans("01", "10"))
+    assert str(bv) == fp.getvalue()
+
+
+def test_write_bits_to_stream_object_raises_error() -> None:
+    """Verifies a non-positive chunk size raises ValueError."""
+    bv = BitVector.BitVector(bitstring="101")
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        bv.write_bits_to_stream_object(io.StringIO(), chunk_size=0)
+
+
 def test_write_to_file_raises_error() -> None:
     """Verifies writing a vector not a multiple of 8 bits raises ValueError."""
     bv = BitVector.BitVector(bitstring="10101")
@@ -33,3 +93,114 @@ def test_write_to_file() -> None:
 
     bv.write_to_file(out_stream)
     assert out_stream.getvalue() == b"ABAB"
+
+
+class _UnseekableReader(io.RawIOBase):
+    """Binary stream that can only be read forward, like a pipe."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initializes the stream over a fixed byte string.
+
+        Args:
+            data: The bytes the stream yields.
+        """
+        super().__init__()
+        self._source = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        """Reports that the stream supports reading.
+
+        Returns:
+            Always True.
+        """
+        return True
+
+    def readinto(self, b: Any) -> int:
+        """Reads at most 3 bytes at a time into b.
+
+        Args:
+            b: The writable buffer to fill.
+
+        Returns:
+            The number of bytes read.
+        """
+        return self._source.readinto(memoryview(b)[:3])
+
+
+def test_write_to_file_chunked(monkeypatch: Any) -> None:
+    """Tests that large vectors are written as several packed chunks."""
+    monkeypatch.setattr(sys.modules["BitVector.BitVector"], "_CHUNK_BYTES", 16)
+    data = bytes((i * 37 + 11) % 256 for i in range(100))
+    out_stream = io.BytesIO()
+    BitVector.BitVector(rawbytes=data).write_to_file(out_stream)
+    assert out_stream.getvalue() == data
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, "0100000101000010"),
+        ({"nbits": 12}, "010000010100"),
+        ({"nbits": 0}, ""),
+        ({"offset": 1}, "01000010"),
+        ({"offset": 1, "nbits": 3}, "010"),
+    ],
+)
+def test_fromfile(kwargs: dict[str, Any], expected: str) -> None:
+    """Tests reading bits from a binary stream in the write_to_file layout.
+
+    Args:
+        kwargs: Extra keyword arguments for fromfile.
+        expected: Expected bitstring representation.
+    """
+    bv = BitVector.BitVector.fromfile(io.BytesIO(b"AB"), **kwargs)
+    assert str(bv) == expected
+
+
+def test_fromfile_round_trip(tmp_path: pathlib.Path, monkeypatch: Any) -> None:
+    """Tests a save/load round trip through a file on disk."""
+    monkeypatch.setattr(sys.modules["BitVector.BitVector"], "_CHUNK_BYTES", 16)
+    data = bytes((i * 37 + 11) % 256 for i in range(1000))
+    bv = BitVector.BitVector(rawbytes=data)
+    path = tmp_path / "bits.bin"
+    with path.open("wb") as file_out:
+        file_out.write(b"header")
+        bv.write_to_file(file_out)
+    with path.open("rb") as file_in:
+        loaded = BitVector.BitVector.fromfile(file_in, offset=6)
+    assert loaded == bv
+    with path.open("rb") as file_in:
+        file_in.seek(6)
+        head = BitVector.BitVector.fromfile(file_in, nbits=8 * 500 - 5)
+        tail = BitVector.BitVector.fromfile(file_in)
+    assert head == bv[: 8 * 500 - 5]
+    assert tail == bv[8 * 500 :]
+
+
+def test_fromfile_unseekable_stream() -> None:
+    """Tests reading from a stream that returns short reads and cannot seek."""
+    data = bytes(range(20))
+    bv = BitVector.BitVector.fromfile(_UnseekableReader(data), nbits=150)
+    assert bv == BitVector.BitVector(rawbytes=data)[:150]
+    assert BitVector.BitVector.fromfile(_UnseekableReader(data)) == (
+        BitVector.BitVector(rawbytes=data)
+    )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "err_match"),
+    [
+        ({"nbits": 17}, "nbits exceeds"),
+        ({"nbits": 9, "offset": 1}, "nbits exceeds"),
+        ({"nbits": -1}, "nbits must be nonnegative"),
+    ],
+)
+def test_fromfile_raises_error(kwargs: dict[str, Any], err_match: str) -> None:
+    """Verifies reading past the end of the data raises ValueError.
+
+    Args:
+        kwargs: Invalid keyword arguments for fromfile.
+        err_match: The expected error message substring.
+    """
+    with pytest.raises(ValueError, match=err_match):
+        BitVector.BitVector.fromfile(io.BytesIO(b"AB"), **kwargs)
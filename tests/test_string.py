@@ -31,6 +31,34 @@ def test_get_bitvector_in_ascii_from_string() -> None:
     assert bv.get_bitvector_in_ascii() == "hello"
 
 
+@pytest.mark.parametrize("nbytes", [1, 7, 8, 9, 100])
+def test_hex_and_ascii_round_trip(nbytes: int) -> None:
+    """Tests hex and ASCII output against the packed bytes across word boundaries.
+
+    Args:
+        nbytes: The number of bytes in the vector.
+    """
+    data = bytes((i * 37 + 11) % 256 for i in range(nbytes))
+    bv = BitVector.BitVector(rawbytes=data)
+    assert bv.get_bitvector_in_hex() == data.hex()
+    assert bv.get_bitvector_in_ascii() == data.decode("latin-1")
+    assert BitVector.BitVector.from_string(data.decode("latin-1")) == bv
+    assert BitVector.BitVector(hexstring=data.hex()[:-1]) == bv[: 8 * nbytes - 4]
+    assert bv[: 8 * nbytes - 4].get_bitvector_in_hex() == data.hex()[:-1]
+
+
+def test_hex_ignores_bits_past_the_end() -> None:
+    """Tests that dirty bits past the end of the vector are not rendered."""
+    bv = ~BitVector.BitVector(size=12)
+    assert bv.get_bitvector_in_hex() == "fff"
+
+
+def test_from_string_raises_error() -> None:
+    """Verifies characters that do not fit in one byte are rejected."""
+    with pytest.raises(UnicodeEncodeError):
+        BitVector.BitVector.from_string("\u0101")
+
+
 @pytest.mark.parametrize("bitstring", ["1", "101", "10101", "1010101"])
 def test_get_bitvector_in_ascii_invalid_length_raises_error(bitstring: str) -> None:
     """Verifies that non-multiple-of-8 lengths raise ValueError in ASCII export.